@@ -1,9 +1,16 @@
+from typing import Dict, List, Optional
+
 from pydantic import BaseModel
 
 
 __all__ = [
     "BaseErrorRSchema",
     "BaseMessageRSchema",
+    "MetricsRSchema",
+    "MemoryStatRSchema",
+    "MemorySnapshotRSchema",
+    "MemoryStatsRSchema",
+    "ObjectCountsRSchema",
 ]
 
 
@@ -23,3 +30,64 @@ class BaseMessageRSchema(BaseModel):
         message: Success or informational message content.
     """
     message: str
+
+
+class MetricsRSchema(BaseModel):
+    """Response schema for operational metrics.
+
+    Attributes:
+        metrics: Metric values by name (per worker process).
+    """
+    metrics: Dict[str, float]
+
+
+class MemoryStatRSchema(BaseModel):
+    """Response schema for memory allocated at one site.
+
+    Attributes:
+        location: Module name or 'file:line' of the allocation site.
+        size: Size of live memory blocks in bytes.
+        count: Number of live memory blocks.
+        size_diff: Size change since the base snapshot in bytes (0 if not compared).
+        count_diff: Block count change since the base snapshot (0 if not compared).
+    """
+    location: str
+    size: int
+    count: int
+    size_diff: int = 0
+    count_diff: int = 0
+
+
+class MemorySnapshotRSchema(BaseModel):
+    """Response schema for memory tracing state.
+
+    Attributes:
+        tracing: Whether allocations are being traced.
+        traced_size: Current size of traced memory blocks in bytes.
+        traced_peak_size: Peak size of traced memory blocks in bytes.
+        snapshots: Creation timestamps of kept snapshots by ID.
+        snapshot_id: ID of the snapshot taken by the request (if any).
+    """
+    tracing: bool
+    traced_size: int
+    traced_peak_size: int
+    snapshots: Dict[int, float]
+    snapshot_id: Optional[int] = None
+
+
+class MemoryStatsRSchema(BaseModel):
+    """Response schema for memory allocation sites.
+
+    Attributes:
+        stats: Allocation sites ordered by size (or size change for diffs).
+    """
+    stats: List[MemoryStatRSchema]
+
+
+class ObjectCountsRSchema(BaseModel):
+    """Response schema for live object counts.
+
+    Attributes:
+        counts: Number of live instances by class name (per worker process).
+    """
+    counts: Dict[str, int]
@@ -2,7 +2,10 @@ from fastapi import Request
 from fastapi.responses import JSONResponse, Response
 from pydantic import ValidationError
 
-from app.exceptions import NotFoundException, BadRequestException, BadGatewayException
+from app.exceptions import (
+    NotFoundException, ForbiddenException, BadRequestException, BadGatewayException, ServiceUnavailableException,
+    TooManyRequestsException, DeadlineExceededException
+)
 from app.utils.pydantic import parse_validation_error
 
 
@@ -32,6 +35,19 @@ async def not_found_exception_handler(request: Request, exc: NotFoundException)
     )
 
 
+async def forbidden_exception_handler(request: Request, exc: ForbiddenException) -> Response:
+    """
+    Handle access denied errors.
+
+    Returns:
+        Response: JSON response with 403 status and error message.
+    """
+    return JSONResponse(
+        status_code=403,
+        content={"detail": str(exc)}
+    )
+
+
 async def bad_request_exception_handler(request: Request, exc: BadRequestException | ValueError) -> Response:
     """
     Handle bad request and value errors.
@@ -58,6 +74,48 @@ async def bad_gateway_exception_handler(request: Request, exc: BadGatewayExcepti
     )
 
 
+async def service_unavailable_exception_handler(request: Request, exc: ServiceUnavailableException) -> Response:
+    """
+    Handle shed requests.
+
+    Returns:
+        Response: JSON response with 503 status, error message and Retry-After header.
+    """
+    headers = {"Retry-After": str(exc.retry_after)} if exc.retry_after is not None else None
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers=headers
+    )
+
+
+async def too_many_requests_exception_handler(request: Request, exc: TooManyRequestsException) -> Response:
+    """
+    Handle rate limit errors.
+
+    Returns:
+        Response: JSON response with 429 status, error message and rate limit headers.
+    """
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers=exc.headers
+    )
+
+
+async def deadline_exceeded_exception_handler(request: Request, exc: DeadlineExceededException) -> Response:
+    """
+    Handle requests not answered within their deadline.
+
+    Returns:
+        Response: JSON response with 504 status and error message.
+    """
+    return JSONResponse(
+        status_code=504,
+        content={"detail": str(exc)}
+    )
+
+
 async def unexcpected_code_error_exception_handler(request: Request, exc: Exception | TypeError) -> Response:
     """
     Handle unexpected server errors and type errors.
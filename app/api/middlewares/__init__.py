@@ -0,0 +1,2 @@
+from .compression import CompressionMiddleware
+from .rate_limit import RateLimitMiddleware
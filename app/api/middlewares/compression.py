@@ -0,0 +1,71 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.http import compress_content, select_encoding
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware for negotiated response compression (zstd, br, gzip).
+
+    Compresses complete (non-streaming) responses above a minimum size.
+    Responses that already carry a Content-Encoding (e.g. precompressed
+    cached payloads) and streaming responses are passed through unchanged.
+    """
+
+    compressible_content_types = ("application/json", "text/")
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    @staticmethod
+    def _varies_by_encoding(headers: MutableHeaders) -> bool:
+        """Check whether the response already declares Vary: Accept-Encoding."""
+        vary = {value.strip().lower() for value in headers.get("vary", "").split(",")}
+        return "accept-encoding" in vary or "*" in vary
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding"))
+        if not encoding:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message = {}
+
+        async def send_compressed(message: Message):
+            nonlocal start_message
+
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+
+            if message["type"] != "http.response.body" or not start_message:
+                await send(message)
+                return
+
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            is_compressible = (
+                not message.get("more_body", False)
+                and "content-encoding" not in headers
+                and len(body) >= self.minimum_size
+                and headers.get("content-type", "").startswith(self.compressible_content_types))
+
+            if is_compressible:
+                body = compress_content(body, encoding)
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                if not self._varies_by_encoding(headers):
+                    headers.add_vary_header("Accept-Encoding")
+                message = {**message, "body": body}
+
+            await send(start_message)
+            start_message = {}
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
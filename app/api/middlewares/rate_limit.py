@@ -0,0 +1,68 @@
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.infrastructure.cache import RedisRateLimiter
+from app.kernel.context import client_id_context
+from app.kernel.settings import rate_limit_settings
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware for per-client request rate limiting.
+
+    Clients are identified by API key (hashed, so keys are not stored in
+    Redis) or by IP address. Each limited request costs one Redis round
+    trip; clients already known to be over limit are rejected locally.
+    Responses carry RateLimit-Limit/Remaining/Reset headers, rejected
+    requests get 429 with Retry-After. The client identifier is exposed
+    via `client_id_context` for quotas checked deeper in the stack.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.rate_limiter = RedisRateLimiter(
+            key_prefix="rateLimitRequests",
+            limit=rate_limit_settings.requests_limit,
+            period=rate_limit_settings.period,
+            local_cache_size=rate_limit_settings.local_cache_size)
+
+    @staticmethod
+    def get_client_id(scope: Scope) -> str:
+        """Identify client by API key header or IP address."""
+        api_key = Headers(scope=scope).get(rate_limit_settings.api_key_header)
+        if api_key:
+            return f"key:{hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:32]}"
+
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not scope["path"].startswith(rate_limit_settings.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        client_id = self.get_client_id(scope)
+        result = await self.rate_limiter.hit(client_id)
+        if result and not result.allowed:
+            response = JSONResponse(
+                status_code=429,
+                content={"detail": "Rate limit exceeded"},
+                headers=result.get_headers())
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start" and result:
+                headers = MutableHeaders(raw=message["headers"])
+                for key, value in result.get_headers().items():
+                    headers.setdefault(key, value)
+            await send(message)
+
+        token = client_id_context.set(client_id)
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            client_id_context.reset(token)
@@ -1 +1,2 @@
 from .weather import *
+from .admin import *
@@ -0,0 +1,39 @@
+import secrets
+from typing import Optional
+
+from fastapi import Header
+
+from app.exceptions import NotFoundException, ForbiddenException
+from app.kernel.settings import app_settings
+
+__all__ = [
+    "verify_admin_token",
+    "verify_profiling_enabled",
+]
+
+
+def verify_admin_token(x_admin_token: Optional[str] = Header(default=None)):
+    """
+    Verify that the request is made by an administrator.
+
+    Args:
+        x_admin_token (Optional[str]): Token from the X-Admin-Token header.
+
+    Raises:
+        ForbiddenException: If the admin token is not configured or does not match.
+    """
+    if not app_settings.admin_token or x_admin_token is None:
+        raise ForbiddenException("Admin token required")
+    if not secrets.compare_digest(x_admin_token.encode(), app_settings.admin_token.encode()):
+        raise ForbiddenException("Invalid admin token")
+
+
+def verify_profiling_enabled():
+    """
+    Verify that on-demand profiling is enabled.
+
+    Raises:
+        NotFoundException: If profiling is disabled, so the endpoint is not exposed.
+    """
+    if not app_settings.profiling_enabled:
+        raise NotFoundException("Not Found")
@@ -1,8 +1,11 @@
-from app.domains.weather.schemas import FetchCityWeatherFiltersSchema
+from typing import Optional
+
+from app.domains.weather.schemas import FetchCityWeatherFiltersSchema, FetchNearbyWeatherFiltersSchema
 
 
 __all__ = [
     "validate_fetch_city_weather_filters",
+    "validate_fetch_nearby_weather_filters",
 ]
 
 
@@ -17,3 +20,23 @@ def validate_fetch_city_weather_filters(city: str) -> FetchCityWeatherFiltersSch
         FetchCityWeatherFiltersSchema: The validated data.
     """
     return FetchCityWeatherFiltersSchema(city=city)
+
+
+def validate_fetch_nearby_weather_filters(
+        lat: float, lon: float, radius: Optional[float] = None
+) -> FetchNearbyWeatherFiltersSchema:
+    """
+    Validate the nearby weather filters for fetching data.
+
+    Args:
+        lat (float): Latitude of the location.
+        lon (float): Longitude of the location.
+        radius (Optional[float]): Search radius in kilometers.
+
+    Returns:
+        FetchNearbyWeatherFiltersSchema: The validated data.
+    """
+    params = {"lat": lat, "lon": lon}
+    if radius is not None:
+        params["radius"] = radius
+    return FetchNearbyWeatherFiltersSchema(**params)
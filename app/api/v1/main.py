@@ -5,3 +5,5 @@ from . import routes
 api_router_v1 = APIRouter()
 # Include the AuthAPI router
 api_router_v1.include_router(routes.WeatherEndpointsAPI.collect_router())
+api_router_v1.include_router(routes.HealthEndpointsAPI.collect_router())
+api_router_v1.include_router(routes.AdminEndpointsAPI.collect_router())
@@ -1 +1,3 @@
 from .weather import WeatherEndpointsAPI
+from .health import HealthEndpointsAPI
+from .admin import AdminEndpointsAPI
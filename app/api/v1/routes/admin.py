@@ -0,0 +1,223 @@
+import asyncio
+import time
+from typing import Literal, Optional
+
+import httpx
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import PlainTextResponse, Response
+
+from app.api.base import (
+    BaseAPIRouteWrapper, BaseErrorRSchema, BaseMessageRSchema, MemorySnapshotRSchema, MemoryStatsRSchema,
+    MemoryStatRSchema, ObjectCountsRSchema
+)
+from app.api.v1.dependencies import verify_admin_token, verify_profiling_enabled
+from app.api.v1.tags import ADMIN_TAG
+from app.domains.weather.schemas import LocationWeatherSchema, CityFileInfoSchema
+from app.exceptions import BadRequestException, NotFoundException, ServiceUnavailableException
+from app.kernel.logs import logger
+from app.kernel.settings import app_settings
+from app.utils.profiling import (
+    MemoryGroupBy, MemoryProfiler, count_instances, profile_loop_calls, profile_loop_stacks
+)
+
+
+class AdminEndpointsAPI(BaseAPIRouteWrapper):
+    """
+    Admin API endpoints for diagnostics of the live process.
+
+    All endpoints require the X-Admin-Token header.
+    """
+    router = APIRouter(prefix="/admin", tags=[ADMIN_TAG], dependencies=[Depends(verify_admin_token)])
+
+    # one profiling run per worker at a time
+    _profiling_lock = asyncio.Lock()
+
+    # classes whose live instances are counted by the memory endpoints
+    _tracked_object_classes = (LocationWeatherSchema, CityFileInfoSchema, asyncio.Task, httpx.AsyncClient)
+
+    @staticmethod
+    def _get_memory_state(snapshot_id: Optional[int] = None) -> MemorySnapshotRSchema:
+        """Collect memory tracing state of the worker."""
+        traced_size, traced_peak_size = MemoryProfiler.get_traced_memory()
+        return MemorySnapshotRSchema(
+            tracing=MemoryProfiler.is_tracing(),
+            traced_size=traced_size,
+            traced_peak_size=traced_peak_size,
+            snapshots=MemoryProfiler.get_snapshot_ids(),
+            snapshot_id=snapshot_id)
+
+    @staticmethod
+    @router.get("/profile", dependencies=[Depends(verify_profiling_enabled)], response_class=PlainTextResponse,
+                responses={
+                    400: {"model": BaseErrorRSchema},
+                    403: {"model": BaseErrorRSchema},
+                    404: {"model": BaseErrorRSchema},
+                    503: {"model": BaseErrorRSchema},
+                })
+    async def get_profile(
+            duration: float = Query(default=10, gt=0, description="Profiling duration in seconds"),
+            output: Literal["collapsed", "pstats"] = Query(default="collapsed", alias="format"),
+            mode: Literal["wall", "cpu"] = Query(default="wall"),
+    ):
+        """
+        Profile the worker process serving the request for a period of time.
+
+        The 'collapsed' format samples the event loop thread stacks from a timer
+        signal (low overhead, coroutine frames included) and returns collapsed stacks
+        for flamegraph tools. In 'wall' mode samples are taken by real time and the
+        time the loop waits for I/O is reported as '<idle>', in 'cpu' mode samples
+        are taken by process CPU time. The 'pstats' format traces every call on the loop thread
+        with cProfile (higher overhead) and returns a pstats file.
+
+        Returns:
+            Response: Collapsed stacks text or pstats file.
+        """
+        if duration > app_settings.profiling_max_duration:
+            raise BadRequestException(
+                f"Profiling duration must not exceed {app_settings.profiling_max_duration} seconds")
+        if AdminEndpointsAPI._profiling_lock.locked():
+            raise ServiceUnavailableException("Profiling already in progress", retry_after=int(duration) + 1)
+
+        async with AdminEndpointsAPI._profiling_lock:
+            logger.info(f"Profiling started. Duration: {duration}s. Format: {output}. Mode: {mode}")
+            cpu_started = time.process_time()
+
+            if output == "pstats":
+                content = await profile_loop_calls(duration)
+                cpu_time = time.process_time() - cpu_started
+                return Response(
+                    content=content,
+                    media_type="application/octet-stream",
+                    headers={
+                        "Content-Disposition": f'attachment; filename="profile-{int(time.time())}.pstats"',
+                        "X-Profile-CPU-Seconds": f"{cpu_time:.3f}",
+                    })
+
+            try:
+                sampler = await profile_loop_stacks(
+                    duration, app_settings.profiling_sample_interval_ms / 1000, mode=mode)
+            except RuntimeError as e:
+                raise ServiceUnavailableException(str(e))
+            cpu_time = time.process_time() - cpu_started
+            logger.info(f"Profiling finished. Samples: {sampler.total_samples}. Idle: {sampler.idle_samples}")
+            return PlainTextResponse(
+                content=sampler.to_collapsed(include_idle=mode == "wall"),
+                headers={
+                    "X-Profile-Samples": str(sampler.total_samples),
+                    "X-Profile-Idle-Samples": str(sampler.idle_samples),
+                    "X-Profile-CPU-Seconds": f"{cpu_time:.3f}",
+                })
+
+    @staticmethod
+    @router.get("/memory", dependencies=[Depends(verify_profiling_enabled)], response_model=MemorySnapshotRSchema)
+    async def get_memory_state():
+        """
+        Report memory tracing state of the worker process serving the request.
+
+        Returns:
+            MemorySnapshotRSchema: Tracing state, traced memory and kept snapshots.
+        """
+        return AdminEndpointsAPI._get_memory_state()
+
+    @staticmethod
+    @router.post("/memory/start", dependencies=[Depends(verify_profiling_enabled)],
+                 response_model=MemorySnapshotRSchema)
+    async def start_memory_tracing(
+            frames: int = Query(default=1, ge=1, le=64, description="Stack frames stored per allocation"),
+    ):
+        """
+        Start tracing memory allocations of the worker process serving the request.
+
+        Tracing slows down allocations and uses additional memory until it is stopped.
+
+        Returns:
+            MemorySnapshotRSchema: Tracing state.
+        """
+        MemoryProfiler.start(frames)
+        logger.info(f"Memory tracing started. Frames: {frames}")
+        return AdminEndpointsAPI._get_memory_state()
+
+    @staticmethod
+    @router.post("/memory/stop", dependencies=[Depends(verify_profiling_enabled)], response_model=BaseMessageRSchema)
+    async def stop_memory_tracing():
+        """
+        Stop tracing memory allocations and drop all snapshots.
+
+        Returns:
+            BaseMessageRSchema: Status message.
+        """
+        MemoryProfiler.stop()
+        logger.info("Memory tracing stopped")
+        return BaseMessageRSchema(message="Memory tracing stopped")
+
+    @staticmethod
+    @router.post("/memory/snapshots", dependencies=[Depends(verify_profiling_enabled)],
+                 response_model=MemorySnapshotRSchema, responses={400: {"model": BaseErrorRSchema}})
+    async def take_memory_snapshot():
+        """
+        Take snapshot of memory allocations traced since tracing was started.
+
+        Returns:
+            MemorySnapshotRSchema: Tracing state with ID of the new snapshot.
+        """
+        try:
+            snapshot_id = MemoryProfiler.take_snapshot(app_settings.profiling_max_snapshots)
+        except RuntimeError as e:
+            raise BadRequestException(str(e))
+        return AdminEndpointsAPI._get_memory_state(snapshot_id)
+
+    @staticmethod
+    @router.get("/memory/top", dependencies=[Depends(verify_profiling_enabled)], response_model=MemoryStatsRSchema,
+                responses={404: {"model": BaseErrorRSchema}})
+    async def get_memory_top(
+            snapshot_id: Optional[int] = Query(default=None, description="Snapshot ID (latest if not set)"),
+            group_by: MemoryGroupBy = Query(default="module"),
+            limit: int = Query(default=20, ge=1, le=500),
+    ):
+        """
+        Report allocation sites holding the most memory in a snapshot.
+
+        Returns:
+            MemoryStatsRSchema: Allocation sites, largest first.
+        """
+        try:
+            stats = MemoryProfiler.get_top(snapshot_id, group_by, limit)
+        except KeyError as e:
+            raise NotFoundException(e.args[0])
+        return MemoryStatsRSchema(stats=[MemoryStatRSchema(**stat) for stat in stats])
+
+    @staticmethod
+    @router.get("/memory/diff", dependencies=[Depends(verify_profiling_enabled)], response_model=MemoryStatsRSchema,
+                responses={404: {"model": BaseErrorRSchema}})
+    async def get_memory_diff(
+            base_snapshot_id: int = Query(description="ID of the earlier snapshot"),
+            snapshot_id: Optional[int] = Query(default=None, description="ID of the later snapshot (latest if not set)"),
+            group_by: MemoryGroupBy = Query(default="module"),
+            limit: int = Query(default=20, ge=1, le=500),
+    ):
+        """
+        Report allocation sites that grew or shrank the most between two snapshots.
+
+        Returns:
+            MemoryStatsRSchema: Allocation sites, largest absolute size change first.
+        """
+        try:
+            stats = MemoryProfiler.compare(base_snapshot_id, snapshot_id, group_by, limit)
+        except KeyError as e:
+            raise NotFoundException(e.args[0])
+        return MemoryStatsRSchema(stats=[MemoryStatRSchema(**stat) for stat in stats])
+
+    @staticmethod
+    @router.get("/memory/objects", dependencies=[Depends(verify_profiling_enabled)],
+                response_model=ObjectCountsRSchema)
+    async def get_object_counts():
+        """
+        Report live instances of weather schemas, asyncio tasks and HTTP clients.
+
+        Does not require memory tracing. Walks the whole heap, so it blocks the worker
+        for a time proportional to the number of live objects.
+
+        Returns:
+            ObjectCountsRSchema: Instance counts by class name.
+        """
+        return ObjectCountsRSchema(counts=count_instances(AdminEndpointsAPI._tracked_object_classes))
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from app.api.base import BaseAPIRouteWrapper, BaseErrorRSchema, BaseMessageRSchema, MetricsRSchema
+from app.api.v1.dependencies import verify_admin_token
+from app.api.v1.tags import HEALTH_TAG
+from app.domains.weather import WeatherCacheWarmupService
+from app.kernel.metrics import metrics
+
+
+class HealthEndpointsAPI(BaseAPIRouteWrapper):
+    """
+    Health API endpoints for liveness and readiness probes.
+    """
+    router = APIRouter(prefix="/health", tags=[HEALTH_TAG])
+
+    @staticmethod
+    @router.get("/live", response_model=BaseMessageRSchema)
+    async def get_liveness():
+        """
+        Report that the application process is running.
+
+        Returns:
+            BaseMessageRSchema: Liveness status message.
+        """
+        return BaseMessageRSchema(message="alive")
+
+    @staticmethod
+    @router.get("/ready", response_model=BaseMessageRSchema, responses={
+        503: {"model": BaseErrorRSchema}
+    })
+    async def get_readiness():
+        """
+        Report whether the application is ready to receive traffic.
+
+        The application is ready once cache warm-up reaches the configured coverage threshold.
+
+        Returns:
+            BaseMessageRSchema: Readiness status message.
+        """
+        coverage = WeatherCacheWarmupService.get_coverage()
+        if not WeatherCacheWarmupService.is_ready():
+            return JSONResponse(
+                status_code=503,
+                content={"detail": f"Cache warm-up in progress. Coverage: {coverage:.0%}"})
+
+        return BaseMessageRSchema(message=f"ready. Cache warm-up coverage: {coverage:.0%}")
+
+    @staticmethod
+    @router.get("/metrics", response_model=MetricsRSchema, dependencies=[Depends(verify_admin_token)], responses={
+        403: {"model": BaseErrorRSchema}
+    })
+    async def get_metrics():
+        """
+        Report operational metrics of the worker process serving the request.
+
+        Includes admission control queue depth, in-flight and shed counts.
+        Requires the admin token, since metrics expose internal load and failures.
+
+        Returns:
+            MetricsRSchema: Metric values by name.
+        """
+        return MetricsRSchema(metrics=metrics.snapshot())
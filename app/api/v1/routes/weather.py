@@ -1,15 +1,24 @@
-from typing import TYPE_CHECKING
+import asyncio
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header, WebSocket
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
+from starlette.websockets import WebSocketDisconnect
 
 from app.api.base import BaseAPIRouteWrapper, BaseErrorRSchema
-from app.api.v1.dependencies import validate_fetch_city_weather_filters
+from app.api.v1.dependencies import validate_fetch_city_weather_filters, validate_fetch_nearby_weather_filters
 from app.api.v1.tags import WEATHER_TAG
-from app.domains.weather import WeatherApplicationService
-from app.domains.weather.schemas import FetchCityWeatherFiltersSchema, LocationWeatherSchema
+from app.domains.weather import WeatherApplicationService, WeatherUpdatesBroadcaster
+from app.domains.weather.schemas import (
+    FetchCityWeatherFiltersSchema, FetchNearbyWeatherFiltersSchema, LocationCoordSchema, LocationWeatherSchema
+)
+from app.kernel.deadline import request_deadline
+from app.kernel.settings import weather_settings
+from app.utils.http import build_cache_headers, is_not_modified, select_encoding
 
 if TYPE_CHECKING:
-    from app.domains.weather.schemas import FetchCityWeatherFiltersSchema
+    from app.domains.weather.schemas import FetchCityWeatherFiltersSchema, FetchNearbyWeatherFiltersSchema
 
 
 class WeatherEndpointsAPI(BaseAPIRouteWrapper):
@@ -20,21 +29,205 @@ class WeatherEndpointsAPI(BaseAPIRouteWrapper):
 
     @staticmethod
     @router.get("/", response_model=LocationWeatherSchema, responses={
+        304: {"description": "Weather observation has not changed"},
         400: {"model": BaseErrorRSchema},
-        404: {"model": BaseErrorRSchema}
+        404: {"model": BaseErrorRSchema},
+        504: {"model": BaseErrorRSchema}
     })
     async def get_city_weather_info(
-            query_filters: "FetchCityWeatherFiltersSchema" = Depends(validate_fetch_city_weather_filters)
+            query_filters: "FetchCityWeatherFiltersSchema" = Depends(validate_fetch_city_weather_filters),
+            if_none_match: Optional[str] = Header(default=None),
+            if_modified_since: Optional[str] = Header(default=None),
+            accept_encoding: Optional[str] = Header(default=None),
     ):
         """
         Get weather information for a specific city.
 
+        Cached weather files are returned as stored, without model validation
+        and re-serialization (the payload is validated once, when it is written).
+        Responses carry ETag/Last-Modified validators derived from the observation
+        timestamp and Cache-Control max-age from the remaining cache TTL.
+        Conditional requests are answered with 304 without loading the weather file.
+        Compressed responses are served from precompressed cached variants in the stored codings.
+        The request is answered within the weather request deadline, with expired
+        cached weather if the fresh one cannot be fetched in time.
+
         Args:
             query_filters: Validated query parameters containing city name.
+            if_none_match: Entity tags of the client copy.
+            if_modified_since: Observation date of the client copy.
+            accept_encoding: Content codings accepted by the client.
 
         Returns:
             LocationWeatherSchema: Weather data for the requested city.
         """
-        return await (
-            WeatherApplicationService()
-            .get_city_weather(query_filters.city))
+        weather_service = WeatherApplicationService()
+
+        with request_deadline(weather_settings.request_deadline):
+            if if_none_match or if_modified_since:
+                cached_weather = await weather_service.get_cached_city_weather(query_filters.city)
+                if cached_weather and is_not_modified(cached_weather.timestamp, if_none_match, if_modified_since):
+                    return Response(
+                        status_code=304,
+                        headers={
+                            **build_cache_headers(cached_weather.timestamp, cached_weather.ttl),
+                            "Vary": "Accept-Encoding",
+                        })
+
+            weather_payload = await weather_service.get_city_weather_payload(
+                query_filters.city,
+                encoding=select_encoding(accept_encoding, encodings=weather_settings.get_stored_encodings()))
+
+        headers = {
+            **build_cache_headers(weather_payload.timestamp, weather_payload.ttl),
+            "Vary": "Accept-Encoding",
+        }
+        if weather_payload.content_encoding:
+            headers["Content-Encoding"] = weather_payload.content_encoding
+
+        return Response(content=weather_payload.content, media_type="application/json", headers=headers)
+
+    @staticmethod
+    @router.get("/nearby", response_model=LocationWeatherSchema, responses={
+        400: {"model": BaseErrorRSchema},
+        404: {"model": BaseErrorRSchema},
+        504: {"model": BaseErrorRSchema}
+    })
+    async def get_nearby_weather_info(
+            query_filters: "FetchNearbyWeatherFiltersSchema" = Depends(validate_fetch_nearby_weather_filters),
+            accept_encoding: Optional[str] = Header(default=None),
+    ):
+        """
+        Get weather information for coordinates from the nearest fresh cached observation.
+
+        Any fresh observation cached within the radius is returned (nearest first).
+        Weather is fetched from external API only when none is in range.
+
+        Args:
+            query_filters: Validated query parameters containing coordinates and search radius.
+            accept_encoding: Content codings accepted by the client.
+
+        Returns:
+            LocationWeatherSchema: Weather data of the nearest observation.
+        """
+        with request_deadline(weather_settings.request_deadline):
+            weather_payload = await WeatherApplicationService().get_nearby_weather_payload(
+                LocationCoordSchema(lat=query_filters.lat, lon=query_filters.lon),
+                radius_km=query_filters.radius,
+                encoding=select_encoding(accept_encoding, encodings=weather_settings.get_stored_encodings()))
+
+        headers = {
+            **build_cache_headers(weather_payload.timestamp, weather_payload.ttl),
+            "Vary": "Accept-Encoding",
+        }
+        if weather_payload.content_encoding:
+            headers["Content-Encoding"] = weather_payload.content_encoding
+
+        return Response(content=weather_payload.content, media_type="application/json", headers=headers)
+
+    @staticmethod
+    @router.get("/stream", response_class=StreamingResponse, responses={
+        200: {"content": {"text/event-stream": {}}},
+        400: {"model": BaseErrorRSchema},
+        404: {"model": BaseErrorRSchema}
+    })
+    async def stream_city_weather_info(
+            query_filters: "FetchCityWeatherFiltersSchema" = Depends(validate_fetch_city_weather_filters)
+    ):
+        """
+        Stream live weather updates for a specific city as Server-Sent Events.
+
+        The current weather is sent first, then every new observation. Each 'weather'
+        event carries a LocationWeatherSchema JSON payload. Idle streams receive
+        keep-alive comments.
+
+        Args:
+            query_filters: Validated query parameters containing city name.
+
+        Returns:
+            StreamingResponse: Event stream with weather updates.
+        """
+        city_name = query_filters.city
+        weather_payload = await WeatherApplicationService().get_city_weather_payload(city_name)
+
+        async def event_stream():
+            async with WeatherUpdatesBroadcaster.subscribe(city_name) as queue:
+                if queue.empty():
+                    queue.put_nowait(weather_payload.content)
+                while True:
+                    try:
+                        payload = await asyncio.wait_for(
+                            queue.get(), timeout=weather_settings.stream_heartbeat_interval)
+                    except asyncio.TimeoutError:
+                        yield b": keep-alive\n\n"
+                        continue
+
+                    yield b"event: weather\ndata: " + payload + b"\n\n"
+
+        return StreamingResponse(
+            event_stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+    @staticmethod
+    @router.websocket("/stream")
+    async def stream_city_weather_info_ws(websocket: WebSocket, city: str):
+        """
+        Stream live weather updates for a specific city over WebSocket.
+
+        The current weather is sent first, then every new observation as a
+        LocationWeatherSchema JSON text message. Consumers that cannot receive
+        a message within the configured send timeout are disconnected.
+
+        Args:
+            websocket: WebSocket connection.
+            city: City name.
+        """
+        try:
+            city_name = validate_fetch_city_weather_filters(city).city
+        except ValidationError:
+            await websocket.close(code=1008, reason="Invalid city name")
+            return
+
+        await websocket.accept()
+        try:
+            weather_payload = await WeatherApplicationService().get_city_weather_payload(city_name)
+        except Exception as ex:
+            await websocket.close(code=1011, reason=str(ex)[:120])
+            return
+
+        async with WeatherUpdatesBroadcaster.subscribe(city_name) as queue:
+            if queue.empty():
+                queue.put_nowait(weather_payload.content)
+            receive_task = asyncio.create_task(websocket.receive())
+            get_task = None
+            try:
+                while True:
+                    if get_task is None:
+                        get_task = asyncio.create_task(queue.get())
+
+                    await asyncio.wait({get_task, receive_task}, return_when=asyncio.FIRST_COMPLETED)
+                    if receive_task.done():
+                        if receive_task.result()["type"] == "websocket.disconnect":
+                            return
+                        # client messages are ignored
+                        receive_task = asyncio.create_task(websocket.receive())
+
+                    if not get_task.done():
+                        continue
+
+                    payload, get_task = get_task.result(), None
+                    try:
+                        await asyncio.wait_for(
+                            websocket.send_text(payload.decode("utf-8")),
+                            timeout=weather_settings.stream_send_timeout)
+                    except asyncio.TimeoutError:
+                        await websocket.close(code=1013, reason="Consumer is too slow")
+                        return
+
+            except WebSocketDisconnect:
+                return
+            finally:
+                receive_task.cancel()
+                if get_task is not None:
+                    get_task.cancel()
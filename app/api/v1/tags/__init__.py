@@ -1 +1,3 @@
 from .weather import *
+from .health import *
+from .admin import *
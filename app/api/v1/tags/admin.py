@@ -0,0 +1 @@
+ADMIN_TAG = "Admin"
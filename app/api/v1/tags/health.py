@@ -0,0 +1 @@
+HEALTH_TAG = "Health"
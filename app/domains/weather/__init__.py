@@ -1,2 +1,5 @@
 from .application_service import WeatherApplicationService
 from .data_service import WeatherDataService
+from .request_counter import CityRequestCounter
+from .warmup_service import WeatherCacheWarmupService
+from .broadcaster import WeatherUpdatesBroadcaster
@@ -1,9 +1,23 @@
 import asyncio
+import time
+from typing import Dict, Optional
 
 from app.domains.weather.data_service import WeatherDataService
+from app.exceptions import TooManyRequestsException, DeadlineExceededException
+from app.infrastructure.cache import RedisLeaseLock, RedisRateLimiter
+from app.kernel.context import client_id_context
+from app.kernel.deadline import enforce_deadline, request_deadline, request_deadline_context
 from app.kernel.logs import logger
+from app.kernel.metrics import metrics
+from app.kernel.settings import weather_settings, rate_limit_settings
+from app.utils.concurrency import AdmissionGate
+from app.utils.http import compress_content
+from .freshness import get_weather_cache_ttl
 from .repositories import WeatherCacheRepository, WeatherS3Repository, DynamoDBWeatherEventRepository
-from .schemas import LocationCoordSchema, LocationWeatherSchema, CityFileInfoSchema
+from .request_counter import CityRequestCounter
+from .schemas import (
+    LocationCoordSchema, LocationWeatherSchema, CityFileInfoSchema, CachedCityWeatherSchema, WeatherPayloadSchema
+)
 
 
 class WeatherApplicationService:
@@ -13,6 +27,24 @@ class WeatherApplicationService:
     Orchestrates weather data retrieval with multi-layer caching, persistence to S3, and event logging to DynamoDB.
     """
 
+    # in-flight external API fetches by city name, shared by all service instances in the process
+    _inflight_fetches: Dict[str, asyncio.Task] = {}
+
+    # bounds concurrent cache-miss fetches; cache hits never pass through it
+    _upstream_gate = AdmissionGate(
+        name="weather.upstream",
+        max_concurrency=weather_settings.upstream_max_concurrency,
+        max_queue_size=weather_settings.upstream_max_queue_size,
+        queue_timeout=weather_settings.upstream_queue_timeout,
+        retry_after=weather_settings.upstream_retry_after)
+
+    # per-client quota of cache misses (checked only for rate limited requests)
+    _miss_rate_limiter = RedisRateLimiter(
+        key_prefix="rateLimitMisses",
+        limit=rate_limit_settings.misses_limit,
+        period=rate_limit_settings.period,
+        local_cache_size=rate_limit_settings.local_cache_size)
+
     def __init__(self):
         self._weather_data_service = WeatherDataService()
         self._cache_repository = WeatherCacheRepository()
@@ -23,50 +55,442 @@ class WeatherApplicationService:
         """
         Get weather information for a city with caching.
 
+        Args:
+            city_name: Name of the city to get weather for.
+
+        Returns:
+            LocationWeatherSchema: Current weather data for the city.
+        """
+        weather_payload = await self.get_city_weather_payload(city_name)
+        return LocationWeatherSchema.model_validate_json(weather_payload.content)
+
+    async def get_cached_city_weather(self, city_name: str) -> Optional[CachedCityWeatherSchema]:
+        """
+        Get cached weather file pointer for a city without loading the file.
+
+        Args:
+            city_name: Name of the city.
+
+        Returns:
+            Optional[CachedCityWeatherSchema]: Pointer with observation timestamp and remaining TTL,
+                None if city weather is not cached or expired.
+        """
+        return await self._cache_repository.get_city_weather_file(city_name)
+
+    async def get_city_weather_payload(self, city_name: str, encoding: Optional[str] = None) -> WeatherPayloadSchema:
+        """
+        Get JSON-encoded weather information for a city with caching.
+
         Implements multi-level data retrieval strategy:
-        1. Check cache for existing weather file
-        2. If cached, retrieve from S3
-        3. If not cached, fetch from external API
+        1. Read city coordinates and weather file pointer from cache (one round trip)
+        2. If cached, use inline payload or retrieve raw (or precompressed) file content
+           from S3 (no model round trip)
+        3. If not cached, fetch from external API once across all instances (single-flight)
         4. Save new data to S3, cache, and log event
+        5. If the request deadline is reached before the fetch completes, serve the
+           expired cached observation (if any); the fetch still completes in background
+
+        Requests are counted per city to rank cities for cache warm-up.
 
         Args:
             city_name: Name of the city to get weather for.
+            encoding: Preferred content coding of the payload (optional). The payload is returned
+                uncompressed when a precompressed variant is not available.
 
         Returns:
-            LocationWeatherSchema: Current weather data for the city.
+            WeatherPayloadSchema: JSON-encoded LocationWeatherSchema with observation timestamp and cache TTL.
+
+        Raises:
+            DeadlineExceededException: If the request deadline is reached and no cached observation exists.
+        """
+        CityRequestCounter.count(city_name)
+        city_cache = await self._cache_repository.get_city_cache(city_name)
+        if city_cache.fresh_weather:
+            weather_payload = await self._read_cached_city_weather_payload(city_cache.fresh_weather, encoding)
+            if weather_payload:
+                return weather_payload
+
+        await self._check_miss_rate_limit()
+        try:
+            weather_payload = await self._fetch_city_weather_single_flight(city_name, coord=city_cache.coord)
+        except DeadlineExceededException:
+            stale_payload = await self._read_stale_city_weather_payload(city_name, city_cache.weather, encoding)
+            if stale_payload:
+                return stale_payload
+            raise
+        return self._encode_weather_payload(weather_payload, encoding)
+
+    async def get_nearby_weather_payload(
+            self, coord: LocationCoordSchema, radius_km: float, encoding: Optional[str] = None
+    ) -> WeatherPayloadSchema:
         """
-        location_weather = None
-        file_path_from_cache = await self._cache_repository.get_city_weather_file(city_name)
-        if file_path_from_cache:
+        Get JSON-encoded weather information of the nearest fresh cached observation.
+
+        Cached cities within the radius are checked nearest first, then the
+        observation previously fetched for the same rounded coordinates. If
+        none is fresh, weather is fetched from external API for the coordinates
+        (rounded, so nearby requests share the result) and cached like a city
+        observation, but not logged to request history.
+
+        Args:
+            coord: Coordinates of the location.
+            radius_km: Search radius in kilometers.
+            encoding: Preferred content coding of the payload (optional).
+
+        Returns:
+            WeatherPayloadSchema: JSON-encoded LocationWeatherSchema with observation timestamp and cache TTL.
+        """
+        nearby_weather = await self._cache_repository.get_nearby_city_weather(
+            coord,
+            radius_km=radius_km,
+            count=weather_settings.nearby_search_count)
+
+        for cached_weather in nearby_weather:
+            weather_payload = await self._read_cached_city_weather_payload(cached_weather, encoding)
+            if weather_payload:
+                return weather_payload
+
+        coord_city_name = self._cache_repository.get_coord_city_name(coord)
+        cached_weather = await self.get_cached_city_weather(coord_city_name)
+        weather_payload = cached_weather and await self._read_cached_city_weather_payload(cached_weather, encoding)
+        if weather_payload:
+            return weather_payload
+
+        await self._check_miss_rate_limit()
+        weather_payload = await self._fetch_city_weather_single_flight(
+            coord_city_name,
+            coord=LocationCoordSchema(lat=round(coord.lat, 2), lon=round(coord.lon, 2)),
+            log_event=False)
+        return self._encode_weather_payload(weather_payload, encoding)
+
+    async def _check_miss_rate_limit(self):
+        """
+        Count a cache miss against the quota of the current client.
+
+        Raises:
+            TooManyRequestsException: If the client exceeded its cache-miss quota.
+        """
+        client_id = client_id_context.get()
+        if client_id is None:
+            return
+
+        result = await self._miss_rate_limiter.hit(client_id)
+        if result and not result.allowed:
+            raise TooManyRequestsException("Rate limit of uncached requests exceeded", headers=result.get_headers())
+
+    @staticmethod
+    def _encode_weather_payload(weather_payload: WeatherPayloadSchema, encoding: Optional[str]) -> WeatherPayloadSchema:
+        """Compress uncompressed weather payload with requested content coding (if any)."""
+        if encoding:
+            return weather_payload.model_copy(update={
+                "content": compress_content(weather_payload.content, encoding),
+                "content_encoding": encoding})
+        return weather_payload
+
+    async def _read_cached_city_weather_payload(
+            self, cached_weather: CachedCityWeatherSchema, encoding: Optional[str] = None
+    ) -> Optional[WeatherPayloadSchema]:
+        """
+        Read weather payload stored inline in the cache or the file it references from S3.
+
+        The compressed variant in the preferred coding is used when it is stored
+        (inline or in S3), otherwise the uncompressed payload.
+
+        Args:
+            cached_weather: Cached weather file pointer.
+            encoding: Preferred content coding of the payload (optional).
+
+        Returns:
+            Optional[WeatherPayloadSchema]: Weather payload, None if the file cannot be read.
+        """
+        if cached_weather.payload:
+            if encoding in cached_weather.compressed_payloads:
+                return WeatherPayloadSchema(
+                    content=cached_weather.compressed_payloads[encoding],
+                    timestamp=cached_weather.timestamp,
+                    ttl=cached_weather.ttl,
+                    content_encoding=encoding)
+            return WeatherPayloadSchema(
+                content=cached_weather.payload,
+                timestamp=cached_weather.timestamp,
+                ttl=cached_weather.ttl)
+
+        try:
+            payload = None
+            if encoding:
+                payload = await self._s3_repository.get_weather_file_payload(cached_weather.file_path, encoding)
+                if not payload:
+                    encoding = None
+            if not payload:
+                payload = await self._s3_repository.get_weather_file_payload(cached_weather.file_path)
+            if payload:
+                logger.debug(f"Extracted location weather from cached file: {cached_weather.file_path}")
+                return WeatherPayloadSchema(
+                    content=payload,
+                    timestamp=cached_weather.timestamp,
+                    ttl=cached_weather.ttl,
+                    content_encoding=encoding)
+        except Exception as ex:
+            logger.warning(f"Failed to read cached weather file {cached_weather.file_path}: {str(ex)}")
+        return None
+
+    async def _read_stale_city_weather_payload(
+            self, city_name: str, cached_weather: Optional[CachedCityWeatherSchema], encoding: Optional[str] = None
+    ) -> Optional[WeatherPayloadSchema]:
+        """
+        Read expired cached weather of a city as the best available answer.
+
+        The request deadline is already exceeded, so the read gets its own short budget.
+
+        Args:
+            city_name: Name of the city.
+            cached_weather: Cached weather file pointer, including expired ones (optional).
+            encoding: Preferred content coding of the payload (optional).
+
+        Returns:
+            Optional[WeatherPayloadSchema]: Stale weather payload, None if not cached or cannot be read in time.
+        """
+        if cached_weather is None:
+            return None
+
+        with request_deadline(weather_settings.stale_read_timeout):
+            weather_payload = await self._read_cached_city_weather_payload(cached_weather, encoding)
+
+        if weather_payload:
+            logger.warning(f"Request deadline exceeded, serving stale weather of city '{city_name}'")
+            metrics.increment("weather.stale_served")
+        return weather_payload
+
+    async def _fetch_city_weather_single_flight(
+            self, city_name: str, coord: Optional[LocationCoordSchema] = None, log_event: bool = True
+    ) -> WeatherPayloadSchema:
+        """
+        Fetch city weather once per process for concurrent misses of the same city.
+
+        Concurrent callers share one in-flight fetch. The fetch keeps running
+        if the caller that started it is cancelled or its request deadline is
+        reached, so the result is still cached. Fetches pass the upstream
+        admission gate: when it is saturated, callers fail fast with 503.
+
+        Args:
+            city_name: Name of the city.
+            coord: Cached city coordinates (optional, looked up if not provided).
+            log_event: Whether to log the observation to request history (default: True).
+
+        Returns:
+            WeatherPayloadSchema: Uncompressed weather payload.
+
+        Raises:
+            DeadlineExceededException: If the request deadline is reached before the fetch completes.
+        """
+        task = self._inflight_fetches.get(city_name)
+        if task is None:
+            task = asyncio.create_task(self._fetch_city_weather_admitted(city_name, coord=coord, log_event=log_event))
+            self._inflight_fetches[city_name] = task
+            task.add_done_callback(lambda _: self._inflight_fetches.pop(city_name, None))
+        async with enforce_deadline():
+            return await asyncio.shield(task)
+
+    async def _fetch_city_weather_admitted(
+            self, city_name: str, coord: Optional[LocationCoordSchema] = None, log_event: bool = True
+    ) -> WeatherPayloadSchema:
+        """
+        Fetch city weather once admitted by the upstream admission gate.
+
+        Raises:
+            ServiceUnavailableException: If the gate sheds the fetch.
+        """
+        # the fetch is shared and outlives the request that started it, so it is not bound by its deadline
+        request_deadline_context.set(None)
+        async with self._upstream_gate.admit():
+            return await self._fetch_city_weather_distributed(city_name, coord=coord, log_event=log_event)
+
+    async def _fetch_city_weather_distributed(
+            self, city_name: str, coord: Optional[LocationCoordSchema] = None, log_event: bool = True
+    ) -> WeatherPayloadSchema:
+        """
+        Fetch city weather once across all instances using a Redis lease lock.
+
+        The instance holding the lock (leader) fetches from the external API and
+        keeps the lock (extending its lease up to the maximum hold time) until
+        the weather file and cache pointer are stored. Other instances
+        (followers) poll the cache pointer until the leader's result appears.
+        If the lock is released or expires without a result (e.g. the leader
+        failed or crashed), a follower takes over. Followers waiting longer than
+        the maximum hold time fetch on their own, so a stuck leader does not
+        hold them and their admission slots. If Redis is unavailable, weather
+        is fetched without coordination.
+
+        Only the 'redis' cache engine is shared by all instances, so with local
+        engines followers would never see the leader's result: weather is then
+        fetched without the lock (still once per process).
+
+        Args:
+            city_name: Name of the city.
+            coord: Cached city coordinates (optional, looked up if not provided).
+            log_event: Whether to log the observation to request history (default: True).
+
+        Returns:
+            WeatherPayloadSchema: Uncompressed weather payload.
+        """
+        if weather_settings.cache_engine != "redis":
+            return await self._fetch_city_weather(city_name, coord=coord, log_event=log_event)
+
+        lock = self._cache_repository.get_city_weather_lock(city_name)
+        poll_interval = weather_settings.single_flight_poll_interval_ms / 1000
+        wait_until = time.monotonic() + weather_settings.single_flight_max_hold_ms / 1000
+        while True:
             try:
-                location_weather = await self._s3_repository.get_weather_file_content(file_path_from_cache)
-                logger.debug(f"Extracted location weather from cached file: {file_path_from_cache}")
-            except:
-                pass
-
-        if not location_weather:
-            coord = await self.get_city_geo(city_name)
-            location_weather = await self._weather_data_service.fetch_coord_weather_from_open_weather(coord)
-            city_file_info = CityFileInfoSchema.model_validate({
-                "city_name": city_name,
-                "timestamp": location_weather.timestamp
-            })
+                is_leader = await lock.acquire()
+            except Exception as ex:
+                logger.warning(f"Failed to acquire weather lock for city '{city_name}': {str(ex)}")
+                return await self._fetch_city_weather(city_name, coord=coord, log_event=log_event)
+
+            if is_leader:
+                lock.start_renewal(weather_settings.single_flight_max_hold_ms)
+                try:
+                    # the previous leader could have stored the result right before the lock was taken
+                    cached_weather = await self.get_cached_city_weather(city_name)
+                    weather_payload = cached_weather and await self._read_cached_city_weather_payload(cached_weather)
+                    if weather_payload:
+                        await self._release_city_weather_lock(city_name, lock)
+                        return weather_payload
+
+                    return await self._fetch_city_weather(city_name, coord=coord, lock=lock, log_event=log_event)
+                except Exception:
+                    await self._release_city_weather_lock(city_name, lock)
+                    raise
+
+            logger.debug(f"Waiting for weather of city '{city_name}' fetched by another instance")
+            while True:
+                if time.monotonic() >= wait_until:
+                    logger.warning(f"Gave up waiting for weather of city '{city_name}' fetched by another instance")
+                    metrics.increment("weather.single_flight_wait_expired")
+                    return await self._fetch_city_weather(city_name, coord=coord, log_event=log_event)
+
+                await asyncio.sleep(poll_interval)
+                cached_weather = await self.get_cached_city_weather(city_name)
+                if cached_weather:
+                    weather_payload = await self._read_cached_city_weather_payload(cached_weather)
+                    if weather_payload:
+                        return weather_payload
+
+                try:
+                    if not await lock.is_locked():
+                        break
+                except Exception as ex:
+                    logger.warning(f"Failed to check weather lock for city '{city_name}': {str(ex)}")
+                    return await self._fetch_city_weather(city_name, coord=coord, log_event=log_event)
+
+    @staticmethod
+    async def _release_city_weather_lock(city_name: str, lock: RedisLeaseLock):
+        """Release weather lock of a city, logging failures (the lock then expires with its lease)."""
+        try:
+            await lock.release()
+        except Exception as ex:
+            logger.warning(f"Failed to release weather lock for city '{city_name}': {str(ex)}")
+
+    async def _fetch_city_weather(
+            self, city_name: str, coord: Optional[LocationCoordSchema] = None,
+            lock: Optional[RedisLeaseLock] = None, log_event: bool = True
+    ) -> WeatherPayloadSchema:
+        """
+        Fetch city weather from external API and persist it in background.
+
+        Args:
+            city_name: Name of the city.
+            coord: Cached city coordinates (optional, looked up if not provided).
+            lock: Distributed lock to release once the result is persisted (optional).
+            log_event: Whether to log the observation to request history (default: True).
+
+        Returns:
+            WeatherPayloadSchema: Uncompressed weather payload.
+        """
+        coord = coord or await self.get_city_geo(city_name)
+        fetched_weather = await self._weather_data_service.fetch_coord_weather_from_open_weather(coord)
+        location_weather = fetched_weather.weather
+        if fetched_weather.city_id != coord.city_id and not self._cache_repository.is_coord_city_name(city_name):
+            # remember city ID to resolve the next misses with batched group requests, or forget an unusable one
+            coord = coord.model_copy(update={"city_id": fetched_weather.city_id})
+            asyncio.create_task(self._cache_repository.set_city_geo(city_name, coord=coord))
+
+        payload = location_weather.model_dump_json().encode("utf-8")
+        asyncio.create_task(self._persist_city_weather(
+            city_name, coord, location_weather, payload, lock=lock, log_event=log_event))
+        return WeatherPayloadSchema(
+            content=payload,
+            timestamp=location_weather.timestamp,
+            ttl=get_weather_cache_ttl(location_weather.timestamp))
+
+    async def _persist_city_weather(
+            self, city_name: str, coord: LocationCoordSchema, location_weather: LocationWeatherSchema,
+            payload: bytes, lock: Optional[RedisLeaseLock] = None, log_event: bool = True
+    ):
+        """
+        Save weather file to S3, cache its path, log event and notify subscribers.
+
+        The file is stored before its path is cached, so the cached path always
+        references an existing file. The distributed lock is released once the
+        path is cached. An observation equal to the cached one (same timestamp
+        and content hash) is not stored again: only its cache expiry is extended.
+        The city is indexed by coordinates for nearby weather lookups.
+
+        Args:
+            city_name: Name of the city.
+            coord: City coordinates.
+            location_weather: Validated weather data.
+            payload: JSON-encoded weather data.
+            lock: Distributed lock to release after caching the file path (optional).
+            log_event: Whether to log the observation to request history (default: True).
+        """
+        city_file_info = CityFileInfoSchema.model_validate({
+            "city_name": city_name,
+            "timestamp": location_weather.timestamp
+        })
+        content_hash = self._s3_repository.get_content_hash(payload)
+
+        is_changed = True
+        try:
+            cached_weather = (await self._cache_repository.get_city_cache(city_name)).weather
+            stored_content_hash = None
+            if cached_weather and cached_weather.file_path == city_file_info.file_name:
+                stored_content_hash = cached_weather.content_hash
 
             # upload file to s3
-            asyncio.create_task(self._s3_repository.save_weather_file(
+            is_changed = await self._s3_repository.save_weather_file(
                 file_path=city_file_info.file_name,
-                weather_data=location_weather))
+                payload=payload,
+                stored_content_hash=stored_content_hash)
 
             # set filepath to cache
-            asyncio.create_task(self._cache_repository.set_city_weather_file(
+            await self._cache_repository.set_city_weather_file(
                 city_name=city_name,
                 file_path=city_file_info.file_name,
-                ttl=300))
+                timestamp=city_file_info.timestamp,
+                ttl=get_weather_cache_ttl(city_file_info.timestamp),
+                payload=payload if weather_settings.cache_inline_payload else None,
+                content_hash=content_hash)
+
+            await self._cache_repository.add_city_weather_geo(city_name, coord)
+        except Exception as ex:
+            logger.error(f"Failed to store weather file for city '{city_name}': {str(ex)}")
+        finally:
+            if lock:
+                await self._release_city_weather_lock(city_name, lock)
+
+        if not is_changed:
+            logger.debug(f"Weather observation for city '{city_name}' is unchanged, extended cache expiry")
+            return
 
-            # log dynamo db event
+        # log dynamo db event
+        if log_event:
             asyncio.create_task(self._dynamodb_repository.put_weather_event(city_file_info))
 
-        return location_weather
+        # notify live stream subscribers on all instances
+        asyncio.create_task(self._cache_repository.publish_city_weather_update(
+            city_name=city_name,
+            timestamp=location_weather.timestamp,
+            payload=payload))
 
     async def get_city_geo(self, city_name: str) -> LocationCoordSchema:
         """
@@ -0,0 +1,150 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional, Set
+
+from app.infrastructure.cache import RedisCacheManager
+from app.kernel.context import client_id_context
+from app.kernel.logs import logger
+from app.kernel.settings import weather_settings
+from .application_service import WeatherApplicationService
+from .repositories import WeatherCacheRepository
+
+
+class WeatherUpdatesBroadcaster:
+    """
+    Fan-out of live city weather updates to stream subscribers.
+
+    Each instance runs one refresh loop per subscribed city and one Redis
+    pub/sub listener, so a single refresh reaches every local subscriber and
+    a new observation fetched by any instance reaches subscribers of all
+    instances. Subscriber queues hold only the latest update: slow consumers
+    skip intermediate observations instead of buffering them.
+    """
+
+    _subscribers: Dict[str, Set[asyncio.Queue]] = {}
+    _last_timestamps: Dict[str, int] = {}
+    _refresh_tasks: Dict[str, asyncio.Task] = {}
+    _listener_task: Optional[asyncio.Task] = None
+
+    @classmethod
+    async def start(cls):
+        """Start Redis pub/sub listener for weather updates from all instances."""
+        if cls._listener_task is None:
+            cls._listener_task = asyncio.create_task(cls._listen())
+
+    @classmethod
+    async def stop(cls):
+        """Stop pub/sub listener and refresh loops."""
+        tasks = list(cls._refresh_tasks.values())
+        if cls._listener_task is not None:
+            tasks.append(cls._listener_task)
+
+        for task in tasks:
+            task.cancel()
+
+        cls._refresh_tasks.clear()
+        cls._listener_task = None
+
+    @classmethod
+    @asynccontextmanager
+    async def subscribe(cls, city_name: str) -> AsyncIterator[asyncio.Queue]:
+        """
+        Subscribe to live weather updates for a city.
+
+        Starts the city refresh loop for the first subscriber and stops it
+        when the last subscriber leaves.
+
+        Args:
+            city_name: Name of the city.
+
+        Yields:
+            asyncio.Queue: Queue receiving JSON-encoded weather payloads (latest only).
+        """
+        queue = asyncio.Queue(maxsize=1)
+        cls._subscribers.setdefault(city_name, set()).add(queue)
+        if city_name not in cls._refresh_tasks:
+            cls._refresh_tasks[city_name] = asyncio.create_task(cls._refresh(city_name))
+
+        try:
+            yield queue
+        finally:
+            subscribers = cls._subscribers.get(city_name, set())
+            subscribers.discard(queue)
+            if not subscribers:
+                cls._subscribers.pop(city_name, None)
+                cls._last_timestamps.pop(city_name, None)
+                refresh_task = cls._refresh_tasks.pop(city_name, None)
+                if refresh_task is not None:
+                    refresh_task.cancel()
+
+    @classmethod
+    def publish(cls, city_name: str, timestamp: int, payload: bytes):
+        """
+        Deliver weather update to local subscribers of a city.
+
+        Observations not newer than the last delivered one are skipped.
+        A pending undelivered update is replaced by the new one.
+
+        Args:
+            city_name: Name of the city.
+            timestamp: Unix timestamp of the weather observation.
+            payload: JSON-encoded LocationWeatherSchema.
+        """
+        subscribers = cls._subscribers.get(city_name)
+        if not subscribers or timestamp <= cls._last_timestamps.get(city_name, 0):
+            return
+
+        cls._last_timestamps[city_name] = timestamp
+        for queue in subscribers:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    @classmethod
+    async def _refresh(cls, city_name: str):
+        """
+        Refresh city weather while it has subscribers.
+
+        Weather is read through the application service, so refreshes are
+        served from cache until the cached observation expires. Refreshes are
+        not counted against the rate limit of the client that started the loop.
+        """
+        client_id_context.set(None)
+        weather_service = WeatherApplicationService()
+        while True:
+            delay = weather_settings.stream_refresh_min_interval
+            try:
+                weather_payload = await weather_service.get_city_weather_payload(city_name)
+                cls.publish(city_name, weather_payload.timestamp, weather_payload.content)
+                delay = max(delay, weather_payload.ttl or 0)
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                logger.warning(f"Failed to refresh streamed weather for city '{city_name}': {str(ex)}")
+
+            await asyncio.sleep(delay)
+
+    @classmethod
+    async def _listen(cls):
+        """Receive weather updates published by any instance and deliver them locally."""
+        channel_prefix = f"{WeatherCacheRepository.city_weather_updates_channel_prefix}:"
+        while True:
+            try:
+                pubsub = RedisCacheManager.get_pubsub_client().pubsub(ignore_subscribe_messages=True)
+                await pubsub.psubscribe(f"{channel_prefix}*")
+                try:
+                    async for message in pubsub.listen():
+                        if message["type"] != "pmessage":
+                            continue
+
+                        city_name = message["channel"].removeprefix(channel_prefix)
+                        timestamp, _, payload = message["data"].partition("\n")
+                        cls.publish(city_name, int(timestamp), payload.encode("utf-8"))
+                finally:
+                    await pubsub.aclose()
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                logger.warning(f"Weather updates listener failed, reconnecting: {str(ex)}")
+                await asyncio.sleep(1)
@@ -1 +1,3 @@
-from .open_weather_map_client import OpenWeatherMapClient  # noqa
+from .open_weather_map_client import (  # noqa
+    OpenWeatherMapClient, weather_batcher, ReplayLatency, RecordingTransport, ReplayTransport
+)
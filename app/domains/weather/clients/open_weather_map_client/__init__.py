@@ -1,2 +1,6 @@
 from .client import OpenWeatherMapClient
+from .batcher import OpenWeatherMapWeatherBatcher, weather_batcher
+from .hedging import OpenWeatherMapRequestHedger, request_hedger
+from .retry import OpenWeatherMapRetryPolicy, retry_policy
 from .schemas import *
+from .transports import ReplayLatency, RecordingTransport, ReplayTransport
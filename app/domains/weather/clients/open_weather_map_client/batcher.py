@@ -0,0 +1,95 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from app.exceptions import NotFoundException
+from app.kernel.logs import logger
+from app.kernel.settings import open_weather_settings
+from .client import OpenWeatherMapClient
+from .schemas import WeatherResponseSchema
+
+
+class OpenWeatherMapWeatherBatcher:
+    """
+    Micro-batching layer for OpenWeatherMap weather requests.
+
+    Collects weather requests by city ID over a short time window and
+    resolves them with group queries, so a burst of cache misses for
+    different cities costs one upstream request per batch instead of
+    one per city. Concurrent requests for the same city share one slot.
+    Group queries are sent by the given client (e.g. with a replay
+    transport), or by a client using the shared HTTP client.
+    """
+
+    def __init__(self, client: Optional[OpenWeatherMapClient] = None):
+        self._client = client or OpenWeatherMapClient()
+        self._pending: Dict[int, List[asyncio.Future]] = {}
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    async def get_city_weather(self, city_id: int) -> WeatherResponseSchema:
+        """
+        Get current weather for a city ID as part of the next batch.
+
+        Args:
+            city_id: OpenWeatherMap city ID.
+
+        Returns:
+            WeatherResponseSchema: Current weather information.
+
+        Raises:
+            NotFoundException: If the city is missing in the group response.
+            BadRequestException: For invalid requests or API errors.
+            BadGatewayException: For service unavailability.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(city_id, []).append(future)
+
+        if len(self._pending) >= open_weather_settings.batch_max_size:
+            self._schedule_flush(loop, delay=0)
+        elif self._flush_handle is None:
+            self._schedule_flush(loop, delay=open_weather_settings.batch_window_ms / 1000)
+
+        return await future
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, delay: float):
+        """Schedule sending of pending requests after delay (replaces scheduled flush)."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_handle = loop.call_later(delay, self._flush)
+
+    def _flush(self):
+        """Take pending requests (up to batch size) and send them as one group request."""
+        self._flush_handle = None
+        if not self._pending:
+            return
+
+        city_ids = list(self._pending)[:open_weather_settings.batch_max_size]
+        batch = {city_id: self._pending.pop(city_id) for city_id in city_ids}
+        asyncio.create_task(self._send_batch(batch))
+
+        if self._pending:
+            self._schedule_flush(asyncio.get_running_loop(), delay=open_weather_settings.batch_window_ms / 1000)
+
+    async def _send_batch(self, batch: Dict[int, List[asyncio.Future]]):
+        """Send group request and distribute results to waiting callers."""
+        logger.debug(f"Sending batched weather request for {len(batch)} city IDs")
+        try:
+            result = await self._client.get_cities_weather(list(batch))
+        except Exception as ex:
+            for futures in batch.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(ex)
+            return
+
+        for city_id, futures in batch.items():
+            for future in futures:
+                if future.done():
+                    continue
+                if city_id in result:
+                    future.set_result(result[city_id])
+                else:
+                    future.set_exception(NotFoundException(f"No weather found for city ID: {city_id}"))
+
+
+weather_batcher = OpenWeatherMapWeatherBatcher()
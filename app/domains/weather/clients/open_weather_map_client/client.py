@@ -1,12 +1,23 @@
-from typing import Dict, Any
+import asyncio
+import math
+import time
+from typing import Dict, Any, List, Optional
 
 import httpx
 
 from app.domains.weather.schemas import LocationCoordSchema
-from app.exceptions import BadGatewayException, NotFoundException, BadRequestException
+from app.exceptions import (
+    BadGatewayException, NotFoundException, BadRequestException, ServiceUnavailableException,
+    DeadlineExceededException
+)
+from app.infrastructure.http import HttpClientManager
+from app.kernel.deadline import get_remaining_time
 from app.kernel.logs import logger
+from app.kernel.metrics import metrics
 from app.kernel.settings import open_weather_settings
-from .schemas import WeatherResponseSchema
+from .hedging import request_hedger
+from .retry import retry_policy
+from .schemas import WeatherResponseSchema, GroupWeatherResponseSchema
 
 
 class OpenWeatherMapClient:
@@ -14,12 +25,20 @@ class OpenWeatherMapClient:
     Client for interacting with OpenWeatherMap API.
 
     Provides methods to fetch city coordinates and weather data from OpenWeatherMap service.
+    Requests go through the shared HTTP client, unless a transport is given
+    (e.g. RecordingTransport or ReplayTransport for offline benchmarks), in
+    which case the client owns an HTTP client using it until `close()`.
     """
 
-    def __init__(self):
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None):
         self.base_url = "https://api.openweathermap.org/data/2.5"
         self.geo_url = "http://api.openweathermap.org/geo/1.0"
-        self.timeout = 10.0
+        self._http_client = httpx.AsyncClient(transport=transport) if transport is not None else None
+
+    async def close(self):
+        """Close the HTTP client owned by this client (the shared client is left open)."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
 
     @property
     def secret_key(self) -> str:
@@ -33,6 +52,8 @@ class OpenWeatherMapClient:
         """
         Execute HTTP request to OpenWeatherMap API.
 
+        Transient failures are retried within the request deadline (see OpenWeatherMapRetryPolicy).
+
         Args:
             url: API endpoint URL.
             params: Request parameters dictionary.
@@ -42,19 +63,25 @@ class OpenWeatherMapClient:
 
         Raises:
             BadRequestException: For invalid API key or client errors.
-            BadGatewayException: For server errors or timeouts.
+            BadGatewayException: For server errors, timeouts or network errors.
+            ServiceUnavailableException: If the provider rate limit is exceeded.
+            DeadlineExceededException: If the request deadline is exceeded.
         """
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                logger.debug(f"Making request to {url} with params: {params}")
-                response = await client.get(url, params=params)
-                response.raise_for_status()
-                return response.json()
+            logger.debug(f"Making request to {url} with params: {params}")
+            response = await self._get_response_with_retries(url, params)
+            response.raise_for_status()
+            return response.json()
 
         except httpx.HTTPStatusError as e:
             logger.error(f"HTTP error {e.response.status_code} from {url}: {e.response.text}")
             if e.response.status_code == 401:
                 raise BadRequestException("Invalid API key")
+            elif e.response.status_code == 429:
+                retry_after = retry_policy.get_retry_after(e.response)
+                raise ServiceUnavailableException(
+                    "Weather service rate limit exceeded",
+                    retry_after=math.ceil(retry_after) if retry_after is not None else None)
             elif e.response.status_code >= 500:
                 raise BadGatewayException(
                     f"Weather service server error: {e.response.status_code}")
@@ -65,10 +92,118 @@ class OpenWeatherMapClient:
             logger.warning(f"Timeout occurred for request to {url}")
             raise BadGatewayException("Weather service timeout")
 
+        except httpx.TransportError as e:
+            logger.warning(f"Network error for request to {url}: {e}")
+            raise BadGatewayException("Weather service unavailable")
+
+        except DeadlineExceededException:
+            raise
+
         except Exception as e:
             logger.error(f"Unexpected error during request to {url}: {e}")
             raise BadRequestException(f"Request failed: {str(e)}")
 
+    async def _get_response_with_retries(self, url: str, params: Dict[str, Any]) -> httpx.Response:
+        """
+        Send GET request, retrying transient failures until the request deadline.
+
+        The deadline is the provider request deadline or the request deadline
+        of the caller, whichever is earlier. Each attempt is limited by the
+        attempt timeout and the time left until the deadline. Retries wait for
+        full-jitter backoff or Retry-After.
+
+        Args:
+            url: API endpoint URL.
+            params: Request parameters dictionary.
+
+        Returns:
+            httpx.Response: Response of the last attempt.
+
+        Raises:
+            httpx.TransportError: If the last attempt failed without a response.
+            DeadlineExceededException: If the caller's deadline is already exceeded.
+        """
+        request_remaining = get_remaining_time()
+        if request_remaining is not None and request_remaining <= 0:
+            raise DeadlineExceededException("Request deadline exceeded")
+
+        deadline = time.monotonic() + min(open_weather_settings.request_deadline, request_remaining or math.inf)
+        attempt = 0
+        while True:
+            attempt += 1
+            timeout = min(open_weather_settings.attempt_timeout, deadline - time.monotonic())
+            response: Optional[httpx.Response] = None
+            error: Optional[Exception] = None
+            try:
+                response = await self._get_hedged_response(url, params, timeout=timeout)
+            except httpx.TransportError as ex:
+                error = ex
+
+            delay = retry_policy.get_retry_delay(
+                attempt, remaining=deadline - time.monotonic(), response=response, error=error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+
+            reason = type(error).__name__ if error is not None else f"HTTP {response.status_code}"
+            logger.warning(f"Retrying request to {url} in {delay * 1000:.0f} ms after attempt {attempt}: {reason}")
+            metrics.increment("open_weather_map.retries")
+            await asyncio.sleep(delay)
+
+    async def _get_response(self, url: str, params: Dict[str, Any], timeout: float) -> httpx.Response:
+        """Send single GET request and record its latency for hedging."""
+        client = self._http_client or HttpClientManager.get_client()
+        started_at = time.monotonic()
+        response = await client.get(url, params=params, timeout=timeout)
+        request_hedger.record_latency(time.monotonic() - started_at)
+        return response
+
+    async def _get_hedged_response(self, url: str, params: Dict[str, Any], timeout: float) -> httpx.Response:
+        """
+        Send GET request, duplicating it once if the response is slow.
+
+        When no response arrives within the hedge delay and the hedge budget
+        allows it, a second identical request is sent. The first response
+        wins and the other request is cancelled. A failed attempt (e.g.
+        connection error) does not win while the other is still running.
+
+        Args:
+            url: API endpoint URL.
+            params: Request parameters dictionary.
+            timeout: Timeout of each request in seconds.
+
+        Returns:
+            httpx.Response: First received response.
+        """
+        delay = request_hedger.get_delay()
+        if delay is None:
+            return await self._get_response(url, params, timeout)
+
+        tasks = [asyncio.create_task(self._get_response(url, params, timeout))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                request_hedger.record_request()
+                return tasks[0].result()
+
+            if not request_hedger.try_acquire_hedge():
+                return await tasks[0]
+
+            logger.debug(f"Sending hedged request to {url} after {delay * 1000:.0f} ms")
+            tasks.append(asyncio.create_task(self._get_response(url, params, timeout)))
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None or not pending:
+                        return task.result()
+
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
     async def get_city_geo(self, city_name: str) -> LocationCoordSchema:
         """
         Get geographical coordinates for a city.
@@ -83,6 +218,7 @@ class OpenWeatherMapClient:
             NotFoundException: If city is not found.
             BadRequestException: For invalid requests or API errors.
             BadGatewayException: For service unavailability.
+            ServiceUnavailableException: If the provider rate limit is exceeded.
         """
         url = f"{self.geo_url}/direct"
         params = {
@@ -104,7 +240,10 @@ class OpenWeatherMapClient:
                 lat=geo_data["lat"],
                 lon=geo_data["lon"])
 
-        except (BadRequestException, BadGatewayException, NotFoundException):
+        except (
+                BadRequestException, BadGatewayException, NotFoundException, ServiceUnavailableException,
+                DeadlineExceededException
+        ):
             raise
 
         except httpx.HTTPStatusError as e:
@@ -131,6 +270,7 @@ class OpenWeatherMapClient:
         Raises:
             BadRequestException: For invalid coordinates or API errors.
             BadGatewayException: For service unavailability.
+            ServiceUnavailableException: If the provider rate limit is exceeded.
         """
         url = f"{self.base_url}/weather"
         params = {
@@ -152,7 +292,10 @@ class OpenWeatherMapClient:
             logger.info(f"Successfully fetched weather for coord: {str(coord)}")
             return result
 
-        except (BadRequestException, BadGatewayException, NotFoundException):
+        except (
+                BadRequestException, BadGatewayException, NotFoundException, ServiceUnavailableException,
+                DeadlineExceededException
+        ):
             raise
 
         except httpx.HTTPStatusError as ex:
@@ -165,3 +308,48 @@ class OpenWeatherMapClient:
         except Exception as ex:
             logger.error(f"Unexpected error during request to {url}: {str(ex)}")
             raise BadRequestException(f"Failed to fetch weather data: {str(ex)}")
+
+    async def get_cities_weather(self, city_ids: List[int]) -> Dict[int, WeatherResponseSchema]:
+        """
+        Get current weather data for several cities with one group request.
+
+        Args:
+            city_ids: OpenWeatherMap city IDs (up to 20 per request).
+
+        Returns:
+            Dict[int, WeatherResponseSchema]: Current weather information by city ID.
+                Cities missing in the response are omitted.
+
+        Raises:
+            BadRequestException: For invalid city IDs or API errors.
+            BadGatewayException: For service unavailability.
+            ServiceUnavailableException: If the provider rate limit is exceeded.
+        """
+        url = f"{self.base_url}/group"
+        params = {
+            "id": ",".join(str(city_id) for city_id in city_ids),
+            "appid": self.secret_key,
+            "units": "metric",
+            "lang": "en"
+        }
+
+        logger.info(f"Fetching weather for {len(city_ids)} city IDs")
+        try:
+            data = await self._do_request(url, params)
+            result = GroupWeatherResponseSchema.model_validate(data)
+            logger.info(f"Successfully fetched weather for {result.cnt} city IDs")
+            return {item.id: item for item in result.list}
+
+        except (
+                BadRequestException, BadGatewayException, NotFoundException, ServiceUnavailableException,
+                DeadlineExceededException
+        ):
+            raise
+
+        except httpx.HTTPStatusError as ex:
+            logger.error(f"HTTP error {ex.response.status_code} from {url}: {ex.response.text}")
+            raise BadRequestException(f"Failed to fetch weather data: {ex.response.status_code}")
+
+        except Exception as ex:
+            logger.error(f"Unexpected error during request to {url}: {str(ex)}")
+            raise BadRequestException(f"Failed to fetch weather data: {str(ex)}")
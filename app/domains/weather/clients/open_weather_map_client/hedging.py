@@ -0,0 +1,70 @@
+import math
+from collections import deque
+from typing import Optional
+
+from app.kernel.settings import open_weather_settings
+
+
+class OpenWeatherMapRequestHedger:
+    """
+    Hedging policy for OpenWeatherMap requests.
+
+    Tracks recent upstream latencies to derive the hedge delay (a latency
+    percentile) and recent hedging decisions to cap duplicate requests at
+    a share of traffic, so a slow upstream does not double quota usage.
+    """
+
+    def __init__(self):
+        self._latencies = deque(maxlen=open_weather_settings.hedge_latency_window)
+        self._hedged = deque(maxlen=open_weather_settings.hedge_latency_window)
+
+    def get_delay(self) -> Optional[float]:
+        """
+        Get delay before sending a hedged request.
+
+        Returns:
+            Optional[float]: Delay in seconds, None if hedging is disabled
+                or not enough latency samples were collected yet.
+        """
+        if not open_weather_settings.hedge_enabled:
+            return None
+
+        if len(self._latencies) < open_weather_settings.hedge_min_samples:
+            return None
+
+        latencies = sorted(self._latencies)
+        index = math.ceil(open_weather_settings.hedge_percentile / 100 * len(latencies)) - 1
+        delay = latencies[min(max(index, 0), len(latencies) - 1)]
+        return max(delay, open_weather_settings.hedge_min_delay_ms / 1000)
+
+    def record_latency(self, latency: float):
+        """
+        Record latency of a completed upstream request.
+
+        Args:
+            latency: Request duration in seconds.
+        """
+        self._latencies.append(latency)
+
+    def record_request(self):
+        """Record upstream request that completed without hedging."""
+        self._hedged.append(False)
+
+    def try_acquire_hedge(self) -> bool:
+        """
+        Reserve a hedged request within the configured budget.
+
+        Returns:
+            bool: True if a hedged request may be sent.
+        """
+        hedged = sum(self._hedged) + 1
+        total = len(self._hedged) + 1
+        if hedged / total * 100 > open_weather_settings.hedge_budget_percent:
+            self._hedged.append(False)
+            return False
+
+        self._hedged.append(True)
+        return True
+
+
+request_hedger = OpenWeatherMapRequestHedger()
@@ -0,0 +1,103 @@
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import httpx
+
+from app.kernel.settings import open_weather_settings
+
+
+class OpenWeatherMapRetryPolicy:
+    """
+    Retry policy for OpenWeatherMap requests.
+
+    All provider requests are idempotent GETs, so transient failures are
+    retried: timeouts, network errors and 408/429/5xx gateway responses.
+    Client errors (invalid key, unknown city) are returned at once.
+    Retries wait with exponential backoff and full jitter (a random delay
+    up to the exponential bound, so retrying instances do not synchronize),
+    or as long as the provider asks with Retry-After. A retry is only made
+    if its wait fits into the remaining request deadline.
+    """
+
+    retryable_status_codes = frozenset({408, 429, 500, 502, 503, 504})
+    retryable_errors = (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)
+
+    def is_retryable(self, response: Optional[httpx.Response] = None, error: Optional[Exception] = None) -> bool:
+        """Check whether the outcome of an attempt is a transient failure."""
+        if error is not None:
+            return isinstance(error, self.retryable_errors)
+        return response is not None and response.status_code in self.retryable_status_codes
+
+    @staticmethod
+    def get_retry_after(response: httpx.Response) -> Optional[float]:
+        """
+        Parse Retry-After header of a response.
+
+        Args:
+            response: Provider response.
+
+        Returns:
+            Optional[float]: Seconds to wait, None if the header is missing or invalid.
+        """
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+    @staticmethod
+    def get_backoff(attempt: int) -> float:
+        """
+        Get full-jitter exponential backoff before the next attempt.
+
+        Args:
+            attempt: Number of the failed attempt (starting from 1).
+
+        Returns:
+            float: Delay in seconds.
+        """
+        bound = min(
+            open_weather_settings.retry_max_delay_ms,
+            open_weather_settings.retry_base_delay_ms * 2 ** (attempt - 1))
+        return random.uniform(0, bound) / 1000
+
+    def get_retry_delay(
+            self, attempt: int, remaining: float,
+            response: Optional[httpx.Response] = None, error: Optional[Exception] = None
+    ) -> Optional[float]:
+        """
+        Decide whether to retry a failed attempt.
+
+        Args:
+            attempt: Number of the completed attempt (starting from 1).
+            remaining: Seconds left until the request deadline.
+            response: Response of the attempt (if received).
+            error: Error of the attempt (if no response was received).
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt, None if it should not be retried.
+        """
+        if attempt >= open_weather_settings.retry_max_attempts or not self.is_retryable(response, error):
+            return None
+
+        retry_after = self.get_retry_after(response) if response is not None else None
+        delay = retry_after if retry_after is not None else self.get_backoff(attempt)
+        if delay >= remaining:
+            return None
+        return delay
+
+
+retry_policy = OpenWeatherMapRetryPolicy()
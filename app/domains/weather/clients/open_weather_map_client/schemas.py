@@ -4,6 +4,7 @@ from typing import List, Optional
 
 __all__ = [
     "WeatherResponseSchema",
+    "GroupWeatherResponseSchema",
 ]
 
 
@@ -55,17 +56,23 @@ class SystemInfo(BaseModel):
 
 
 class WeatherResponseSchema(BaseModel):
-    """Complete weather API response"""
+    """Complete weather API response (base, timezone and cod are missing in group responses)"""
     coord: Coordinates
     weather: List[Weather]
-    base: str
+    base: Optional[str] = None
     main: MainWeather
     visibility: int
     wind: Wind
     clouds: Clouds
     dt: int
     sys: SystemInfo
-    timezone: int
+    timezone: Optional[int] = None
     id: int
     name: str
-    cod: int
+    cod: Optional[int] = None
+
+
+class GroupWeatherResponseSchema(BaseModel):
+    """Weather API response for several city IDs"""
+    cnt: int
+    list: List[WeatherResponseSchema]
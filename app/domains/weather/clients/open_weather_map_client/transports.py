@@ -0,0 +1,212 @@
+import asyncio
+import hashlib
+import json
+import random
+import time
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional
+
+import httpx
+
+from app.kernel.logs import logger
+
+__all__ = [
+    "ReplayLatency",
+    "RecordingTransport",
+    "ReplayTransport",
+]
+
+# query parameters that do not identify a response (secrets)
+_IGNORED_PARAMS = frozenset({"appid"})
+
+
+def _get_fixture_name(request: httpx.Request) -> str:
+    """
+    Get fixture file name identifying a request.
+
+    The name consists of the endpoint path and a hash of the method, host, path
+    and query parameters (except the API key), so fixtures recorded with one key
+    are replayed for any other.
+
+    Args:
+        request: Outgoing request.
+
+    Returns:
+        str: Fixture file name.
+    """
+    params = sorted((key, value) for key, value in request.url.params.multi_items() if key not in _IGNORED_PARAMS)
+    identity = json.dumps([request.method, request.url.host, request.url.path, params])
+    digest = hashlib.sha256(identity.encode()).hexdigest()[:16]
+    endpoint = request.url.path.strip("/").replace("/", "-")
+    return f"{endpoint}-{digest}.json"
+
+
+class ReplayLatency:
+    """
+    Latency distribution of replayed responses.
+
+    Kinds:
+
+    - 'none': responses are returned at once.
+    - 'fixed': every response takes `mean_ms`.
+    - 'uniform': latency is uniform within `mean_ms` ± `spread_ms`.
+    - 'lognormal': latency has median `mean_ms` and shape `sigma`, with the long tail of real APIs.
+    - 'recorded': latency measured when the response was recorded.
+
+    Samples come from a seeded generator, so runs with the same seed and
+    request order get the same latencies.
+    """
+
+    def __init__(
+            self,
+            kind: Literal["none", "fixed", "uniform", "lognormal", "recorded"] = "none",
+            mean_ms: float = 0.0,
+            spread_ms: float = 0.0,
+            sigma: float = 0.5,
+            seed: Optional[int] = 0,
+    ):
+        self.kind = kind
+        self.mean_ms = mean_ms
+        self.spread_ms = spread_ms
+        self.sigma = sigma
+        self._random = random.Random(seed)
+
+    @classmethod
+    def from_spec(cls, spec: str, seed: Optional[int] = 0) -> "ReplayLatency":
+        """
+        Create latency distribution from a 'kind[:mean_ms[:spread_ms|sigma]]' string.
+
+        Examples: 'none', 'fixed:50', 'uniform:50:20', 'lognormal:50:0.5', 'recorded'.
+
+        Args:
+            spec: Distribution specification.
+            seed: Random generator seed (None for a random seed).
+
+        Returns:
+            ReplayLatency: Latency distribution.
+
+        Raises:
+            ValueError: If the specification is invalid.
+        """
+        kind, *values = spec.split(":")
+        if kind not in ("none", "fixed", "uniform", "lognormal", "recorded"):
+            raise ValueError(f"Unknown latency distribution: '{kind}'")
+
+        numbers = [float(value) for value in values]
+        params: Dict[str, Any] = {"kind": kind, "seed": seed}
+        if numbers:
+            params["mean_ms"] = numbers[0]
+        if len(numbers) > 1:
+            params["sigma" if kind == "lognormal" else "spread_ms"] = numbers[1]
+        return cls(**params)
+
+    def sample(self, recorded_ms: Optional[float] = None) -> float:
+        """
+        Get latency of the next replayed response.
+
+        Args:
+            recorded_ms: Latency measured when the response was recorded (if known).
+
+        Returns:
+            float: Latency in seconds.
+        """
+        if self.kind == "fixed":
+            latency_ms = self.mean_ms
+        elif self.kind == "uniform":
+            latency_ms = self._random.uniform(self.mean_ms - self.spread_ms, self.mean_ms + self.spread_ms)
+        elif self.kind == "lognormal":
+            latency_ms = self.mean_ms * self._random.lognormvariate(0, self.sigma)
+        elif self.kind == "recorded":
+            latency_ms = recorded_ms or 0.0
+        else:
+            latency_ms = 0.0
+        return max(latency_ms, 0.0) / 1000
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that saves every response to a fixture file.
+
+    Requests are sent through the wrapped transport (a regular network
+    transport by default), and each response is stored as JSON in the
+    fixtures directory together with the measured latency. The API key is
+    removed from stored request URLs.
+    """
+
+    def __init__(self, fixtures_dir: str | Path, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.fixtures_dir.mkdir(parents=True, exist_ok=True)
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started_at = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        elapsed_ms = (time.monotonic() - started_at) * 1000
+
+        fixture = {
+            "request": {
+                "method": request.method,
+                "url": str(request.url.copy_remove_param("appid")),
+            },
+            "status_code": response.status_code,
+            "headers": {
+                name: value for name, value in response.headers.items()
+                if name.lower() in ("content-type", "retry-after")
+            },
+            "content": content.decode(),
+            "elapsed_ms": round(elapsed_ms, 3),
+        }
+        path = self.fixtures_dir / _get_fixture_name(request)
+        path.write_text(json.dumps(fixture, ensure_ascii=False, indent=2), encoding="utf-8")
+        logger.debug(f"Recorded response fixture: {path}")
+
+        # same response as replayed later (content is already decoded, so encoding headers are not kept)
+        return httpx.Response(
+            status_code=fixture["status_code"], headers=fixture["headers"], content=content, request=request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    HTTP transport that serves responses from fixture files.
+
+    Responses saved by RecordingTransport are returned without network access
+    after a latency sampled from the configured distribution. Requests without
+    a recorded response fail, so a replay never silently reaches the real API.
+    """
+
+    def __init__(self, fixtures_dir: str | Path, latency: Optional[ReplayLatency] = None):
+        self.fixtures_dir = Path(fixtures_dir)
+        self.latency = latency or ReplayLatency()
+        self._fixtures: Dict[str, Dict[str, Any]] = {}
+
+    def _get_fixture(self, request: httpx.Request) -> Dict[str, Any]:
+        """
+        Load fixture of a request (cached after the first read).
+
+        Raises:
+            LookupError: If no response was recorded for the request.
+        """
+        name = _get_fixture_name(request)
+        if name not in self._fixtures:
+            path = self.fixtures_dir / name
+            if not path.is_file():
+                raise LookupError(
+                    f"No recorded response for {request.method} {request.url.copy_remove_param('appid')}")
+            self._fixtures[name] = json.loads(path.read_text(encoding="utf-8"))
+        return self._fixtures[name]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        fixture = self._get_fixture(request)
+        latency = self.latency.sample(fixture.get("elapsed_ms"))
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        return httpx.Response(
+            status_code=fixture["status_code"],
+            headers=fixture["headers"],
+            content=fixture["content"].encode(),
+            request=request)
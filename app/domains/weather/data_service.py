@@ -1,27 +1,68 @@
-from app.domains.weather.clients import OpenWeatherMapClient
-from app.domains.weather.schemas import LocationWeatherSchema, LocationCoordSchema
+from typing import Optional
+
+from app.domains.weather.clients import OpenWeatherMapClient, weather_batcher
+from app.domains.weather.clients.open_weather_map_client import OpenWeatherMapWeatherBatcher, WeatherResponseSchema
+from app.domains.weather.schemas import FetchedLocationWeatherSchema, LocationCoordSchema, LocationWeatherSchema
+from app.exceptions import DeadlineExceededException, NotFoundException, ServiceUnavailableException
+from app.kernel.logs import logger
+from app.kernel.settings import open_weather_settings
 
 
 class WeatherDataService:
-    """Service for fetching and processing weather data from external APIs."""
+    """
+    Service for fetching and processing weather data from external APIs.
+
+    A preconfigured client (e.g. with a replay transport) may be passed instead
+    of the default one; batched requests then go through a batcher of that
+    client instead of the shared one.
+    """
 
-    def __init__(self):
-        self._client = OpenWeatherMapClient()
+    def __init__(self, client: Optional[OpenWeatherMapClient] = None):
+        self._client = client or OpenWeatherMapClient()
+        self._batcher = OpenWeatherMapWeatherBatcher(client=client) if client else weather_batcher
 
-    async def fetch_coord_weather_from_open_weather(self, coord: LocationCoordSchema) -> LocationWeatherSchema:
+    async def fetch_coord_weather_from_open_weather(self, coord: LocationCoordSchema) -> FetchedLocationWeatherSchema:
         """
         Fetch weather data for coordinates from OpenWeatherMap API.
 
+        When the city ID is known and batching is enabled, the request is resolved
+        as part of a group query. Otherwise, or if the group query fails or does
+        not return the city, weather is fetched by coordinates. A city ID missing
+        in the group response is not returned, so it is not used again.
+
         Args:
             coord: Geographic coordinates for weather data retrieval.
 
         Returns:
-            LocationWeatherSchema: Processed weather data in internal format.
+            FetchedLocationWeatherSchema: Processed weather data in internal format
+                with the city ID returned by the API (None if unknown).
         """
-        # Get city coordinates
+        city_id_usable = True
+        if open_weather_settings.batch_enabled and coord.city_id:
+            try:
+                weather_resp_data = await self._batcher.get_city_weather(coord.city_id)
+                return self._get_fetched_weather(weather_resp_data)
+            except (DeadlineExceededException, ServiceUnavailableException):
+                raise
+            except NotFoundException:
+                logger.warning(f"City ID {coord.city_id} is missing in group response, fetching by coordinates")
+                city_id_usable = False
+            except Exception as ex:
+                logger.warning(
+                    f"Batched request for city ID {coord.city_id} failed, fetching by coordinates: {str(ex)}")
+
         weather_resp_data = await self._client.get_location_weather(coord)
-        # Convert to our internal schema
-        return LocationWeatherSchema.from_open_weather_map_resp(weather_resp_data)
+        fetched_weather = self._get_fetched_weather(weather_resp_data)
+        if not city_id_usable and fetched_weather.city_id == coord.city_id:
+            fetched_weather.city_id = None
+        return fetched_weather
+
+    @staticmethod
+    def _get_fetched_weather(weather_resp_data: WeatherResponseSchema) -> FetchedLocationWeatherSchema:
+        """Convert API response to internal schema (city ID 0, returned for remote locations, is unknown)."""
+        return FetchedLocationWeatherSchema(
+            weather=LocationWeatherSchema.from_open_weather_map_resp(weather_resp_data),
+            city_id=weather_resp_data.id or None)
 
     async def fetch_city_geo(self, city_name: str) -> LocationCoordSchema:
         """
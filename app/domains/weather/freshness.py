@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.kernel.settings import weather_settings
+
+__all__ = [
+    "get_next_observation_at",
+    "get_weather_cache_ttl",
+]
+
+
+def get_next_observation_at(timestamp: int) -> int:
+    """
+    Estimate when the provider publishes the next observation.
+
+    Args:
+        timestamp: Unix timestamp of the current observation.
+
+    Returns:
+        int: Unix timestamp after which a newer observation is expected.
+    """
+    return timestamp + weather_settings.cache_update_interval
+
+
+def get_weather_cache_ttl(timestamp: int, now: Optional[int] = None) -> int:
+    """
+    Compute cache time to live of an observation.
+
+    The observation is cached until a newer one is expected, bounded by
+    the configured minimum (provider published late, avoid refetch loops)
+    and maximum (provider cadence changed, limit staleness).
+
+    Args:
+        timestamp: Unix timestamp of the observation.
+        now: Current Unix timestamp (optional, defaults to current time).
+
+    Returns:
+        int: Time to live in seconds.
+    """
+    now = now if now is not None else int(datetime.now(timezone.utc).timestamp())
+    ttl = get_next_observation_at(timestamp) - now
+    return min(max(ttl, weather_settings.cache_min_ttl), weather_settings.cache_max_ttl)
@@ -1,3 +1,7 @@
+from collections import Counter
+from typing import List, Optional
+
+from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 
 from app.domains.weather.schemas import CityFileInfoSchema
@@ -42,11 +46,14 @@ class DynamoDBWeatherEventRepository:
         """
         Store weather event information in DynamoDB.
 
+        Events are unique per city and observation timestamp: an event for an
+        already recorded observation is not rewritten.
+
         Args:
             city_file_info: Schema containing city name, timestamp and file path.
 
         Returns:
-            dict: DynamoDB put_item response.
+            dict: DynamoDB put_item response, None if the observation is already recorded.
 
         Raises:
             ClientError: For DynamoDB operation errors (auto-creates table if missing).
@@ -57,12 +64,73 @@ class DynamoDBWeatherEventRepository:
             'timestamp': city_file_info.timestamp,
             'file_path': city_file_info.file_name
         }
+        condition_expression = "attribute_not_exists(city_name)"
 
         try:
-            return await dynamodb_service.put_item(self.table_name, item)
+            return await dynamodb_service.put_item(self.table_name, item, condition_expression)
         except ClientError as ex:
             error_code = ex.response['Error']['Code']
+            if error_code == "ConditionalCheckFailedException":
+                return None
             if error_code == "ResourceNotFoundException":
                 await self.create_table()
-                return await dynamodb_service.put_item(self.table_name, item)
+                return await dynamodb_service.put_item(self.table_name, item, condition_expression)
             raise
+
+    async def get_most_requested_cities(
+            self, limit: int, scan_limit: Optional[int] = None, exclude_prefix: Optional[str] = None
+    ) -> List[str]:
+        """
+        Get cities with the most weather events in history.
+
+        Args:
+            limit: Maximum number of cities to return.
+            scan_limit: Maximum number of history events to scan (optional).
+            exclude_prefix: Skip city names starting with this prefix (optional).
+
+        Returns:
+            List[str]: City names ordered by event count, most requested first.
+        """
+        try:
+            items = await dynamodb_service.scan_items(
+                self.table_name,
+                projection="city_name",
+                limit=scan_limit)
+        except ClientError as ex:
+            if ex.response['Error']['Code'] == "ResourceNotFoundException":
+                return []
+            raise
+
+        counter = Counter(
+            item['city_name'] for item in items
+            if not exclude_prefix or not item['city_name'].startswith(exclude_prefix))
+        return [city_name for city_name, _ in counter.most_common(limit)]
+
+    async def get_latest_weather_event(self, city_name: str) -> Optional[CityFileInfoSchema]:
+        """
+        Get the most recent weather event for a city.
+
+        Args:
+            city_name: Name of the city.
+
+        Returns:
+            Optional[CityFileInfoSchema]: Latest event info if the city has history, None otherwise.
+        """
+        try:
+            items = await dynamodb_service.query_items(
+                self.table_name,
+                key_condition=Key('city_name').eq(city_name),
+                scan_index_forward=False,
+                limit=1)
+        except ClientError as ex:
+            if ex.response['Error']['Code'] == "ResourceNotFoundException":
+                return None
+            raise
+
+        if not items:
+            return None
+
+        return CityFileInfoSchema.model_validate({
+            "city_name": items[0]['city_name'],
+            "timestamp": int(items[0]['timestamp'])
+        })
@@ -1,26 +1,139 @@
-from typing import Optional
+import base64
+from datetime import datetime, timezone
+from typing import Optional, Dict, List
 
-from app.domains.weather.schemas import LocationCoordSchema, LocationWeatherSchema
-from app.infrastructure.cache import CacheManager
+from app.domains.weather.schemas import LocationCoordSchema, CachedCityWeatherSchema, CityCacheSchema
+from app.infrastructure.cache import CacheManager, CacheEngineName, RedisLeaseLock
+from app.kernel.settings import weather_settings
+from app.utils.http import SUPPORTED_ENCODINGS, compress_content
 
 
 class WeatherCacheRepository:
     """
     Cache repository for weather data and city coordinates.
 
-    Manages caching of city geographical data and weather file paths
-    with configurable TTL and automatic serialization.
+    Keeps all cached data of a city in one hash ('city:{<city_name>}'):
+    coordinates ('lat', 'lon', 'city_id'), the latest weather file pointer
+    ('file_path', 'timestamp', 'content_hash'), its logical expiry
+    ('weather_expires_at') and optionally the inline weather payload ('payload')
+    with its compressed variants in the stored codings ('payload_<encoding>',
+    base64-encoded). The whole city is read with one HGETALL and written atomically. Weather fields expire
+    logically, so coordinates outlive them in the same hash.
+
+    Cities with stored observations are indexed by coordinates in a shared
+    geospatial index ('weatherGeo') for nearest-observation lookups. Weather
+    requests per city are counted in a score index ('cityRequests'), which
+    ranks cities for cache warm-up.
+    Observations fetched for arbitrary coordinates are cached as cities
+    named after their rounded coordinates ('coord:<lat>,<lon>'). Such
+    pseudo-cities are not indexed, do not store inline payloads and expire
+    with a key TTL, so arbitrary lookups do not grow the cache without limit.
+
+    Per-city keys carry the city name as hash tag ('{<city_name>}'), so in
+    Redis Cluster all keys of a city are stored in one slot.
+
+    Cached data is stored by the engine from `weather_settings.cache_engine`
+    unless given explicitly. Locks and weather update notifications always
+    use Redis, as they coordinate all application instances.
     """
-    city_geo_key_prefix = "cityGeo"
-    city_weather_key_prefix = "cityWeather"
+    city_key_prefix = "city"
+    coord_city_name_prefix = "coord"
+    weather_geo_key = "weatherGeo"
+    city_requests_key = "cityRequests"
+    # nearest members searched per requested fresh city
+    nearby_search_overfetch = 4
+    city_weather_updates_channel_prefix = "cityWeatherUpdates"
+    city_weather_lock_key_prefix = "cityWeatherLock"
+    warmup_lock_key = "weatherWarmupLock"
+
+    def __init__(self, cache_engine: Optional[CacheEngineName] = None):
+        self._cache = CacheManager(engine=cache_engine or weather_settings.cache_engine)
+
+    def _get_city_cache_key(self, city_name: str) -> str:
+        """Generate cache key for city data hash."""
+        return f"{self.city_key_prefix}:{{{city_name}}}"
+
+    def get_coord_city_name(self, coord: LocationCoordSchema) -> str:
+        """
+        Generate city name for an observation fetched by coordinates.
+
+        Coordinates are rounded to 2 decimal places (about 1 km), so requests
+        for nearby points share one cached observation.
+        """
+        return f"{self.coord_city_name_prefix}:{coord.lat:.2f},{coord.lon:.2f}"
+
+    def is_coord_city_name(self, city_name: str) -> bool:
+        """Check whether city name belongs to an observation fetched by coordinates."""
+        return city_name.startswith(f"{self.coord_city_name_prefix}:")
+
+    def get_city_weather_updates_channel(self, city_name: str) -> str:
+        """Generate pub/sub channel name for city weather updates."""
+        return f"{self.city_weather_updates_channel_prefix}:{city_name}"
+
+    def get_city_weather_lock(self, city_name: str) -> RedisLeaseLock:
+        """
+        Create distributed lease lock guarding the weather refresh of a city.
+
+        Args:
+            city_name: Name of the city.
+
+        Returns:
+            RedisLeaseLock: Lock shared by all application instances.
+        """
+        return RedisLeaseLock(
+            key=f"{self.city_weather_lock_key_prefix}:{{{city_name}}}",
+            lease_ms=weather_settings.single_flight_lease_ms)
+
+    def get_warmup_lock(self) -> RedisLeaseLock:
+        """
+        Create distributed lease lock taken by the worker warming up the cache.
+
+        The lease lasts the maximum cache TTL, so the lock is not released:
+        workers starting while warmed entries may still be fresh skip warm-up.
+
+        Returns:
+            RedisLeaseLock: Lock shared by all application instances.
+        """
+        return RedisLeaseLock(key=self.warmup_lock_key, lease_ms=weather_settings.cache_max_ttl * 1000)
+
+    @staticmethod
+    def _parse_city_cache(data: Dict[str, str]) -> CityCacheSchema:
+        """Convert city hash fields to schema."""
+        city_cache = CityCacheSchema()
+        if data.get("lat") and data.get("lon"):
+            city_cache.coord = LocationCoordSchema(
+                lat=data["lat"],
+                lon=data["lon"],
+                # city ID 0 is not a city (stored by earlier versions for remote locations)
+                city_id=int(data.get("city_id") or 0) or None)
+
+        if data.get("file_path") and data.get("timestamp"):
+            expires_at = data.get("weather_expires_at")
+            now = int(datetime.now(timezone.utc).timestamp())
+            city_cache.weather = CachedCityWeatherSchema(
+                file_path=data["file_path"],
+                timestamp=data["timestamp"],
+                ttl=int(expires_at) - now if expires_at else None,
+                payload=data["payload"].encode("utf-8") if data.get("payload") else None,
+                compressed_payloads={
+                    encoding: base64.b64decode(data[f"payload_{encoding}"])
+                    for encoding in SUPPORTED_ENCODINGS if data.get(f"payload_{encoding}")},
+                content_hash=data.get("content_hash") or None)
+
+        return city_cache
+
+    async def get_city_cache(self, city_name: str) -> CityCacheSchema:
+        """
+        Retrieve all cached data of a city with one round trip.
 
-    def _get_city_geo_cache_key(self, city_name: str) -> str:
-        """Generate cache key for city geographical coordinates."""
-        return f"{self.city_geo_key_prefix}:{city_name}"
+        Args:
+            city_name: Name of the city.
 
-    def _get_city_weather_cache_key(self, city_name: str) -> str:
-        """Generate cache key for city weather data."""
-        return f"{self.city_weather_key_prefix}:{city_name}"
+        Returns:
+            CityCacheSchema: Cached coordinates and weather pointer (fields are None if not cached).
+        """
+        data = await self._cache.get_mapping(key=self._get_city_cache_key(city_name))
+        return self._parse_city_cache(data)
 
     async def get_city_geo(self, city_name: str) -> Optional[LocationCoordSchema]:
         """
@@ -32,10 +145,7 @@ class WeatherCacheRepository:
         Returns:
             Optional[LocationCoordSchema]: City coordinates if cached, None otherwise.
         """
-        val = await CacheManager().get(key=self._get_city_geo_cache_key(city_name))
-        if val:
-            return LocationCoordSchema.model_validate(val)
-        return None
+        return (await self.get_city_cache(city_name)).coord
 
     async def set_city_geo(self, city_name, coord: LocationCoordSchema):
         """
@@ -45,32 +155,179 @@ class WeatherCacheRepository:
             city_name: Name of the city.
             coord: Location coordinates to cache.
         """
-        return await CacheManager().set(
-            key=self._get_city_geo_cache_key(city_name),
-            value=coord.model_dump_json())
+        return await self._cache.set_mapping(
+            key=self._get_city_cache_key(city_name),
+            mapping={
+                "lat": coord.lat,
+                "lon": coord.lon,
+                "city_id": coord.city_id if coord.city_id is not None else "",
+            })
 
-    async def get_city_weather_file(self, city_name: str) -> str:
+    async def get_city_weather_file(self, city_name: str) -> Optional[CachedCityWeatherSchema]:
         """
-        Retrieve cached weather file path for city.
+        Retrieve cached weather file pointer for city.
 
         Args:
             city_name: Name of the city.
 
         Returns:
-            str: Cached file path for weather data.
+            Optional[CachedCityWeatherSchema]: Weather file pointer if cached and not expired, None otherwise.
         """
-        return await CacheManager().get(key=self._get_city_weather_cache_key(city_name))
+        return (await self.get_city_cache(city_name)).fresh_weather
 
-    async def set_city_weather_file(self, city_name: str, file_path: str, ttl: Optional[int] = None):
+    async def set_city_weather_file(
+            self, city_name: str, file_path: str, timestamp: int,
+            ttl: Optional[int] = None, payload: Optional[bytes] = None,
+            content_hash: Optional[str] = None
+    ):
         """
-        Cache weather file path for city.
+        Cache weather file pointer for city.
+
+        The inline payload is stored with its variants compressed in
+        `weather_settings.stored_encodings`. Pointers of observations fetched by
+        coordinates are stored without inline payload and removed with the whole
+        hash after the maximum cache TTL.
 
         Args:
             city_name: Name of the city.
             file_path: Path to weather data file.
-            ttl: Time to live in seconds (optional).
+            timestamp: Unix timestamp of the weather observation.
+            ttl: Time to live of the weather pointer in seconds (optional).
+            payload: JSON-encoded weather data to store inline (optional).
+            content_hash: SHA-256 hex digest of the weather file content (optional).
+        """
+        key_ttl = None
+        if self.is_coord_city_name(city_name):
+            payload = None
+            key_ttl = weather_settings.cache_max_ttl
+
+        # variants of previous payloads in codings that are no longer stored are cleared
+        compressed_payloads = {f"payload_{encoding}": "" for encoding in SUPPORTED_ENCODINGS}
+        if payload:
+            for encoding in weather_settings.get_stored_encodings():
+                compressed_payloads[f"payload_{encoding}"] = base64.b64encode(
+                    compress_content(payload, encoding)).decode("ascii")
+
+        now = int(datetime.now(timezone.utc).timestamp())
+        return await self._cache.set_mapping(
+            key=self._get_city_cache_key(city_name),
+            mapping={
+                "file_path": file_path,
+                "timestamp": timestamp,
+                "weather_expires_at": now + ttl if ttl else "",
+                "payload": payload.decode("utf-8") if payload else "",
+                **compressed_payloads,
+                "content_hash": content_hash or "",
+            },
+            ttl=key_ttl)
+
+    async def add_city_weather_geo(self, city_name: str, coord: LocationCoordSchema) -> bool:
+        """
+        Index city with stored weather by its coordinates.
+
+        Observations fetched by coordinates are not indexed.
+
+        Args:
+            city_name: Name of the city.
+            coord: City coordinates.
+
+        Returns:
+            bool: True if indexed, False if not indexed or failed.
+        """
+        if self.is_coord_city_name(city_name):
+            return False
+
+        return await self._cache.geo_add(
+            key=self.weather_geo_key,
+            member=city_name,
+            lat=coord.lat,
+            lon=coord.lon)
+
+    async def get_nearby_city_weather(
+            self, coord: LocationCoordSchema, radius_km: float, count: int
+    ) -> List[CachedCityWeatherSchema]:
+        """
+        Find fresh cached weather of cities within radius, nearest first.
+
+        More members than requested are searched, so stale nearest cities do
+        not hide fresh ones further away. Members with expired weather are
+        removed from the index; they are indexed again with their next observation.
+
+        Args:
+            coord: Coordinates of the search center.
+            radius_km: Search radius in kilometers.
+            count: Maximum number of fresh cities to return.
+
+        Returns:
+            List[CachedCityWeatherSchema]: Fresh weather file pointers ordered by distance.
+        """
+        city_names = await self._cache.geo_search(
+            key=self.weather_geo_key,
+            lat=coord.lat,
+            lon=coord.lon,
+            radius_km=radius_km,
+            count=count * self.nearby_search_overfetch)
+
+        cities_data = await self._cache.get_mappings(
+            keys=[self._get_city_cache_key(city_name) for city_name in city_names])
+
+        result = []
+        stale_city_names = []
+        for city_name, data in zip(city_names, cities_data):
+            city_cache = self._parse_city_cache(data)
+            if city_cache.fresh_weather:
+                if len(result) < count:
+                    result.append(city_cache.fresh_weather)
+            elif city_cache.weather:
+                # missing hashes are kept, they may be a failed read rather than a removed city
+                stale_city_names.append(city_name)
+
+        await self._cache.geo_remove(key=self.weather_geo_key, members=stale_city_names)
+        return result
+
+    async def increment_city_requests(self, counts: Dict[str, int]) -> bool:
+        """
+        Add weather request counts of cities to the request ranking.
+
+        Observations fetched by coordinates are not ranked.
+
+        Args:
+            counts: Number of new requests by city name.
+
+        Returns:
+            bool: True if stored successfully, False otherwise.
+        """
+        return await self._cache.score_increment(
+            key=self.city_requests_key,
+            increments={
+                city_name: count for city_name, count in counts.items()
+                if not self.is_coord_city_name(city_name)})
+
+    async def get_most_requested_cities(self, limit: int) -> List[str]:
+        """
+        Get cities with the most weather requests.
+
+        Args:
+            limit: Maximum number of cities to return.
+
+        Returns:
+            List[str]: City names ordered by request count, most requested first
+                (empty if no requests were counted or cache is unavailable).
+        """
+        return await self._cache.score_top(key=self.city_requests_key, count=limit)
+
+    async def publish_city_weather_update(self, city_name: str, timestamp: int, payload: bytes) -> bool:
+        """
+        Publish new weather observation for city to all application instances.
+
+        Message format is '{timestamp}\n{payload}', so subscribers can skip
+        outdated observations without parsing the payload.
+
+        Args:
+            city_name: Name of the city.
+            timestamp: Unix timestamp of the weather observation.
+            payload: JSON-encoded LocationWeatherSchema.
         """
-        return await CacheManager().set(
-            key=self._get_city_weather_cache_key(city_name),
-            value=file_path,
-            ttl=ttl)
+        return await CacheManager(engine="redis").publish(
+            channel=self.get_city_weather_updates_channel(city_name),
+            message=f"{timestamp}\n{payload.decode('utf-8')}")
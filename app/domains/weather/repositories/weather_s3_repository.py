@@ -1,10 +1,15 @@
+import asyncio
+import hashlib
 import json
 from typing import Optional
 
 from botocore.exceptions import ClientError
 
-from app.domains.weather.schemas import CityFileInfoSchema, LocationWeatherSchema
+from app.domains.weather.schemas import LocationWeatherSchema
 from app.infrastructure.aws import s3_service
+from app.kernel.logs import logger
+from app.kernel.settings import weather_settings
+from app.utils.http import ENCODING_FILE_SUFFIXES, compress_content
 
 
 class WeatherS3Repository:
@@ -13,34 +18,46 @@ class WeatherS3Repository:
 
     Manages saving and retrieving weather data files in S3
     with automatic bucket creation and JSON serialization.
+    Files are stored with a content hash in object metadata, so
+    payloads can be served as raw bytes without re-validation.
+    Compressed variants of each file in the codings of
+    `weather_settings.stored_encodings` are stored next to it
+    ('{file_path}.zst', '.br', '.gz') to be served without recompression.
     """
     bucket_name = "weather-data"
+    content_hash_metadata_key = "content-sha256"
+
+    @staticmethod
+    def get_content_hash(content: bytes) -> str:
+        """Calculate SHA-256 hex digest of weather file content."""
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def get_variant_file_path(file_path: str, encoding: Optional[str]) -> str:
+        """Get S3 object key of a compressed file variant (original key if encoding is None)."""
+        return f"{file_path}{ENCODING_FILE_SUFFIXES[encoding]}" if encoding else file_path
 
     async def create_bucket(self):
         """Create S3 bucket for weather data storage."""
         await s3_service.create_bucket(self.bucket_name)
 
-    async def save_weather_file(self, file_path: str, weather_data: LocationWeatherSchema) -> bool:
+    async def _put_object(self, key: str, body: bytes, content_encoding: Optional[str] = None) -> bool:
         """
-        Save weather data to S3 as JSON file.
-
-        Args:
-            file_path: S3 object key for the weather file.
-            weather_data: Weather data to save.
-
-        Returns:
-            bool: True if saved successfully.
+        Upload object with content hash metadata.
 
         Raises:
             ClientError: For S3 operation errors (auto-creates bucket if missing).
         """
-        content = weather_data.model_dump_json(indent=2)
+        metadata = {self.content_hash_metadata_key: self.get_content_hash(body)}
+        if content_encoding:
+            metadata["content-encoding"] = content_encoding
 
         put_object_params = {
             "bucket_name": self.bucket_name,
-            "key": file_path,
-            "body": content.encode('utf-8'),
+            "key": key,
+            "body": body,
             "content_type": "application/json",
+            "metadata": metadata,
         }
 
         try:
@@ -52,6 +69,72 @@ class WeatherS3Repository:
                 return await s3_service.put_object(**put_object_params)
             raise
 
+    async def save_weather_file(
+            self, file_path: str, payload: bytes,
+            stored_content_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Save encoded weather data to S3 as JSON file together with compressed variants.
+
+        The original file is uploaded first, so variants never exist without it.
+        Nothing is written when the file (same observation timestamp) is known
+        to be stored with the same content.
+
+        Args:
+            file_path: S3 object key for the weather file.
+            payload: JSON-encoded LocationWeatherSchema (validated before encoding).
+            stored_content_hash: Content hash of the file already stored under file_path (optional).
+
+        Returns:
+            bool: True if saved, False if the same content is already stored.
+
+        Raises:
+            ClientError: For S3 operation errors (auto-creates bucket if missing).
+        """
+        if stored_content_hash == self.get_content_hash(payload):
+            logger.debug(f"Weather file is unchanged, skipping upload: {file_path}")
+            return False
+
+        await self._put_object(file_path, payload)
+        await asyncio.gather(*(
+            self._put_object(
+                self.get_variant_file_path(file_path, encoding),
+                compress_content(payload, encoding),
+                content_encoding=encoding)
+            for encoding in weather_settings.get_stored_encodings()))
+        return True
+
+    async def get_weather_file_payload(self, file_path: str, encoding: Optional[str] = None) -> Optional[bytes]:
+        """
+        Retrieve weather data from S3 file as JSON bytes.
+
+        Content is returned as stored when it matches the content hash written
+        with the file. Files without a matching hash (e.g. written by older
+        versions) are validated and re-encoded.
+
+        Args:
+            file_path: S3 object key for the weather file.
+            encoding: Content coding of the compressed variant to read (optional).
+                Only verified variants are returned, otherwise None.
+
+        Returns:
+            Optional[bytes]: JSON-encoded (or compressed) weather data if file exists, None otherwise.
+        """
+        result = await s3_service.get_object(self.bucket_name, self.get_variant_file_path(file_path, encoding))
+        if not result:
+            return None
+
+        content, metadata = result
+        if metadata.get(self.content_hash_metadata_key) == self.get_content_hash(content):
+            return content
+
+        if encoding:
+            logger.debug(f"Compressed weather file content hash mismatch: {file_path} ({encoding})")
+            return None
+
+        logger.debug(f"Weather file content hash mismatch, validating content: {file_path}")
+        return LocationWeatherSchema.model_validate_json(content).model_dump_json().encode("utf-8")
+
     async def get_weather_file_content(self, file_path: str) -> Optional[LocationWeatherSchema]:
         """
         Retrieve weather data from S3 file.
@@ -0,0 +1,65 @@
+import asyncio
+from collections import Counter
+from typing import Optional
+
+from app.kernel.logs import logger
+from app.kernel.settings import weather_settings
+from .repositories import WeatherCacheRepository
+
+
+class CityRequestCounter:
+    """
+    Counter of weather requests per city ranking cities for cache warm-up.
+
+    Requests are counted in worker memory and added to the request ranking
+    in the cache every `request_count_flush_interval` seconds with one write,
+    so counting does not add a cache round trip to every request. Counts
+    collected since the last write are lost if the worker crashes.
+    """
+
+    _counts: Counter = Counter()
+    _task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def count(cls, city_name: str):
+        """Count a weather request for a city."""
+        cls._counts[city_name] += 1
+
+    @classmethod
+    async def start(cls):
+        """Start writing request counts periodically."""
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls._run())
+
+    @classmethod
+    async def stop(cls):
+        """Stop periodic writes and write the remaining counts."""
+        if cls._task is not None and not cls._task.done():
+            cls._task.cancel()
+        cls._task = None
+        await cls.flush()
+
+    @classmethod
+    async def flush(cls) -> bool:
+        """
+        Write collected request counts to the request ranking.
+
+        Counts that fail to be written are dropped rather than retried, so an
+        unavailable cache does not grow the counter.
+
+        Returns:
+            bool: True if written successfully (or nothing to write), False otherwise.
+        """
+        if not cls._counts:
+            return True
+
+        counts, cls._counts = cls._counts, Counter()
+        return await WeatherCacheRepository().increment_city_requests(counts)
+
+    @classmethod
+    async def _run(cls):
+        """Write request counts every flush interval."""
+        while True:
+            await asyncio.sleep(weather_settings.request_count_flush_interval)
+            if not await cls.flush():
+                logger.warning("Failed to write city request counts")
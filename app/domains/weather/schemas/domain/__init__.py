@@ -1,3 +1,6 @@
 from .location_coord import LocationCoordSchema
 from .location_weather import LocationWeatherSchema
+from .fetched_location_weather import FetchedLocationWeatherSchema
 from .city_file_info import CityFileInfoSchema
+from .weather_payload import CachedCityWeatherSchema, WeatherPayloadSchema
+from .city_cache import CityCacheSchema
@@ -0,0 +1,29 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .location_coord import LocationCoordSchema
+from .weather_payload import CachedCityWeatherSchema
+
+__all__ = [
+    "CityCacheSchema",
+]
+
+
+class CityCacheSchema(BaseModel):
+    """
+    Schema for all cached data of a city.
+
+    Attributes:
+        coord: Cached city coordinates (None if not cached).
+        weather: Cached weather file pointer, including expired ones (None if not cached).
+    """
+    coord: Optional[LocationCoordSchema] = None
+    weather: Optional[CachedCityWeatherSchema] = None
+
+    @property
+    def fresh_weather(self) -> Optional[CachedCityWeatherSchema]:
+        """Cached weather file pointer if it is not expired."""
+        if self.weather and not self.weather.is_expired:
+            return self.weather
+        return None
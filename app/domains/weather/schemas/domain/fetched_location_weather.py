@@ -0,0 +1,22 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .location_weather import LocationWeatherSchema
+
+
+__all__ = [
+    "FetchedLocationWeatherSchema",
+]
+
+
+class FetchedLocationWeatherSchema(BaseModel):
+    """
+    Schema for weather fetched from the external API.
+
+    Attributes:
+        weather: Processed weather data in internal format.
+        city_id: OpenWeatherMap city ID of the location (None if not returned).
+    """
+    weather: LocationWeatherSchema
+    city_id: Optional[int] = None
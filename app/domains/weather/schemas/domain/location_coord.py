@@ -1,3 +1,5 @@
+from typing import Optional
+
 from pydantic import BaseModel
 
 
@@ -13,6 +15,8 @@ class LocationCoordSchema(BaseModel):
     Attributes:
         lat: Latitude coordinate.
         lon: Longitude coordinate.
+        city_id: OpenWeatherMap city ID (known after the first weather fetch, optional).
     """
     lat: float
     lon: float
+    city_id: Optional[int] = None
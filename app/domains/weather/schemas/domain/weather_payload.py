@@ -0,0 +1,51 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+__all__ = [
+    "CachedCityWeatherSchema",
+    "WeatherPayloadSchema",
+]
+
+
+class CachedCityWeatherSchema(BaseModel):
+    """
+    Schema for a cached city weather file pointer.
+
+    Attributes:
+        file_path: Path to the weather data file.
+        timestamp: Unix timestamp of the weather observation.
+        ttl: Remaining cache time to live in seconds (None if it never expires,
+            zero or negative if expired).
+        payload: Inline JSON-encoded LocationWeatherSchema (optional).
+        compressed_payloads: Inline compressed variants of the payload by content coding.
+        content_hash: SHA-256 hex digest of the weather file content (optional).
+    """
+    file_path: str
+    timestamp: int
+    ttl: Optional[int] = None
+    payload: Optional[bytes] = None
+    compressed_payloads: Dict[str, bytes] = {}
+    content_hash: Optional[str] = None
+
+    @property
+    def is_expired(self) -> bool:
+        """Whether the cached observation is past its cache TTL."""
+        return self.ttl is not None and self.ttl <= 0
+
+
+class WeatherPayloadSchema(BaseModel):
+    """
+    Schema for JSON-encoded weather data ready to be sent as a response.
+
+    Attributes:
+        content: JSON-encoded LocationWeatherSchema.
+        timestamp: Unix timestamp of the weather observation.
+        ttl: Remaining cache time to live in seconds (None if unknown).
+        content_encoding: Content coding of compressed content (None if not compressed).
+    """
+    content: bytes
+    timestamp: int
+    ttl: Optional[int] = None
+    content_encoding: Optional[str] = None
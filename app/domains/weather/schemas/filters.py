@@ -2,9 +2,12 @@ import re
 
 from pydantic import BaseModel, Field, field_validator
 
+from app.kernel.settings import weather_settings
+
 
 __all__ = [
     "FetchCityWeatherFiltersSchema",
+    "FetchNearbyWeatherFiltersSchema",
 ]
 
 
@@ -69,3 +72,23 @@ class FetchCityWeatherFiltersSchema(BaseModel):
                 raise ValueError(f"Invalid city name format: '{val}'")
 
         return " ".join(word.lower() for word in val.split())
+
+
+class FetchNearbyWeatherFiltersSchema(BaseModel):
+    """
+    Filters used for looking up weather near coordinates.
+
+    Attributes:
+        lat: Latitude of the location.
+        lon: Longitude of the location.
+        radius: Search radius in kilometers for cached observations.
+    """
+
+    lat: float = Field(description="Latitude", ge=-90, le=90, examples=[50.45])
+    lon: float = Field(description="Longitude", ge=-180, le=180, examples=[30.52])
+    radius: float = Field(
+        default_factory=lambda: weather_settings.nearby_default_radius_km,
+        description="Search radius in kilometers",
+        gt=0,
+        le=weather_settings.nearby_max_radius_km,
+        examples=[5])
@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.kernel.logs import logger
+from app.kernel.settings import weather_settings
+from .freshness import get_next_observation_at, get_weather_cache_ttl
+from .repositories import WeatherCacheRepository, WeatherS3Repository, DynamoDBWeatherEventRepository
+from .schemas import LocationCoordSchema
+
+
+class WeatherCacheWarmupService:
+    """
+    Startup cache warm-up for the most requested cities.
+
+    Ranks cities by the request counts kept in the cache (see CityRequestCounter),
+    or by request history in DynamoDB when no requests were counted yet, and
+    preloads city coordinates and the latest weather file pointers into the
+    cache, so a fresh deploy or a flushed cache does not send every city to
+    the external API at once. Tracks warm-up coverage used for readiness reporting.
+
+    The shared Redis cache is warmed up by one worker of all instances, which
+    takes the warm-up lease lock; other workers skip warm-up. Local caches are
+    warmed up by every worker.
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _coverage: float = 0.0
+    _completed: bool = False
+
+    def __init__(self):
+        self._cache_repository = WeatherCacheRepository()
+        self._s3_repository = WeatherS3Repository()
+        self._dynamodb_repository = DynamoDBWeatherEventRepository()
+
+    @classmethod
+    async def start(cls):
+        """
+        Start cache warm-up in background.
+
+        Readiness is reported immediately when warm-up is disabled.
+        """
+        if not weather_settings.warmup_enabled:
+            cls._coverage = 1.0
+            cls._completed = True
+            return
+
+        if cls._task is None:
+            cls._task = asyncio.create_task(cls().warm_up())
+
+    @classmethod
+    async def stop(cls):
+        """Cancel warm-up if it is still running."""
+        if cls._task is not None and not cls._task.done():
+            cls._task.cancel()
+        cls._task = None
+
+    @classmethod
+    def get_coverage(cls) -> float:
+        """Get share of top cities warmed so far (0-1)."""
+        return cls._coverage
+
+    @classmethod
+    def is_ready(cls) -> bool:
+        """
+        Check whether warm-up reached the configured coverage threshold.
+
+        A warm-up that finished below the threshold (e.g. history references
+        files that no longer exist) is still reported as ready to avoid
+        blocking the service forever.
+        """
+        return cls._completed or cls._coverage >= weather_settings.warmup_coverage_threshold
+
+    async def warm_up(self) -> float:
+        """
+        Preload cache entries for the most requested cities.
+
+        Returns:
+            float: Share of top cities that were warmed (0-1).
+        """
+        cls = type(self)
+        if not await self._acquire_warmup_lock():
+            cls._coverage = 1.0
+            cls._completed = True
+            logger.info("Cache warm-up skipped: shared cache is warmed up by another worker")
+            return cls._coverage
+
+        cities = await self._cache_repository.get_most_requested_cities(limit=weather_settings.warmup_top_cities)
+        if not cities:
+            # no requests counted yet (first start or flushed cache)
+            try:
+                cities = await self._dynamodb_repository.get_most_requested_cities(
+                    limit=weather_settings.warmup_top_cities,
+                    scan_limit=weather_settings.warmup_history_scan_limit,
+                    # observations fetched by coordinates are not cities to warm up
+                    exclude_prefix=f"{WeatherCacheRepository.coord_city_name_prefix}:")
+            except Exception as ex:
+                logger.error(f"Cache warm-up failed to read request history: {str(ex)}")
+                cls._completed = True
+                return cls._coverage
+
+        if not cities:
+            cls._coverage = 1.0
+            cls._completed = True
+            logger.info("Cache warm-up skipped: no request history")
+            return cls._coverage
+
+        semaphore = asyncio.Semaphore(weather_settings.warmup_concurrency)
+        warmed = 0
+
+        async def warm_up_city(city_name: str):
+            nonlocal warmed
+            async with semaphore:
+                try:
+                    is_warmed = await self.warm_up_city(city_name)
+                except Exception as ex:
+                    logger.warning(f"Cache warm-up failed for city '{city_name}': {str(ex)}")
+                    is_warmed = False
+
+            if is_warmed:
+                warmed += 1
+                cls._coverage = warmed / len(cities)
+
+        await asyncio.gather(*(warm_up_city(city_name) for city_name in cities))
+        cls._completed = True
+        logger.info(f"Cache warm-up finished: {warmed}/{len(cities)} cities warmed")
+        return cls._coverage
+
+    async def _acquire_warmup_lock(self) -> bool:
+        """
+        Take the warm-up lock of the shared cache.
+
+        Returns:
+            bool: True if this worker should warm up the cache (lock taken, cache
+                is local or Redis is unavailable), False if another worker does.
+        """
+        if weather_settings.cache_engine != "redis":
+            return True
+
+        try:
+            return await self._cache_repository.get_warmup_lock().acquire()
+        except Exception as ex:
+            logger.warning(f"Failed to take cache warm-up lock, warming up without it: {str(ex)}")
+            return True
+
+    async def warm_up_city(self, city_name: str) -> bool:
+        """
+        Preload cache entries for a single city from its latest history event.
+
+        Coordinates are taken from the stored weather file, so warm-up does not
+        call the external API. The weather file pointer is cached only if no
+        newer observation is expected yet.
+
+        Args:
+            city_name: Name of the city.
+
+        Returns:
+            bool: True if city coordinates are cached after warm-up.
+        """
+        city_cache = await self._cache_repository.get_city_cache(city_name)
+        has_geo = city_cache.coord is not None
+        has_weather = city_cache.fresh_weather is not None
+        if has_geo and has_weather:
+            return True
+
+        city_file_info = await self._dynamodb_repository.get_latest_weather_event(city_name)
+        if not city_file_info:
+            return has_geo
+
+        location_weather = await self._s3_repository.get_weather_file_content(city_file_info.file_name)
+        if not location_weather:
+            return has_geo
+
+        coord = city_cache.coord or LocationCoordSchema(
+            lat=location_weather.coordinates.lat,
+            lon=location_weather.coordinates.lon)
+        if not has_geo:
+            await self._cache_repository.set_city_geo(city_name, coord=coord)
+
+        now = int(datetime.now(timezone.utc).timestamp())
+        if not has_weather and get_next_observation_at(city_file_info.timestamp) > now:
+            await self._cache_repository.set_city_weather_file(
+                city_name=city_name,
+                file_path=city_file_info.file_name,
+                timestamp=city_file_info.timestamp,
+                ttl=get_weather_cache_ttl(city_file_info.timestamp, now=now))
+            await self._cache_repository.add_city_weather_geo(city_name, coord)
+
+        return True
@@ -1,7 +1,14 @@
+from typing import Dict, Optional
+
 __all__ = [
     "NotFoundException",
+    "ForbiddenException",
     "BadRequestException",
     "BadGatewayException",
+    "ServiceUnavailableException",
+    "TooManyRequestsException",
+    "CircuitOpenException",
+    "DeadlineExceededException",
 ]
 
 
@@ -10,6 +17,11 @@ class NotFoundException(Exception):
     pass
 
 
+class ForbiddenException(Exception):
+    """Exception raised when the client is not allowed to access the resource."""
+    pass
+
+
 class BadRequestException(Exception):
     """Exception raised for invalid client requests or parameters."""
     pass
@@ -18,3 +30,39 @@ class BadRequestException(Exception):
 class BadGatewayException(Exception):
     """Exception raised when external service is unavailable or returns errors."""
     pass
+
+
+class ServiceUnavailableException(Exception):
+    """
+    Exception raised when the service sheds load and the request should be retried later.
+
+    Attributes:
+        retry_after: Seconds after which the client may retry (optional).
+    """
+
+    def __init__(self, message: str, retry_after: Optional[int] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class TooManyRequestsException(Exception):
+    """
+    Exception raised when a client exceeds its rate limit.
+
+    Attributes:
+        headers: Rate limit response headers (including Retry-After).
+    """
+
+    def __init__(self, message: str, headers: Optional[Dict[str, str]] = None):
+        super().__init__(message)
+        self.headers = headers or {}
+
+
+class CircuitOpenException(Exception):
+    """Exception raised when a call is rejected because the dependency circuit breaker is open."""
+    pass
+
+
+class DeadlineExceededException(Exception):
+    """Exception raised when the request deadline is reached before the operation completes."""
+    pass
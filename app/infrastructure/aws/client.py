@@ -1,6 +1,9 @@
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, AsyncExitStack
+from typing import Optional
 
 import aioboto3
+from botocore.config import Config
+
 from app.kernel.settings import aws_settings
 
 
@@ -10,6 +13,8 @@ class AWSClient:
 
     Provides async context managers for AWS services with configurable
     endpoint URLs for LocalStack support and credential management.
+    After initialization, service clients are kept open for the lifetime
+    of the worker process so their connection pools are reused.
     """
 
     def __init__(self):
@@ -22,12 +27,17 @@ class AWSClient:
             'endpoint_url': self.endpoint_url,
             'region_name': self.region,
             'aws_access_key_id': self.access_key_id,
-            'aws_secret_access_key': self.secret_access_key
+            'aws_secret_access_key': self.secret_access_key,
+            'config': Config(max_pool_connections=aws_settings.max_pool_connections),
         }
 
         self.is_localstack = bool(self.endpoint_url)
 
         self._session = None
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._s3_client = None
+        self._dynamodb_client = None
+        self._dynamodb_resource = None
 
     @property
     def session(self):
@@ -41,6 +51,36 @@ class AWSClient:
             self._session = aioboto3.Session()
         return self._session
 
+    async def initialize(self):
+        """
+        Open long-lived S3 and DynamoDB clients for the current worker process.
+
+        Safe to call multiple times - will skip if already initialized.
+        """
+        if self._exit_stack is not None:
+            return
+
+        exit_stack = AsyncExitStack()
+        self._s3_client = await exit_stack.enter_async_context(
+            self.session.client('s3', **self.aws_config))
+        self._dynamodb_client = await exit_stack.enter_async_context(
+            self.session.client('dynamodb', **self.aws_config))
+        self._dynamodb_resource = await exit_stack.enter_async_context(
+            self.session.resource('dynamodb', **self.aws_config))
+        self._exit_stack = exit_stack
+
+    async def cleanup(self):
+        """
+        Close long-lived service clients and reset initialization state.
+        """
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+
+        self._exit_stack = None
+        self._s3_client = None
+        self._dynamodb_client = None
+        self._dynamodb_resource = None
+
     @asynccontextmanager
     async def get_dynamodb_resource(self):
         """
@@ -49,6 +89,10 @@ class AWSClient:
         Yields:
             DynamoDB resource: Configured DynamoDB resource for table operations.
         """
+        if self._dynamodb_resource is not None:
+            yield self._dynamodb_resource
+            return
+
         async with self.session.resource('dynamodb', **self.aws_config) as resource:
             yield resource
 
@@ -60,6 +104,10 @@ class AWSClient:
         Yields:
             S3 client: Configured S3 client for bucket and object operations.
         """
+        if self._s3_client is not None:
+            yield self._s3_client
+            return
+
         async with self.session.client('s3', **self.aws_config) as client:
             yield client
 
@@ -71,6 +119,10 @@ class AWSClient:
         Yields:
             DynamoDB client: Configured DynamoDB client for low-level operations.
         """
+        if self._dynamodb_client is not None:
+            yield self._dynamodb_client
+            return
+
         async with self.session.client('dynamodb', **self.aws_config) as client:
             yield client
 
@@ -1,12 +1,19 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+
+from boto3.dynamodb.conditions import ConditionBase
 from botocore.exceptions import ClientError
 
+from app.kernel.deadline import enforce_deadline
 from app.kernel.logs import logger
 from ..client import aws_client
 
 
 class DynamoDBService:
-    """Service for working with DynamoDB operations."""
+    """
+    Service for working with DynamoDB operations.
+
+    Operations are cancelled with DeadlineExceededException when the request deadline is reached.
+    """
 
     async def create_table(self, table_name: str, key_schema: list, attribute_definitions: list):
         """
@@ -23,7 +30,7 @@ class DynamoDBService:
         Raises:
             ClientError: For DynamoDB operation errors.
         """
-        async with aws_client.get_dynamodb_client() as client:
+        async with enforce_deadline(), aws_client.get_dynamodb_client() as client:
             try:
                 response = await client.create_table(
                     TableName=table_name,
@@ -59,7 +66,7 @@ class DynamoDBService:
         Raises:
             ClientError: For DynamoDB operation errors.
         """
-        async with aws_client.get_dynamodb_client() as client:
+        async with enforce_deadline(), aws_client.get_dynamodb_client() as client:
             try:
                 response = await client.delete_table(TableName=table_name)
                 logger.info(f"Removed DynamoDB table '{table_name}'")
@@ -77,24 +84,45 @@ class DynamoDBService:
                 logger.error(f"Failed to delete DynamoDB table '{table_name}'. Error: {str(ex)}")
                 raise
 
-    async def put_item(self, table_name: str, item: Dict[str, Any]):
+    async def put_item(
+            self, table_name: str, item: Dict[str, Any],
+            condition_expression: Optional[str] = None
+    ):
         """
         Add item to DynamoDB table.
 
         Args:
             table_name: Name of the target table.
             item: Item data to insert.
+            condition_expression: Condition the existing item must satisfy for the put
+                to succeed (optional, e.g. 'attribute_not_exists(pk)').
 
         Returns:
             dict: Put item operation response.
+
+        Raises:
+            ClientError: ConditionalCheckFailedException if the condition is not met.
         """
-        async with aws_client.get_dynamodb_resource() as dynamodb:
+        async with enforce_deadline(), aws_client.get_dynamodb_resource() as dynamodb:
             try:
                 table = await dynamodb.Table(table_name)
-                result = await table.put_item(Item=item)
+                params: Dict[str, Any] = {'Item': item}
+                if condition_expression:
+                    params['ConditionExpression'] = condition_expression
+
+                result = await table.put_item(**params)
                 logger.debug(f"Put item in DynamoDB table '{table_name}'")
                 return result
 
+            except ClientError as ex:
+                error_code = ex.response['Error']['Code']
+                if error_code == 'ConditionalCheckFailedException':
+                    logger.debug(f"Item not put into DynamoDB table '{table_name}': condition not met")
+                    raise
+
+                logger.error(f"Failed to put item into DynamoDB table '{table_name}'. Error code: {error_code}")
+                raise
+
             except Exception as ex:
                 logger.error(f"Failed to put item into DynamoDB table. Error: {str(ex)}")
                 raise
@@ -110,7 +138,7 @@ class DynamoDBService:
         Returns:
             Optional[Dict[str, Any]]: Item data if found, None otherwise.
         """
-        async with aws_client.get_dynamodb_resource() as dynamodb:
+        async with enforce_deadline(), aws_client.get_dynamodb_resource() as dynamodb:
             try:
                 table = await dynamodb.Table(table_name)
                 response = await table.get_item(Key=key)
@@ -119,6 +147,80 @@ class DynamoDBService:
                 logger.error(f"Failed to get item from DynamoDB table. Error: {str(ex)}")
                 raise
 
+    async def scan_items(
+            self, table_name: str,
+            projection: Optional[str] = None,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan DynamoDB table following pagination.
+
+        Args:
+            table_name: Name of the source table.
+            projection: Projection expression with attributes to return (optional).
+            limit: Maximum number of items to return (optional).
+
+        Returns:
+            List[Dict[str, Any]]: Scanned items.
+        """
+        async with enforce_deadline(), aws_client.get_dynamodb_resource() as dynamodb:
+            try:
+                table = await dynamodb.Table(table_name)
+                params: Dict[str, Any] = {}
+                if projection:
+                    params['ProjectionExpression'] = projection
+
+                items = []
+                while True:
+                    if limit:
+                        params['Limit'] = limit - len(items)
+                    response = await table.scan(**params)
+                    items.extend(response.get('Items', []))
+
+                    last_key = response.get('LastEvaluatedKey')
+                    if not last_key or (limit and len(items) >= limit):
+                        return items
+                    params['ExclusiveStartKey'] = last_key
+
+            except Exception as ex:
+                logger.error(f"Failed to scan DynamoDB table '{table_name}'. Error: {str(ex)}")
+                raise
+
+    async def query_items(
+            self, table_name: str,
+            key_condition: ConditionBase,
+            scan_index_forward: bool = True,
+            limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Query DynamoDB table items by key condition.
+
+        Args:
+            table_name: Name of the source table.
+            key_condition: Key condition expression (boto3.dynamodb.conditions.Key).
+            scan_index_forward: Sort order by range key (False for descending).
+            limit: Maximum number of items to return (optional).
+
+        Returns:
+            List[Dict[str, Any]]: Matching items.
+        """
+        async with enforce_deadline(), aws_client.get_dynamodb_resource() as dynamodb:
+            try:
+                table = await dynamodb.Table(table_name)
+                params: Dict[str, Any] = {
+                    'KeyConditionExpression': key_condition,
+                    'ScanIndexForward': scan_index_forward,
+                }
+                if limit:
+                    params['Limit'] = limit
+
+                response = await table.query(**params)
+                return response.get('Items', [])
+
+            except Exception as ex:
+                logger.error(f"Failed to query DynamoDB table '{table_name}'. Error: {str(ex)}")
+                raise
+
     async def delete_item(self, table_name: str, key: Dict[str, Any]):
         """
         Delete item from DynamoDB table.
@@ -130,7 +232,7 @@ class DynamoDBService:
         Returns:
             dict: Delete item operation response.
         """
-        async with aws_client.get_dynamodb_resource() as dynamodb:
+        async with enforce_deadline(), aws_client.get_dynamodb_resource() as dynamodb:
             try:
                 table = await dynamodb.Table(table_name)
                 result = await table.delete_item(Key=key)
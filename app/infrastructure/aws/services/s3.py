@@ -2,12 +2,17 @@ from typing import Dict, Optional, List, Tuple
 
 from botocore.exceptions import ClientError
 
+from app.kernel.deadline import enforce_deadline
 from app.kernel.logs import logger
 from ..client import aws_client
 
 
 class S3Service:
-    """Minimal service for working with S3 operations."""
+    """
+    Minimal service for working with S3 operations.
+
+    Operations are cancelled with DeadlineExceededException when the request deadline is reached.
+    """
 
     async def create_bucket(self, bucket_name: str) -> bool:
         """
@@ -25,7 +30,7 @@ class S3Service:
         Raises:
             ClientError: For S3 operation errors (except BucketAlreadyOwnedByYou).
         """
-        async with aws_client.get_s3_client() as s3:
+        async with enforce_deadline(), aws_client.get_s3_client() as s3:
             try:
                 if aws_client.is_localstack:
                     await s3.create_bucket(Bucket=bucket_name)
@@ -55,7 +60,8 @@ class S3Service:
 
     async def put_object(
             self, bucket_name: str, key: str,
-            body: bytes, content_type: Optional[str] = None
+            body: bytes, content_type: Optional[str] = None,
+            metadata: Optional[Dict[str, str]] = None
     ) -> bool:
         """
         Upload object to S3 bucket.
@@ -65,6 +71,7 @@ class S3Service:
             key: Object key (file path) in the bucket.
             body: File content as bytes.
             content_type: MIME type of the content (optional).
+            metadata: User-defined object metadata (optional).
 
         Returns:
             bool: True if upload successful.
@@ -72,7 +79,7 @@ class S3Service:
         Raises:
             Exception: For S3 upload errors.
         """
-        async with aws_client.get_s3_client() as s3:
+        async with enforce_deadline(), aws_client.get_s3_client() as s3:
             try:
                 params = {
                     'Bucket': bucket_name,
@@ -81,6 +88,8 @@ class S3Service:
                 }
                 if content_type:
                     params['ContentType'] = content_type
+                if metadata:
+                    params['Metadata'] = metadata
 
                 await s3.put_object(**params)
                 logger.debug(f"Uploaded object '{key}' to S3 bucket '{bucket_name}'")
@@ -90,7 +99,39 @@ class S3Service:
                 logger.error(f"Error putting object to S3 bucket '{bucket_name}' with error {str(ex)}.")
                 raise
 
-    async def get_object_content(self, bucket_name: str, key: str) -> Optional[Tuple[bytes, Dict]]:
+    async def get_object(self, bucket_name: str, key: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        """
+        Get object content together with its user-defined metadata.
+
+        Args:
+            bucket_name: Source S3 bucket name.
+            key: Object key (file path) in the bucket.
+
+        Returns:
+            Optional[Tuple[bytes, Dict[str, str]]]: File content and metadata if found,
+                None if object doesn't exist.
+
+        Raises:
+            ClientError: For S3 operation errors (except NoSuchKey/NoSuchBucket).
+        """
+        async with enforce_deadline(), aws_client.get_s3_client() as s3:
+            try:
+                response = await s3.get_object(Bucket=bucket_name, Key=key)
+                return await response['Body'].read(), response.get('Metadata', {})
+
+            except ClientError as ex:
+                error_code = ex.response['Error']['Code']
+                if error_code in ("NoSuchKey", "NoSuchBucket"):
+                    return None
+
+                logger.error(f"Error getting object '{bucket_name}' with code {error_code}.")
+                raise
+
+            except Exception as ex:
+                logger.error(f"Error getting object '{bucket_name}' with error {str(ex)}.")
+                raise
+
+    async def get_object_content(self, bucket_name: str, key: str) -> Optional[bytes]:
         """
         Get object content from S3 bucket.
 
@@ -104,7 +145,7 @@ class S3Service:
         Raises:
             ClientError: For S3 operation errors (except NoSuchKey/NoSuchBucket).
         """
-        async with aws_client.get_s3_client() as s3:
+        async with enforce_deadline(), aws_client.get_s3_client() as s3:
             try:
                 response = await s3.get_object(Bucket=bucket_name, Key=key)
                 # Read the content
@@ -130,7 +171,7 @@ class S3Service:
             List[Dict[str, str]]: List of bucket info with name and creation_date.
                                  Returns empty list if operation fails.
         """
-        async with aws_client.get_s3_client() as s3:
+        async with enforce_deadline(), aws_client.get_s3_client() as s3:
             try:
                 response = await s3.list_buckets()
                 buckets = []
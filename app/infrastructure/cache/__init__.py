@@ -1,2 +1,4 @@
-from .interfaces import CacheManager
-from .redis_cache import RedisCacheManager
+from .interfaces import CacheManager, CacheEngineName
+from .redis_cache import RedisCacheManager, redis_circuit_breaker
+from .locks import RedisLeaseLock
+from .rate_limit import RedisRateLimiter, RateLimitResult
@@ -0,0 +1,4 @@
+from .base import CacheEngine, PubSubCacheEngine
+from .redis_engine import RedisCacheEngine
+from .memory_engine import MemoryCacheEngine
+from .disk_engine import DiskCacheEngine
@@ -0,0 +1,134 @@
+import math
+from abc import ABC, abstractmethod
+from typing import Optional, Dict, List, Tuple
+
+# Earth radius used by Redis GEO commands, so all engines return the same distances
+EARTH_RADIUS_KM = 6372.7976
+
+
+def get_distance_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Get great-circle distance between two points in kilometers (haversine formula)."""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class GeoIndex:
+    """
+    Geospatial index searched by distance to every member.
+
+    Used by local engines, which hold few enough members that a linear scan
+    is cheaper than maintaining a geohash index.
+    """
+
+    def __init__(self, positions: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.positions: Dict[str, Tuple[float, float]] = positions or {}
+
+    def search(self, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        """Find up to `count` members within radius, nearest first."""
+        distances = []
+        for member, (member_lat, member_lon) in self.positions.items():
+            distance = get_distance_km(lat, lon, member_lat, member_lon)
+            if distance <= radius_km:
+                distances.append((distance, member))
+        return [member for _, member in sorted(distances)[:count]]
+
+
+class ScoreIndex:
+    """
+    Members ranked by score.
+
+    Used by local engines. Members with equal scores are ranked in reverse
+    member order, like Redis ZREVRANGE.
+    """
+
+    def __init__(self, scores: Optional[Dict[str, float]] = None):
+        self.scores: Dict[str, float] = scores or {}
+
+    def increment(self, increments: Dict[str, float]):
+        """Add increments to member scores (missing members start at 0)."""
+        for member, amount in increments.items():
+            self.scores[member] = self.scores.get(member, 0) + amount
+
+    def top(self, count: int) -> List[str]:
+        """Get up to `count` members with the highest scores, highest first."""
+        ranked = sorted(self.scores.items(), key=lambda item: (item[1], item[0]), reverse=True)
+        return [member for member, _ in ranked[:count]]
+
+
+class CacheEngine(ABC):
+    """
+    Storage backend of CacheManager.
+
+    Engines store string values, hashes of string fields, geospatial
+    indexes and score indexes (sorted sets) with Redis semantics: keys expire after their TTL, hash writes
+    keep other fields and the existing TTL, and reading a key of another
+    type raises TypeError. Errors are handled by CacheManager.
+    """
+    name: str
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """Get string value of a key (None if missing)."""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        """Set string value of a key with optional TTL in seconds."""
+
+    @abstractmethod
+    async def ttl(self, key: str) -> Optional[int]:
+        """Get remaining TTL in seconds (None if key is missing or has no expiry)."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> bool:
+        """Delete key, return whether it existed."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        """Check if key exists."""
+
+    @abstractmethod
+    async def get_mapping(self, key: str) -> Dict[str, str]:
+        """Get all fields of a hash (empty if missing)."""
+
+    @abstractmethod
+    async def get_mappings(self, keys: List[str]) -> List[Dict[str, str]]:
+        """Get all fields of several hashes in order of keys."""
+
+    @abstractmethod
+    async def set_mapping(self, key: str, mapping: Dict[str, str], ttl: Optional[int] = None):
+        """Atomically set hash fields, and key TTL if given."""
+
+    @abstractmethod
+    async def geo_add(self, key: str, member: str, lat: float, lon: float):
+        """Add or update member position in a geospatial index."""
+
+    @abstractmethod
+    async def geo_search(self, key: str, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        """Find up to `count` members within radius, nearest first."""
+
+    @abstractmethod
+    async def geo_remove(self, key: str, members: List[str]) -> int:
+        """Remove members from a geospatial index, return number of removed members."""
+
+    @abstractmethod
+    async def score_increment(self, key: str, increments: Dict[str, float]):
+        """Add increments to member scores in a score index (missing members start at 0)."""
+
+    @abstractmethod
+    async def score_top(self, key: str, count: int) -> List[str]:
+        """Get up to `count` members with the highest scores, highest first."""
+
+    async def cleanup(self):
+        """Release resources held by the engine."""
+
+
+class PubSubCacheEngine(CacheEngine):
+    """
+    Storage backend shared by all application instances that also delivers
+    pub/sub messages between them.
+    """
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str):
+        """Publish message to a pub/sub channel shared by all application instances."""
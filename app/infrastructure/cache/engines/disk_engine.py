@@ -0,0 +1,211 @@
+import asyncio
+import json
+import math
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Any, Callable, Tuple
+
+from .base import CacheEngine, GeoIndex, ScoreIndex
+
+
+class DiskCacheEngine(CacheEngine):
+    """
+    Persistent local-disk cache engine backed by SQLite.
+
+    Data survives restarts and is shared by the workers of one host without
+    network round trips. Each key is one row holding its type, value (hashes,
+    geospatial and score indexes as JSON) and absolute expiry time. Queries run in
+    a dedicated thread, so they do not block the event loop; read-modify-write
+    operations run in immediate transactions, so concurrent writers of other
+    processes are serialized by SQLite. Expired rows are skipped on read and
+    purged periodically on write.
+    """
+    name = "disk"
+
+    string_type = "string"
+    hash_type = "hash"
+    geo_type = "geo"
+    score_type = "score"
+
+    def __init__(self, path: str, busy_timeout: float, purge_interval: int):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.purge_interval = purge_interval
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._purged_at = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open database and create schema on first use (runs in the engine thread)."""
+        if self._connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "key TEXT PRIMARY KEY, type TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL)")
+            self._connection = connection
+        return self._connection
+
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        """Run database function in the engine thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="disk-cache")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _read_entry(self, key: str, entry_type: str) -> Optional[Tuple[str, Optional[float]]]:
+        """Read live value and expiry of a key, checking its type (None if missing or expired)."""
+        row = self._connect().execute(
+            "SELECT type, value, expires_at FROM cache_entries WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[2] is not None and row[2] <= time.time()):
+            return None
+        if entry_type and row[0] != entry_type:
+            raise TypeError(f"Key '{key}' holds a value of another type")
+        return row[1], row[2]
+
+    def _write_entry(self, key: str, entry_type: str, value: str, expires_at: Optional[float]):
+        """Insert or replace a key."""
+        self._connect().execute(
+            "INSERT OR REPLACE INTO cache_entries (key, type, value, expires_at) VALUES (?, ?, ?, ?)",
+            (key, entry_type, value, expires_at))
+
+    def _update_entry(self, key: str, entry_type: str, update: Callable[[Any], Any], ttl: Optional[int]):
+        """Atomically update JSON value of a key, keeping its expiry unless TTL is given."""
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            entry = self._read_entry(key, entry_type)
+            value, expires_at = (json.loads(entry[0]), entry[1]) if entry else ({}, None)
+            if ttl:
+                expires_at = time.time() + ttl
+            self._write_entry(key, entry_type, json.dumps(update(value)), expires_at)
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+        self._purge_expired()
+
+    def _purge_expired(self):
+        """Delete expired rows at most once per purge interval."""
+        now = time.time()
+        if now - self._purged_at < self.purge_interval:
+            return
+        self._purged_at = now
+        self._connect().execute("DELETE FROM cache_entries WHERE expires_at <= ?", (now,))
+
+    def _set(self, key: str, value: str, ttl: Optional[int]):
+        self._write_entry(key, self.string_type, str(value), time.time() + ttl if ttl else None)
+        self._purge_expired()
+
+    def _ttl(self, key: str) -> Optional[int]:
+        entry = self._read_entry(key, "")
+        if entry is None or entry[1] is None:
+            return None
+        return math.ceil(entry[1] - time.time())
+
+    def _delete(self, key: str) -> bool:
+        exists = self._read_entry(key, "") is not None
+        self._connect().execute("DELETE FROM cache_entries WHERE key = ?", (key,))
+        return exists
+
+    def _get_mappings(self, keys: List[str]) -> List[Dict[str, str]]:
+        result = []
+        for key in keys:
+            entry = self._read_entry(key, self.hash_type)
+            result.append(json.loads(entry[0]) if entry else {})
+        return result
+
+    def _set_mapping(self, key: str, mapping: Dict[str, str], ttl: Optional[int]):
+        fields = {field: str(value) for field, value in mapping.items()}
+        self._update_entry(key, self.hash_type, lambda value: {**value, **fields}, ttl)
+
+    def _geo_add(self, key: str, member: str, lat: float, lon: float):
+        self._update_entry(key, self.geo_type, lambda value: {**value, member: [lat, lon]}, None)
+
+    def _geo_search(self, key: str, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        entry = self._read_entry(key, self.geo_type)
+        positions = {member: tuple(position) for member, position in json.loads(entry[0]).items()} if entry else {}
+        return GeoIndex(positions).search(lat, lon, radius_km, count)
+
+    def _geo_remove(self, key: str, members: List[str]) -> int:
+        removed = 0
+
+        def update(value: Dict[str, Any]) -> Dict[str, Any]:
+            nonlocal removed
+            removed = sum(value.pop(member, None) is not None for member in members)
+            return value
+
+        self._update_entry(key, self.geo_type, update, None)
+        return removed
+
+    def _score_increment(self, key: str, increments: Dict[str, float]):
+        def update(value: Dict[str, float]) -> Dict[str, float]:
+            scores = ScoreIndex(value)
+            scores.increment(increments)
+            return scores.scores
+
+        self._update_entry(key, self.score_type, update, None)
+
+    def _score_top(self, key: str, count: int) -> List[str]:
+        entry = self._read_entry(key, self.score_type)
+        return ScoreIndex(json.loads(entry[0]) if entry else {}).top(count)
+
+    async def get(self, key: str) -> Optional[str]:
+        entry = await self._run(self._read_entry, key, self.string_type)
+        return entry[0] if entry else None
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        await self._run(self._set, key, value, ttl)
+
+    async def ttl(self, key: str) -> Optional[int]:
+        return await self._run(self._ttl, key)
+
+    async def delete(self, key: str) -> bool:
+        return await self._run(self._delete, key)
+
+    async def exists(self, key: str) -> bool:
+        return await self._run(self._read_entry, key, "") is not None
+
+    async def get_mapping(self, key: str) -> Dict[str, str]:
+        return (await self._run(self._get_mappings, [key]))[0]
+
+    async def get_mappings(self, keys: List[str]) -> List[Dict[str, str]]:
+        return await self._run(self._get_mappings, keys)
+
+    async def set_mapping(self, key: str, mapping: Dict[str, str], ttl: Optional[int] = None):
+        await self._run(self._set_mapping, key, mapping, ttl)
+
+    async def geo_add(self, key: str, member: str, lat: float, lon: float):
+        await self._run(self._geo_add, key, member, lat, lon)
+
+    async def geo_search(self, key: str, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        return await self._run(self._geo_search, key, lat, lon, radius_km, count)
+
+    async def geo_remove(self, key: str, members: List[str]) -> int:
+        return await self._run(self._geo_remove, key, members)
+
+    async def score_increment(self, key: str, increments: Dict[str, float]):
+        await self._run(self._score_increment, key, increments)
+
+    async def score_top(self, key: str, count: int) -> List[str]:
+        return await self._run(self._score_top, key, count)
+
+    async def cleanup(self):
+        """Close database connection and stop the engine thread."""
+        if self._executor is None:
+            return
+
+        def close():
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+        await self._run(close)
+        self._executor.shutdown(wait=True)
+        self._executor = None
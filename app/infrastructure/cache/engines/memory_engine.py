@@ -0,0 +1,114 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, List, Any, Set
+
+from .base import CacheEngine, GeoIndex, ScoreIndex
+
+
+class MemoryCacheEngine(CacheEngine):
+    """
+    Process-local in-memory cache engine.
+
+    Keeps data in a dictionary of the current process, so every worker has
+    its own cache and data is lost on restart. Suited for single-node
+    deployments and local development. Holds at most `max_keys` keys,
+    evicting least recently used ones. Geospatial and score indexes are
+    pinned: they do not count towards `max_keys` and are never evicted, so
+    a burst of other keys does not drop a whole index. Expired keys are removed on access.
+    """
+    name = "memory"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._entries: OrderedDict[str, Any] = OrderedDict()
+        self._expires_at: Dict[str, float] = {}
+        self._pinned_keys: Set[str] = set()
+
+    def _get_entry(self, key: str, entry_type: type) -> Optional[Any]:
+        """Get live entry of a key, checking its type (None if missing or expired)."""
+        expires_at = self._expires_at.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._remove_entry(key)
+            return None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not isinstance(entry, entry_type):
+            raise TypeError(f"Key '{key}' holds a value of another type")
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _put_entry(self, key: str, entry: Any, ttl: Optional[int] = None, pinned: bool = False):
+        """Store entry of a key (replacing TTL if given) and evict least recently used unpinned keys."""
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if ttl:
+            self._expires_at[key] = time.monotonic() + ttl
+        if pinned:
+            self._pinned_keys.add(key)
+
+        while len(self._entries) - len(self._pinned_keys) > self.max_keys:
+            evicted_key = next(key for key in self._entries if key not in self._pinned_keys)
+            self._remove_entry(evicted_key)
+
+    def _remove_entry(self, key: str) -> bool:
+        """Remove key, return whether it existed."""
+        self._expires_at.pop(key, None)
+        self._pinned_keys.discard(key)
+        return self._entries.pop(key, None) is not None
+
+    async def get(self, key: str) -> Optional[str]:
+        return self._get_entry(key, str)
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        self._remove_entry(key)
+        self._put_entry(key, str(value), ttl)
+
+    async def ttl(self, key: str) -> Optional[int]:
+        if self._get_entry(key, object) is None or key not in self._expires_at:
+            return None
+        return math.ceil(self._expires_at[key] - time.monotonic())
+
+    async def delete(self, key: str) -> bool:
+        return self._remove_entry(key)
+
+    async def exists(self, key: str) -> bool:
+        return self._get_entry(key, object) is not None
+
+    async def get_mapping(self, key: str) -> Dict[str, str]:
+        return dict(self._get_entry(key, dict) or {})
+
+    async def get_mappings(self, keys: List[str]) -> List[Dict[str, str]]:
+        return [await self.get_mapping(key) for key in keys]
+
+    async def set_mapping(self, key: str, mapping: Dict[str, str], ttl: Optional[int] = None):
+        entry = self._get_entry(key, dict) or {}
+        entry.update({field: str(value) for field, value in mapping.items()})
+        self._put_entry(key, entry, ttl)
+
+    async def geo_add(self, key: str, member: str, lat: float, lon: float):
+        entry = self._get_entry(key, GeoIndex) or GeoIndex()
+        entry.positions[member] = (lat, lon)
+        self._put_entry(key, entry, pinned=True)
+
+    async def geo_search(self, key: str, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        entry = self._get_entry(key, GeoIndex) or GeoIndex()
+        return entry.search(lat, lon, radius_km, count)
+
+    async def geo_remove(self, key: str, members: List[str]) -> int:
+        entry = self._get_entry(key, GeoIndex)
+        if entry is None:
+            return 0
+        return sum(entry.positions.pop(member, None) is not None for member in members)
+
+    async def score_increment(self, key: str, increments: Dict[str, float]):
+        entry = self._get_entry(key, ScoreIndex) or ScoreIndex()
+        entry.increment(increments)
+        self._put_entry(key, entry, pinned=True)
+
+    async def score_top(self, key: str, count: int) -> List[str]:
+        entry = self._get_entry(key, ScoreIndex) or ScoreIndex()
+        return entry.top(count)
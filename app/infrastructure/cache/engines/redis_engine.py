@@ -0,0 +1,94 @@
+from typing import Optional, Dict, List
+
+from ..redis_cache import RedisCacheManager, RedisClient, redis_circuit_breaker
+from .base import PubSubCacheEngine
+
+
+class RedisCacheEngine(PubSubCacheEngine):
+    """
+    Cache engine backed by Redis, shared by all application instances.
+
+    Reads go through the read client, so they are served by replicas when
+    replica reads are enabled; writes and pub/sub always go to the primary.
+    Calls go through `redis_circuit_breaker`, so while Redis is failing they
+    raise CircuitOpenException instantly instead of waiting for timeouts.
+    """
+    name = "redis"
+
+    @property
+    def _client(self) -> RedisClient:
+        """Get Redis client for writes."""
+        return RedisCacheManager.get_redis_client()
+
+    @property
+    def _read_client(self) -> RedisClient:
+        """Get Redis client for reads."""
+        return RedisCacheManager.get_read_client()
+
+    async def get(self, key: str) -> Optional[str]:
+        async with redis_circuit_breaker.guard():
+            return await self._read_client.get(key)
+
+    async def set(self, key: str, value: str, ttl: Optional[int] = None):
+        async with redis_circuit_breaker.guard():
+            await self._client.set(key, value, ex=ttl)
+
+    async def ttl(self, key: str) -> Optional[int]:
+        async with redis_circuit_breaker.guard():
+            value = await self._read_client.ttl(key)
+            return value if value is not None and value >= 0 else None
+
+    async def delete(self, key: str) -> bool:
+        async with redis_circuit_breaker.guard():
+            return bool(await self._client.delete(key))
+
+    async def exists(self, key: str) -> bool:
+        async with redis_circuit_breaker.guard():
+            return bool(await self._read_client.exists(key))
+
+    async def get_mapping(self, key: str) -> Dict[str, str]:
+        async with redis_circuit_breaker.guard():
+            return await self._read_client.hgetall(key)
+
+    async def get_mappings(self, keys: List[str]) -> List[Dict[str, str]]:
+        async with redis_circuit_breaker.guard():
+            async with self._read_client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.hgetall(key)
+                return await pipe.execute()
+
+    async def set_mapping(self, key: str, mapping: Dict[str, str], ttl: Optional[int] = None):
+        async with redis_circuit_breaker.guard():
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=mapping)
+                if ttl:
+                    pipe.expire(key, ttl)
+                await pipe.execute()
+
+    async def geo_add(self, key: str, member: str, lat: float, lon: float):
+        async with redis_circuit_breaker.guard():
+            await self._client.geoadd(key, [lon, lat, member])
+
+    async def geo_search(self, key: str, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        async with redis_circuit_breaker.guard():
+            return await self._read_client.geosearch(
+                key, longitude=lon, latitude=lat, radius=radius_km, unit="km", sort="ASC", count=count)
+
+    async def geo_remove(self, key: str, members: List[str]) -> int:
+        async with redis_circuit_breaker.guard():
+            return await self._client.zrem(key, *members)
+
+    async def score_increment(self, key: str, increments: Dict[str, float]):
+        async with redis_circuit_breaker.guard():
+            async with self._client.pipeline(transaction=False) as pipe:
+                for member, amount in increments.items():
+                    pipe.zincrby(key, amount, member)
+                await pipe.execute()
+
+    async def score_top(self, key: str, count: int) -> List[str]:
+        async with redis_circuit_breaker.guard():
+            return await self._read_client.zrevrange(key, 0, count - 1)
+
+    async def publish(self, channel: str, message: str):
+        async with redis_circuit_breaker.guard():
+            await self._client.publish(channel, message)
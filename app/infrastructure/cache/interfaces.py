@@ -1,10 +1,12 @@
 import json
-from typing import Literal, Optional, Any
-
-from aiocache import Cache
+from typing import Literal, Optional, Any, Dict, List
 
+from app.kernel.deadline import enforce_deadline
 from app.kernel.logs import logger
-from .redis_cache import RedisCacheManager
+from app.kernel.settings import cache_settings
+from .engines import CacheEngine, PubSubCacheEngine, RedisCacheEngine, MemoryCacheEngine, DiskCacheEngine
+
+CacheEngineName = Literal["redis", "memory", "disk"]
 
 
 class CacheManager:
@@ -12,25 +14,37 @@ class CacheManager:
     Universal cache manager with automatic serialization.
 
     Provides abstraction layer over different cache backends
-    with JSON serialization and error handling.
+    with JSON serialization and error handling. Engines:
+
+    - 'redis': shared by all application instances (see RedisCacheEngine).
+    - 'memory': process-local, for single-node deployments and tests.
+    - 'disk': persistent SQLite file shared by the workers of one host.
+
+    Engine instances are shared process-wide, so every CacheManager using
+    the same engine sees the same data. Operations are cancelled when the
+    request deadline is reached and handled like any other cache failure.
     """
 
-    def __init__(self, engine: Literal["redis"] = "redis"):
+    engines: Dict[str, CacheEngine] = {
+        "redis": RedisCacheEngine(),
+        "memory": MemoryCacheEngine(max_keys=cache_settings.memory_max_keys),
+        "disk": DiskCacheEngine(
+            path=cache_settings.disk_path,
+            busy_timeout=cache_settings.disk_busy_timeout,
+            purge_interval=cache_settings.disk_purge_interval),
+    }
+
+    def __init__(self, engine: CacheEngineName = "redis"):
+        if engine not in self.engines:
+            raise ValueError(f"Unknown cache engine: '{engine}'")
         self.engine = engine
+        self._engine = self.engines[engine]
 
-    @property
-    def _cache(self) -> Cache:
-        """
-        Get cache instance based on configured engine.
-
-        Returns:
-            Cache: Configured aiocache instance.
-        """
-        if self.engine == "redis":
-            return RedisCacheManager.get_aiocache()
-        else:
-            # default
-            return RedisCacheManager.get_aiocache()
+    @classmethod
+    async def cleanup(cls):
+        """Release resources of all cache engines."""
+        for engine in cls.engines.values():
+            await engine.cleanup()
 
     def _serialize_value(self, value: Any) -> Any:
         """
@@ -48,7 +62,7 @@ class CacheManager:
         if value is None:
             return None
 
-        if isinstance(value, (str, int, float, bool)):
+        if isinstance(value, (str, int, float)) and not isinstance(value, bool):
             return value
 
         try:
@@ -90,7 +104,8 @@ class CacheManager:
             Optional[Any]: Cached value if found, None otherwise.
         """
         try:
-            value = await self._cache.get(key)
+            async with enforce_deadline():
+                value = await self._engine.get(key)
             return self._deserialize_value(value)
         except Exception as e:
             return None
@@ -109,12 +124,29 @@ class CacheManager:
         """
         try:
             serialized_value = self._serialize_value(value)
-            await self._cache.set(key, serialized_value, ttl=ttl)
+            async with enforce_deadline():
+                await self._engine.set(key, serialized_value, ttl=ttl)
             logger.debug(f"Set value to cache. Key: {key}. Engine: {self.engine}. TTL: {ttl}")
             return True
         except Exception:
             return False
 
+    async def ttl(self, key: str) -> Optional[int]:
+        """
+        Get remaining time to live of a key.
+
+        Args:
+            key: Cache key to check.
+
+        Returns:
+            Optional[int]: Remaining TTL in seconds, None if key is missing or has no expiry.
+        """
+        try:
+            async with enforce_deadline():
+                return await self._engine.ttl(key)
+        except Exception as e:
+            return None
+
     async def delete(self, key: str) -> bool:
         """
         Delete value from cache by key.
@@ -126,9 +158,10 @@ class CacheManager:
             bool: True if deleted successfully, False otherwise.
         """
         try:
-            result = await self._cache.delete(key)
+            async with enforce_deadline():
+                result = await self._engine.delete(key)
             logger.debug(f"Removed value from cache. Key: {key}. Engine: {self.engine}.")
-            return bool(result)
+            return result
         except Exception as e:
             return False
 
@@ -143,6 +176,194 @@ class CacheManager:
             bool: True if key exists, False otherwise.
         """
         try:
-            return await self._cache.exists(key)
+            async with enforce_deadline():
+                return await self._engine.exists(key)
+        except Exception as e:
+            return False
+
+    async def get_mapping(self, key: str) -> Dict[str, str]:
+        """
+        Retrieve all fields of a hash with one round trip.
+
+        Args:
+            key: Cache key of the hash.
+
+        Returns:
+            Dict[str, str]: Hash fields, empty if key is missing or cache is unavailable.
+        """
+        try:
+            async with enforce_deadline():
+                return await self._engine.get_mapping(key)
+        except Exception as e:
+            return {}
+
+    async def get_mappings(self, keys: List[str]) -> List[Dict[str, str]]:
+        """
+        Retrieve all fields of several hashes with one round trip.
+
+        Args:
+            keys: Cache keys of the hashes.
+
+        Returns:
+            List[Dict[str, str]]: Hash fields in order of keys (empty for missing keys),
+                all empty if cache is unavailable.
+        """
+        if not keys:
+            return []
+
+        try:
+            async with enforce_deadline():
+                return await self._engine.get_mappings(keys)
+        except Exception as e:
+            return [{} for _ in keys]
+
+    async def set_mapping(self, key: str, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Atomically store hash fields with optional key TTL.
+
+        Fields are written atomically (MULTI/EXEC in Redis), so readers never
+        observe a partially updated hash.
+
+        Args:
+            key: Cache key of the hash.
+            mapping: Fields to store (other existing fields are kept).
+            ttl: Time to live of the whole key in seconds (optional, existing TTL is kept if None).
+
+        Returns:
+            bool: True if stored successfully, False otherwise.
+        """
+        try:
+            async with enforce_deadline():
+                await self._engine.set_mapping(
+                    key, {field: self._serialize_value(value) for field, value in mapping.items()}, ttl=ttl)
+            logger.debug(f"Set mapping to cache. Key: {key}. Engine: {self.engine}. TTL: {ttl}")
+            return True
+        except Exception:
+            return False
+
+    async def geo_add(self, key: str, member: str, lat: float, lon: float) -> bool:
+        """
+        Add or update member position in a geospatial index.
+
+        Args:
+            key: Cache key of the geospatial index.
+            member: Member name.
+            lat: Latitude of the member.
+            lon: Longitude of the member.
+
+        Returns:
+            bool: True if stored successfully, False otherwise.
+        """
+        try:
+            async with enforce_deadline():
+                await self._engine.geo_add(key, member, lat, lon)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to add geo member. Key: {key}. Member: {member}. Error: {str(e)}")
+            return False
+
+    async def geo_search(self, key: str, lat: float, lon: float, radius_km: float, count: int) -> List[str]:
+        """
+        Find members of a geospatial index within radius, nearest first.
+
+        Args:
+            key: Cache key of the geospatial index.
+            lat: Latitude of the search center.
+            lon: Longitude of the search center.
+            radius_km: Search radius in kilometers.
+            count: Maximum number of members to return.
+
+        Returns:
+            List[str]: Member names ordered by distance, empty if none found or cache is unavailable.
+        """
+        try:
+            async with enforce_deadline():
+                return await self._engine.geo_search(key, lat, lon, radius_km, count)
+        except Exception as e:
+            return []
+
+    async def geo_remove(self, key: str, members: List[str]) -> bool:
+        """
+        Remove members from a geospatial index.
+
+        Args:
+            key: Cache key of the geospatial index.
+            members: Member names to remove.
+
+        Returns:
+            bool: True if removed successfully, False otherwise.
+        """
+        if not members:
+            return True
+
+        try:
+            async with enforce_deadline():
+                await self._engine.geo_remove(key, members)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to remove geo members. Key: {key}. Error: {str(e)}")
+            return False
+
+    async def score_increment(self, key: str, increments: Dict[str, float]) -> bool:
+        """
+        Add increments to member scores in a score index (sorted set).
+
+        Args:
+            key: Cache key of the score index.
+            increments: Score increments by member name (missing members start at 0).
+
+        Returns:
+            bool: True if stored successfully, False otherwise.
+        """
+        if not increments:
+            return True
+
+        try:
+            async with enforce_deadline():
+                await self._engine.score_increment(key, increments)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to increment scores. Key: {key}. Error: {str(e)}")
+            return False
+
+    async def score_top(self, key: str, count: int) -> List[str]:
+        """
+        Get members of a score index with the highest scores.
+
+        Args:
+            key: Cache key of the score index.
+            count: Maximum number of members to return.
+
+        Returns:
+            List[str]: Member names ordered by score, highest first, empty if none found or cache is unavailable.
+        """
+        try:
+            async with enforce_deadline():
+                return await self._engine.score_top(key, count)
+        except Exception as e:
+            return []
+
+    async def publish(self, channel: str, message: str) -> bool:
+        """
+        Publish message to a pub/sub channel.
+
+        Supported by the 'redis' engine only, other engines return False.
+
+        Args:
+            channel: Channel name.
+            message: Message content.
+
+        Returns:
+            bool: True if published successfully, False otherwise.
+        """
+        if not isinstance(self._engine, PubSubCacheEngine):
+            logger.debug(f"Message not published: '{self.engine}' cache engine does not support pub/sub")
+            return False
+
+        try:
+            async with enforce_deadline():
+                await self._engine.publish(channel, message)
+            return True
         except Exception as e:
+            logger.warning(f"Failed to publish message. Channel: {channel}. Error: {str(e)}")
             return False
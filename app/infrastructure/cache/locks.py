@@ -0,0 +1,122 @@
+import asyncio
+import time
+import uuid
+from typing import Optional
+
+from app.kernel.logs import logger
+from .redis_cache import RedisCacheManager, redis_circuit_breaker
+
+
+class RedisLeaseLock:
+    """
+    Distributed lease lock based on a single Redis key.
+
+    The lock is taken with SET NX PX, so it expires on its own if the holder
+    crashes, and released with a Lua script that deletes the key only when
+    it still holds this lock's token (a holder whose lease already expired
+    cannot release a lock taken by someone else). A holder working longer
+    than the lease extends it in background, up to a maximum hold time, so
+    a stuck holder cannot keep the lock forever.
+
+    Calls go through `redis_circuit_breaker` and raise CircuitOpenException
+    while Redis is failing.
+    """
+
+    release_script = """
+        if redis.call("get", KEYS[1]) == ARGV[1] then
+            return redis.call("del", KEYS[1])
+        end
+        return 0
+    """
+
+    extend_script = """
+        if redis.call("get", KEYS[1]) == ARGV[1] then
+            return redis.call("pexpire", KEYS[1], ARGV[2])
+        end
+        return 0
+    """
+
+    def __init__(self, key: str, lease_ms: int):
+        self.key = key
+        self.lease_ms = lease_ms
+        self.token = uuid.uuid4().hex
+        self._renewal_task: Optional[asyncio.Task] = None
+
+    async def acquire(self) -> bool:
+        """
+        Try to take the lock without waiting.
+
+        Returns:
+            bool: True if the lock was acquired, False if it is held by someone else.
+        """
+        async with redis_circuit_breaker.guard():
+            redis_client = RedisCacheManager.get_redis_client()
+            return bool(await redis_client.set(self.key, self.token, nx=True, px=self.lease_ms))
+
+    async def extend(self) -> bool:
+        """
+        Reset the lease if the lock is still held by this instance.
+
+        Returns:
+            bool: True if the lease was extended, False if it had expired or was taken over.
+        """
+        async with redis_circuit_breaker.guard():
+            script = RedisCacheManager.get_script(self.extend_script)
+            return bool(await script(keys=[self.key], args=[self.token, self.lease_ms]))
+
+    def start_renewal(self, max_hold_ms: int):
+        """
+        Extend the lease in background until the lock is released.
+
+        The lease is extended every third of its duration, but not beyond
+        `max_hold_ms` from now, after which the lock expires even if it is
+        not released.
+
+        Args:
+            max_hold_ms: Maximum time the lock may be held in total.
+        """
+        if self._renewal_task is None or self._renewal_task.done():
+            self._renewal_task = asyncio.create_task(self._renew(max_hold_ms))
+
+    async def _renew(self, max_hold_ms: int):
+        """Extend the lease periodically within the maximum hold time."""
+        hold_until = time.monotonic() + max_hold_ms / 1000
+        while True:
+            await asyncio.sleep(self.lease_ms / 3000)
+            if time.monotonic() + self.lease_ms / 1000 > hold_until:
+                logger.warning(f"Lock '{self.key}' reached its maximum hold time, lease is not extended")
+                return
+
+            try:
+                if not await self.extend():
+                    return
+            except Exception as ex:
+                logger.warning(f"Failed to extend lock '{self.key}': {str(ex)}")
+
+    async def release(self) -> bool:
+        """
+        Release the lock if it is still held by this instance.
+
+        Stops lease renewal.
+
+        Returns:
+            bool: True if the lock was released, False if it had expired or was taken over.
+        """
+        if self._renewal_task is not None:
+            self._renewal_task.cancel()
+            self._renewal_task = None
+
+        async with redis_circuit_breaker.guard():
+            script = RedisCacheManager.get_script(self.release_script)
+            return bool(await script(keys=[self.key], args=[self.token]))
+
+    async def is_locked(self) -> bool:
+        """
+        Check whether the lock is currently held by anyone.
+
+        Returns:
+            bool: True if the lock key exists.
+        """
+        async with redis_circuit_breaker.guard():
+            redis_client = RedisCacheManager.get_redis_client()
+            return bool(await redis_client.exists(self.key))
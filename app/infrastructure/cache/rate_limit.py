@@ -0,0 +1,143 @@
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+from app.exceptions import CircuitOpenException
+from app.kernel.logs import logger
+from .redis_cache import RedisCacheManager, redis_circuit_breaker
+
+
+class RateLimitResult(BaseModel):
+    """
+    Outcome of a rate limit check.
+
+    Attributes:
+        allowed: Whether the request fits into the quota.
+        limit: Requests allowed per period.
+        remaining: Requests left in the current window.
+        retry_after: Seconds until the next request is allowed (0 if allowed).
+        reset_after: Seconds until the quota is fully replenished.
+    """
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int = 0
+    reset_after: int = 0
+
+    def get_headers(self) -> Dict[str, str]:
+        """Build standard rate limit response headers (with Retry-After if denied)."""
+        headers = {
+            "RateLimit-Limit": str(self.limit),
+            "RateLimit-Remaining": str(self.remaining),
+            "RateLimit-Reset": str(self.reset_after),
+        }
+        if not self.allowed:
+            headers["Retry-After"] = str(self.retry_after)
+        return headers
+
+
+class RedisRateLimiter:
+    """
+    Per-client rate limiter based on GCRA (generic cell rate algorithm).
+
+    Each client has one Redis key holding its theoretical arrival time,
+    updated by a Lua script with a single round trip per check. Requests
+    are spread at `period / limit` intervals with bursts up to `limit`.
+
+    Clients rejected by Redis are remembered locally until they may retry,
+    so clearly over-limit clients are rejected without touching Redis.
+    """
+
+    gcra_script = """
+        local time = redis.call("TIME")
+        local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+        local emission_interval = tonumber(ARGV[1])
+        local tolerance = tonumber(ARGV[2])
+
+        local tat = tonumber(redis.call("GET", KEYS[1]) or now)
+        if tat < now then
+            tat = now
+        end
+
+        local new_tat = tat + emission_interval
+        local allow_at = new_tat - tolerance
+        if now < allow_at then
+            return {0, 0, allow_at - now, tat - now}
+        end
+
+        redis.call("SET", KEYS[1], new_tat, "PX", new_tat - now)
+        return {1, math.floor((tolerance - (new_tat - now)) / emission_interval), 0, new_tat - now}
+    """
+
+    def __init__(self, key_prefix: str, limit: int, period: int, local_cache_size: int = 10000):
+        self.key_prefix = key_prefix
+        self.limit = limit
+        self.period = period
+        self.local_cache_size = local_cache_size
+        # whole milliseconds keep script arithmetic and stored values integral
+        self._emission_interval_ms = max(period * 1000 // limit, 1)
+        self._blocked_until: OrderedDict[str, float] = OrderedDict()
+
+    def _check_local(self, client_id: str) -> Optional[RateLimitResult]:
+        """Reject client remembered as over limit (None if it has to be checked in Redis)."""
+        blocked_until = self._blocked_until.get(client_id)
+        if blocked_until is None:
+            return None
+
+        retry_after = blocked_until - time.monotonic()
+        if retry_after <= 0:
+            self._blocked_until.pop(client_id, None)
+            return None
+
+        return RateLimitResult(
+            allowed=False,
+            limit=self.limit,
+            remaining=0,
+            retry_after=math.ceil(retry_after),
+            reset_after=self.period)
+
+    def _remember_blocked(self, client_id: str, retry_after: float):
+        """Remember over-limit client locally until it may retry."""
+        self._blocked_until[client_id] = time.monotonic() + retry_after
+        self._blocked_until.move_to_end(client_id)
+        while len(self._blocked_until) > self.local_cache_size:
+            self._blocked_until.popitem(last=False)
+
+    async def hit(self, client_id: str) -> Optional[RateLimitResult]:
+        """
+        Count a request of a client against its quota.
+
+        Args:
+            client_id: Client identifier.
+
+        Returns:
+            Optional[RateLimitResult]: Check result, None if Redis is unavailable (requests are allowed).
+        """
+        local_result = self._check_local(client_id)
+        if local_result:
+            return local_result
+
+        try:
+            async with redis_circuit_breaker.guard():
+                script = RedisCacheManager.get_script(self.gcra_script)
+                allowed, remaining, retry_after_ms, reset_after_ms = await script(
+                    keys=[f"{self.key_prefix}:{client_id}"],
+                    args=[self._emission_interval_ms, self._emission_interval_ms * self.limit])
+        except CircuitOpenException:
+            return None
+        except Exception as ex:
+            logger.warning(f"Rate limit check failed, allowing request: {str(ex)}")
+            return None
+
+        if not allowed:
+            self._remember_blocked(client_id, retry_after_ms / 1000)
+
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=self.limit,
+            remaining=max(int(remaining), 0),
+            retry_after=math.ceil(float(retry_after_ms) / 1000),
+            reset_after=math.ceil(float(reset_after_ms) / 1000))
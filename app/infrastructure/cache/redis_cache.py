@@ -1,9 +1,25 @@
-from typing import Optional
+from typing import Dict, Optional, Union
 
-from aiocache import Cache
 import redis.asyncio as redis
+from redis.exceptions import ConnectionError as RedisConnectionError, TimeoutError as RedisTimeoutError
+from redis.asyncio.cluster import RedisCluster, ClusterNode
+from redis.commands.core import AsyncScript
+from redis.asyncio.sentinel import Sentinel
+from redis.cluster import LoadBalancingStrategy
 
 from app.kernel.settings import redis_settings
+from app.utils.concurrency import CircuitBreaker
+
+RedisClient = Union[redis.Redis, RedisCluster]
+
+# Shared by all Redis callers, so a failing Redis is skipped instantly everywhere
+redis_circuit_breaker = CircuitBreaker(
+    name="redis.circuit",
+    failure_threshold=redis_settings.circuit_failure_threshold,
+    slow_call_duration=redis_settings.circuit_slow_call_ms / 1000,
+    recovery_timeout=redis_settings.circuit_recovery_timeout,
+    failure_exceptions=(RedisConnectionError, RedisTimeoutError, OSError),
+    enabled=redis_settings.circuit_breaker_enabled)
 
 
 class RedisCacheManager:
@@ -11,19 +27,27 @@ class RedisCacheManager:
     Redis cache manager with connection pooling and lifecycle management.
 
     Provides singleton-style Redis connections with proper initialization,
-    cleanup, and connection testing for both raw Redis and AIOCache instances.
+    cleanup, and connection testing. Supports a single node, Redis Cluster
+    and Sentinel-managed master/replicas (see `redis_settings.mode`), with
+    optional routing of cache reads to replicas. All cache operations share
+    the same bounded connection pools configured by `redis_settings`.
+    Pub/sub uses a separate client without command reply timeout, since a
+    subscription may stay quiet for any time.
     """
 
-    _redis_pool: Optional[redis.ConnectionPool] = None
-    _aiocache_instance: Optional[Cache] = None
+    _redis_pool: Optional[redis.BlockingConnectionPool] = None
+    _redis_client: Optional[RedisClient] = None
+    _read_client: Optional[RedisClient] = None
+    _pubsub_client: Optional[redis.Redis] = None
+    _scripts: Dict[str, AsyncScript] = {}
     _initialized: bool = False
 
     @classmethod
     async def initialize(cls):
         """
-        Initialize Redis connection pool and AIOCache instance.
+        Initialize Redis connections.
 
-        Creates connection pool, configures AIOCache, and tests connectivity.
+        Creates clients for the configured mode and tests connectivity.
         Safe to call multiple times - will skip if already initialized.
 
         Raises:
@@ -32,71 +56,177 @@ class RedisCacheManager:
         if cls._initialized:
             return
 
-        # Redis connection pool
-        cls._redis_pool = redis.ConnectionPool(
+        if redis_settings.mode == "cluster":
+            cls._initialize_cluster()
+        elif redis_settings.mode == "sentinel":
+            cls._initialize_sentinel()
+        else:
+            cls._initialize_standalone()
+
+        # Test connections
+        await cls._redis_client.ping()
+        if cls._read_client is not cls._redis_client:
+            await cls._read_client.ping()
+
+        cls._initialized = True
+
+    @classmethod
+    def _initialize_standalone(cls):
+        """
+        Create connection pool for a single Redis node.
+
+        When all `max_connections` connections are busy, callers wait up to
+        `pool_timeout` seconds for a free one instead of opening more.
+        """
+        cls._redis_pool = redis.BlockingConnectionPool(
             host=redis_settings.host,
-            password=redis_settings.password,
             port=redis_settings.port,
             db=redis_settings.db,
-            decode_responses=True,
-            max_connections=redis_settings.max_connections)
-
-        # AIOCache instance
-        cls._aiocache_instance = Cache(
-            Cache.REDIS,
-            endpoint=redis_settings.host,
-            password=redis_settings.password,
+            max_connections=redis_settings.max_connections,
+            timeout=redis_settings.pool_timeout,
+            **redis_settings.get_connection_params())
+        cls._redis_client = redis.Redis(connection_pool=cls._redis_pool)
+        cls._read_client = cls._redis_client
+        cls._pubsub_client = redis.Redis(
+            host=redis_settings.host,
             port=redis_settings.port,
-            db=redis_settings.db)
+            db=redis_settings.db,
+            **redis_settings.get_pubsub_connection_params())
 
-        # Test connections
-        redis_client = redis.Redis(connection_pool=cls._redis_pool)
-        await redis_client.ping()
-        await cls._aiocache_instance.set("test", "ok", ttl=10)
+    @classmethod
+    def _initialize_cluster(cls):
+        """
+        Create Redis Cluster clients.
 
-        cls._initialized = True
+        Commands are routed to the slot owners. Pub/sub uses a plain connection
+        to one startup node, since cluster nodes forward published messages to
+        each other.
+        """
+        startup_nodes = [ClusterNode(host, port) for host, port in redis_settings.get_cluster_nodes()]
+        cluster_params = {
+            **redis_settings.get_connection_params(),
+            "max_connections": redis_settings.max_connections,
+        }
+        cls._redis_client = RedisCluster(startup_nodes=startup_nodes, **cluster_params)
+        cls._read_client = cls._redis_client
+        if redis_settings.read_from_replicas:
+            cls._read_client = RedisCluster(
+                startup_nodes=startup_nodes,
+                load_balancing_strategy=LoadBalancingStrategy.ROUND_ROBIN_REPLICAS,
+                **cluster_params)
+
+        host, port = redis_settings.get_cluster_nodes()[0]
+        cls._pubsub_client = redis.Redis(host=host, port=port, **redis_settings.get_pubsub_connection_params())
+
+    @classmethod
+    def _initialize_sentinel(cls):
+        """Create clients of the Sentinel-managed master (and replicas for reads)."""
+        sentinel_kwargs = {"password": redis_settings.sentinel_password} if redis_settings.sentinel_password else None
+        sentinel = Sentinel(
+            redis_settings.get_sentinel_nodes(),
+            sentinel_kwargs=sentinel_kwargs,
+            db=redis_settings.db,
+            **redis_settings.get_connection_params())
+
+        cls._redis_client = sentinel.master_for(
+            redis_settings.sentinel_master,
+            max_connections=redis_settings.max_connections)
+        cls._read_client = cls._redis_client
+        if redis_settings.read_from_replicas:
+            cls._read_client = sentinel.slave_for(
+                redis_settings.sentinel_master,
+                max_connections=redis_settings.max_connections)
+        cls._pubsub_client = sentinel.master_for(redis_settings.sentinel_master, socket_timeout=None)
 
     @classmethod
     async def cleanup(cls):
         """
         Clean up Redis connections and reset initialization state.
 
-        Properly disconnects connection pool and clears all instances.
+        Properly disconnects all clients and clears all instances.
         """
-
+        clients = {id(client): client for client in (cls._redis_client, cls._read_client, cls._pubsub_client)}
         if cls._redis_pool:
             await cls._redis_pool.disconnect()
+            clients.pop(id(cls._redis_client))
+        for client in clients.values():
+            if client is not None:
+                await client.aclose()
 
         cls._redis_pool = None
-        cls._aiocache_instance = None
+        cls._redis_client = None
+        cls._read_client = None
+        cls._pubsub_client = None
+        cls._scripts = {}
         cls._initialized = False
 
     @classmethod
-    def get_redis_client(cls) -> redis.Redis:
+    def get_redis_client(cls) -> RedisClient:
+        """
+        Get Redis client for writes and consistent reads.
+
+        Returns:
+            RedisClient: Redis (or Redis Cluster) client using shared connections.
+
+        Raises:
+            RuntimeError: If cache manager not initialized.
+        """
+        if not cls._initialized:
+            raise RuntimeError("Cache not initialized")
+        return cls._redis_client
+
+    @classmethod
+    def get_read_client(cls) -> RedisClient:
         """
-        Get Redis client with connection pooling.
+        Get Redis client for cache reads.
+
+        Routes reads to replicas when `redis_settings.read_from_replicas` is enabled
+        (reads may lag behind writes), otherwise same as `get_redis_client`.
 
         Returns:
-            redis.Redis: Redis client instance using shared connection pool.
+            RedisClient: Redis (or Redis Cluster) client for reads.
 
         Raises:
             RuntimeError: If cache manager not initialized.
         """
         if not cls._initialized:
             raise RuntimeError("Cache not initialized")
-        return redis.Redis(connection_pool=cls._redis_pool)
+        return cls._read_client
+
+    @classmethod
+    def get_script(cls, script: str) -> AsyncScript:
+        """
+        Get Lua script registered with the Redis client for writes.
+
+        Scripts are registered once per client and run with EVALSHA,
+        loading the script only when Redis does not know it yet.
+
+        Args:
+            script: Lua script source.
+
+        Returns:
+            AsyncScript: Callable script bound to the Redis client.
+
+        Raises:
+            RuntimeError: If cache manager not initialized.
+        """
+        registered_script = cls._scripts.get(script)
+        if registered_script is None:
+            registered_script = cls.get_redis_client().register_script(script)
+            cls._scripts[script] = registered_script
+        return registered_script
 
     @classmethod
-    def get_aiocache(cls) -> Cache:
+    def get_pubsub_client(cls) -> redis.Redis:
         """
-        Get AIOCache instance for Redis.
+        Get Redis client supporting pub/sub subscriptions.
 
         Returns:
-            Cache: Configured AIOCache instance for Redis operations.
+            redis.Redis: Redis client connected to a single node.
 
         Raises:
             RuntimeError: If cache manager not initialized.
         """
         if not cls._initialized:
             raise RuntimeError("Cache not initialized")
-        return cls._aiocache_instance
+        return cls._pubsub_client
@@ -0,0 +1,61 @@
+from typing import Optional
+
+import httpx
+
+from app.kernel.settings import http_settings
+
+
+class HttpClientManager:
+    """
+    Shared HTTP client manager with connection pooling and lifecycle management.
+
+    Keeps one httpx.AsyncClient per worker process so outgoing requests reuse
+    keep-alive connections instead of opening a new pool for every call.
+    """
+
+    _client: Optional[httpx.AsyncClient] = None
+    _initialized: bool = False
+
+    @classmethod
+    async def initialize(cls):
+        """
+        Initialize shared HTTP client with configured pool limits.
+
+        Safe to call multiple times - will skip if already initialized.
+        """
+        if cls._initialized:
+            return
+
+        cls._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=http_settings.max_connections,
+                max_keepalive_connections=http_settings.max_keepalive_connections,
+                keepalive_expiry=http_settings.keepalive_expiry))
+
+        cls._initialized = True
+
+    @classmethod
+    async def cleanup(cls):
+        """
+        Close shared HTTP client and reset initialization state.
+        """
+        if cls._client:
+            await cls._client.aclose()
+
+        cls._client = None
+        cls._initialized = False
+
+    @classmethod
+    def get_client(cls) -> httpx.AsyncClient:
+        """
+        Get shared HTTP client.
+
+        Returns:
+            httpx.AsyncClient: Client instance using the worker connection pool.
+
+        Raises:
+            RuntimeError: If HTTP client manager not initialized.
+        """
+        if not cls._initialized:
+            raise RuntimeError("HTTP client not initialized")
+        return cls._client
@@ -3,8 +3,11 @@ from typing import Optional
 from fastapi import FastAPI
 from pydantic import ValidationError
 
-from app.infrastructure.cache import RedisCacheManager
-from app.kernel.settings import app_settings
+from app.infrastructure.aws import aws_client
+from app.infrastructure.cache import CacheManager, RedisCacheManager
+from app.infrastructure.http import HttpClientManager
+from app.kernel.loop_monitor import EventLoopMonitor
+from app.kernel.settings import app_settings, rate_limit_settings
 
 
 class AppFactory:
@@ -20,7 +23,7 @@ class AppFactory:
         """
         Initialize and configure the FastAPI application.
 
-        Sets up exception handlers, startup/shutdown events, and API routing.
+        Sets up exception handlers, middlewares, startup/shutdown events, and API routing.
 
         Args:
             app: Optional FastAPI instance to configure (creates new if None).
@@ -34,26 +37,60 @@ class AppFactory:
         if not app_settings.debug:
             instance.register_exception_handlers()
 
+        instance.register_middlewares()
         instance.attach_app_startup_events()
         instance.attach_app_shutdown_events()
         return instance.app
 
+    def register_middlewares(self):
+        """
+        Register ASGI middlewares for the application.
+
+        Adds negotiated response compression (zstd, br, gzip) and per-client
+        rate limiting (outermost, so rejected requests do no other work).
+        """
+        from app.api.middlewares import CompressionMiddleware, RateLimitMiddleware
+
+        self.app.add_middleware(CompressionMiddleware, minimum_size=app_settings.response_compression_min_size)
+        if rate_limit_settings.enabled:
+            self.app.add_middleware(RateLimitMiddleware)
+
     def attach_app_startup_events(self):
         """
         Attach app startup events to the FastAPI application.
 
-        Registers API routing and Redis cache initialization on startup.
+        Registers API routing and per-worker connection pools (Redis, HTTP, AWS) on startup,
+        then starts cache warm-up, city request counting and the live weather updates listener
+        once the pools are available.
         """
+        from app.domains.weather import CityRequestCounter, WeatherCacheWarmupService, WeatherUpdatesBroadcaster
+
         self.app.add_event_handler("startup", self.attach_api)
+        self.app.add_event_handler("startup", EventLoopMonitor.start)
         self.app.add_event_handler("startup", RedisCacheManager.initialize)
+        self.app.add_event_handler("startup", HttpClientManager.initialize)
+        self.app.add_event_handler("startup", aws_client.initialize)
+        self.app.add_event_handler("startup", WeatherCacheWarmupService.start)
+        self.app.add_event_handler("startup", CityRequestCounter.start)
+        self.app.add_event_handler("startup", WeatherUpdatesBroadcaster.start)
 
     def attach_app_shutdown_events(self):
         """
         Attach app shutdown events to the FastAPI application.
 
-        Registers Redis cache cleanup on application shutdown.
+        Stops background tasks (writing the remaining city request counts) and releases
+        per-worker connection pools on application shutdown.
         """
+        from app.domains.weather import CityRequestCounter, WeatherCacheWarmupService, WeatherUpdatesBroadcaster
+
+        self.app.add_event_handler("shutdown", WeatherCacheWarmupService.stop)
+        self.app.add_event_handler("shutdown", CityRequestCounter.stop)
+        self.app.add_event_handler("shutdown", WeatherUpdatesBroadcaster.stop)
+        self.app.add_event_handler("shutdown", CacheManager.cleanup)
         self.app.add_event_handler("shutdown", RedisCacheManager.cleanup)
+        self.app.add_event_handler("shutdown", HttpClientManager.cleanup)
+        self.app.add_event_handler("shutdown", aws_client.cleanup)
+        self.app.add_event_handler("shutdown", EventLoopMonitor.stop)
 
     def attach_api(self):
         """Attach API endpoints to the FastAPI application instance."""
@@ -67,12 +104,22 @@ class AppFactory:
         Maps custom exceptions and validation errors to appropriate HTTP responses.
         """
         from app.api import exception_handlers
-        from app.exceptions import NotFoundException, BadRequestException, BadGatewayException
+        from app.exceptions import (
+            NotFoundException, ForbiddenException, BadRequestException, BadGatewayException,
+            ServiceUnavailableException, TooManyRequestsException, DeadlineExceededException
+        )
 
         self.app.add_exception_handler(ValidationError, exception_handlers.pyd_validation_exception_handler)
         self.app.add_exception_handler(NotFoundException, exception_handlers.not_found_exception_handler)
+        self.app.add_exception_handler(ForbiddenException, exception_handlers.forbidden_exception_handler)
         self.app.add_exception_handler(BadRequestException, exception_handlers.bad_request_exception_handler)
         self.app.add_exception_handler(BadGatewayException, exception_handlers.bad_gateway_exception_handler)
+        self.app.add_exception_handler(
+            ServiceUnavailableException, exception_handlers.service_unavailable_exception_handler)
+        self.app.add_exception_handler(
+            TooManyRequestsException, exception_handlers.too_many_requests_exception_handler)
+        self.app.add_exception_handler(
+            DeadlineExceededException, exception_handlers.deadline_exceeded_exception_handler)
         self.app.add_exception_handler(ValueError, exception_handlers.bad_request_exception_handler)
         self.app.add_exception_handler(TypeError, exception_handlers.unexcpected_code_error_exception_handler)
         self.app.add_exception_handler(Exception, exception_handlers.unexcpected_code_error_exception_handler)
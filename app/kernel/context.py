@@ -0,0 +1,9 @@
+from contextvars import ContextVar
+from typing import Optional
+
+__all__ = [
+    "client_id_context",
+]
+
+# identifier of the client making the current request (API key or IP based), set by rate limiting
+client_id_context: ContextVar[Optional[str]] = ContextVar("client_id", default=None)
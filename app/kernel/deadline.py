@@ -0,0 +1,69 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator, Optional
+
+from app.exceptions import DeadlineExceededException
+
+__all__ = [
+    "request_deadline_context",
+    "request_deadline",
+    "get_remaining_time",
+    "enforce_deadline",
+]
+
+# monotonic time by which the current request has to be answered, set at the route
+request_deadline_context: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+@contextmanager
+def request_deadline(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Set deadline of the operations run within the context.
+
+    Args:
+        timeout: Time budget in seconds from now (None removes the deadline).
+    """
+    token = request_deadline_context.set(time.monotonic() + timeout if timeout is not None else None)
+    try:
+        yield
+    finally:
+        request_deadline_context.reset(token)
+
+
+def get_remaining_time() -> Optional[float]:
+    """
+    Get time left until the current deadline.
+
+    Returns:
+        Optional[float]: Seconds left (negative if exceeded), None if no deadline is set.
+    """
+    deadline = request_deadline_context.get()
+    return deadline - time.monotonic() if deadline is not None else None
+
+
+@asynccontextmanager
+async def enforce_deadline() -> AsyncIterator[None]:
+    """
+    Cancel the operations of the context when the current deadline is reached.
+
+    Raises:
+        DeadlineExceededException: If the deadline is already exceeded or is reached within the context.
+    """
+    remaining = get_remaining_time()
+    if remaining is None:
+        yield
+        return
+
+    if remaining <= 0:
+        raise DeadlineExceededException("Request deadline exceeded")
+
+    timeout = asyncio.timeout(remaining)
+    try:
+        async with timeout:
+            yield
+    except TimeoutError:
+        if timeout.expired():
+            raise DeadlineExceededException("Request deadline exceeded") from None
+        raise
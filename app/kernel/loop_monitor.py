@@ -0,0 +1,125 @@
+import asyncio
+import math
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Optional
+
+from app.kernel.logs import logger
+from app.kernel.metrics import metrics
+from app.kernel.settings import app_settings
+
+__all__ = [
+    "EventLoopMonitor",
+]
+
+
+class EventLoopMonitor:
+    """
+    Event loop lag monitor of the worker process.
+
+    A heartbeat task sleeps for a fixed interval and records how late the
+    loop wakes it up (scheduling lag), which is the delay every ready
+    coroutine waits before it runs. A watchdog thread checks the heartbeat
+    and, when the loop has not run it for longer than the slow callback
+    threshold, logs the loop thread stack while the blocking call is still
+    on it. Lag percentiles are exported as 'event_loop.*' metrics.
+    """
+
+    _task: Optional[asyncio.Task] = None
+    _watchdog: Optional[threading.Thread] = None
+    _stop_event: Optional[threading.Event] = None
+    _loop_thread_id: Optional[int] = None
+    _last_beat: float = 0.0
+    _lags: deque = deque(maxlen=app_settings.loop_monitor_window)
+
+    @classmethod
+    async def start(cls):
+        """
+        Start heartbeat task and watchdog thread.
+
+        Safe to call multiple times - will skip if already running.
+        """
+        if not app_settings.loop_monitor_enabled or cls._task is not None:
+            return
+
+        cls._loop_thread_id = threading.get_ident()
+        cls._last_beat = time.monotonic()
+        cls._stop_event = threading.Event()
+        cls._task = asyncio.create_task(cls._run_heartbeat())
+        cls._watchdog = threading.Thread(
+            target=cls._run_watchdog, args=(cls._stop_event,), name="event-loop-watchdog", daemon=True)
+        cls._watchdog.start()
+
+        for percentile in (50, 90, 99):
+            metrics.register_gauge(f"event_loop.lag_p{percentile}_ms", lambda p=percentile: cls.get_lag_percentile(p))
+        metrics.register_gauge("event_loop.lag_max_ms", lambda: max(cls._lags, default=0.0) * 1000)
+
+    @classmethod
+    async def stop(cls):
+        """
+        Stop heartbeat task and watchdog thread.
+
+        The watchdog is joined in a worker thread, so the loop keeps serving
+        other shutdown handlers while it finishes its current check.
+        """
+        if cls._task is not None and not cls._task.done():
+            cls._task.cancel()
+        cls._task = None
+
+        watchdog, stop_event = cls._watchdog, cls._stop_event
+        cls._watchdog = None
+        cls._stop_event = None
+        if stop_event is not None:
+            stop_event.set()
+        if watchdog is not None:
+            await asyncio.to_thread(watchdog.join)
+
+    @classmethod
+    def get_lag_percentile(cls, percentile: float) -> float:
+        """
+        Get percentile of recent scheduling lags.
+
+        Args:
+            percentile: Percentile (0-100).
+
+        Returns:
+            float: Lag in milliseconds, 0 if no lags were recorded yet.
+        """
+        lags = sorted(cls._lags)
+        if not lags:
+            return 0.0
+        index = math.ceil(percentile / 100 * len(lags)) - 1
+        return lags[min(max(index, 0), len(lags) - 1)] * 1000
+
+    @classmethod
+    async def _run_heartbeat(cls):
+        """Measure how late the loop resumes a sleeping task."""
+        interval = app_settings.loop_monitor_interval_ms / 1000
+        while True:
+            scheduled_at = time.monotonic()
+            await asyncio.sleep(interval)
+            cls._last_beat = time.monotonic()
+            cls._lags.append(max(cls._last_beat - scheduled_at - interval, 0.0))
+
+    @classmethod
+    def _run_watchdog(cls, stop_event: threading.Event):
+        """Log loop thread stack when the heartbeat stalls beyond the slow callback threshold."""
+        interval = app_settings.loop_monitor_interval_ms / 1000
+        threshold = app_settings.loop_monitor_slow_callback_ms / 1000
+        reported_beat = None
+
+        while not stop_event.wait(threshold / 2):
+            last_beat = cls._last_beat
+            blocked_for = time.monotonic() - last_beat - interval
+            if blocked_for < threshold or last_beat == reported_beat:
+                continue
+
+            # one report per stall, the stack is sampled while the blocking callback is still running
+            reported_beat = last_beat
+            metrics.increment("event_loop.slow_callbacks")
+            frame = sys._current_frames().get(cls._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame, limit=app_settings.loop_monitor_stack_limit)) if frame else ""
+            logger.warning(f"Event loop blocked for over {blocked_for * 1000:.0f} ms. Loop thread stack:\n{stack}")
@@ -0,0 +1,50 @@
+from typing import Callable, Dict
+
+
+class MetricsRegistry:
+    """
+    In-process registry of operational metrics.
+
+    Holds monotonically increasing counters and gauges evaluated on read,
+    so components report their state without pushing updates. Values are
+    per worker process.
+    """
+
+    def __init__(self):
+        self._counters: Dict[str, float] = {}
+        self._gauges: Dict[str, Callable[[], float]] = {}
+
+    def increment(self, name: str, value: float = 1):
+        """
+        Increase counter value.
+
+        Args:
+            name: Counter name.
+            value: Increment (default: 1).
+        """
+        self._counters[name] = self._counters.get(name, 0) + value
+
+    def register_gauge(self, name: str, callback: Callable[[], float]):
+        """
+        Register gauge evaluated when metrics are read.
+
+        Args:
+            name: Gauge name.
+            callback: Function returning the current gauge value.
+        """
+        self._gauges[name] = callback
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Get current values of all metrics.
+
+        Returns:
+            Dict[str, float]: Metric values by name.
+        """
+        result = dict(self._counters)
+        for name, callback in self._gauges.items():
+            result[name] = callback()
+        return dict(sorted(result.items()))
+
+
+metrics = MetricsRegistry()
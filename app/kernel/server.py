@@ -0,0 +1,34 @@
+import random
+
+import uvicorn
+
+__all__ = [
+    "WorkerConfig",
+]
+
+
+class WorkerConfig(uvicorn.Config):
+    """
+    Uvicorn config recycling each worker after a randomized number of requests.
+
+    Workers of one server start together and serve a similar share of the
+    traffic, so with the same `limit_max_requests` they would all restart
+    at about the same time. Each worker process loads the config on its own
+    start and adds a random jitter of up to `limit_max_requests_jitter`
+    requests to its limit, which spreads the restarts out.
+
+    Args:
+        limit_max_requests_jitter: Maximum number of requests added to `limit_max_requests`
+            of a worker (0 disables the jitter).
+        **kwargs: uvicorn.Config arguments.
+    """
+
+    def __init__(self, *args, limit_max_requests_jitter: int = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.limit_max_requests_jitter = limit_max_requests_jitter
+
+    def load(self):
+        """Load the application and draw the request limit of this worker."""
+        if self.limit_max_requests and self.limit_max_requests_jitter > 0:
+            self.limit_max_requests += random.randint(0, self.limit_max_requests_jitter)
+        super().load()
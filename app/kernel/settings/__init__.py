@@ -2,3 +2,7 @@ from .app import app_settings
 from .open_weather import open_weather_settings
 from .redis import redis_settings
 from .aws import aws_settings
+from .http import http_settings
+from .weather import weather_settings
+from .rate_limit import rate_limit_settings
+from .cache import cache_settings
@@ -1,6 +1,8 @@
+import os
 from pathlib import Path
-from typing import Literal
+from typing import Literal, Optional
 
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
@@ -12,12 +14,47 @@ class SettingsApp(BaseSettings):
         debug: Whether the application is running in debug mode.
         app_port: The port for the application on which the server is running.
         app_reload: Whether to enable auto-reload in development.
+        app_server_mode: Server launch mode ('development' runs a single process,
+            'production' runs multiple workers with uvloop and httptools).
+        app_workers: Number of worker processes in production mode (default: CPU count).
+        app_max_requests: Requests served by a worker before it is recycled (0 disables recycling).
+        app_max_requests_jitter: Maximum random number of requests added to `app_max_requests` per worker,
+            so workers are not recycled at the same time (0 disables the jitter).
+        app_graceful_shutdown_timeout: Seconds to wait for in-flight requests on worker shutdown.
+        response_compression_min_size: Minimum response size in bytes to compress (default: 500).
         log_level: The log level for the application.
+        admin_token: Token required in the X-Admin-Token header by admin endpoints (admin endpoints
+            reject all requests if not set).
+        profiling_enabled: Whether the on-demand profiling endpoint is available.
+        profiling_max_duration: Maximum duration of one profiling run in seconds.
+        profiling_sample_interval_ms: Interval between stack samples of the sampling profiler.
+        profiling_max_snapshots: Maximum number of memory snapshots kept per worker.
+        loop_monitor_enabled: Whether to monitor event loop lag and log slow callbacks.
+        loop_monitor_interval_ms: Interval between event loop heartbeats.
+        loop_monitor_slow_callback_ms: Event loop blocking time above which the loop thread stack is logged.
+        loop_monitor_window: Number of recent heartbeats used for lag percentiles.
+        loop_monitor_stack_limit: Maximum number of frames in logged loop thread stacks.
     """
     debug: bool = False
     app_port: int = 8000
     app_reload: bool = False
+    app_server_mode: Literal["development", "production"] = "development"
+    app_workers: int = Field(default_factory=lambda: os.cpu_count() or 1)
+    app_max_requests: int = 10000
+    app_max_requests_jitter: int = 1000
+    app_graceful_shutdown_timeout: int = 30
+    response_compression_min_size: int = 500
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO"
+    admin_token: Optional[str] = None
+    profiling_enabled: bool = False
+    profiling_max_duration: int = 60
+    profiling_sample_interval_ms: float = 5.0
+    profiling_max_snapshots: int = 10
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_ms: float = 100.0
+    loop_monitor_slow_callback_ms: float = 100.0
+    loop_monitor_window: int = 600
+    loop_monitor_stack_limit: int = 20
 
     @property
     def app_dir(self):
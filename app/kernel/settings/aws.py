@@ -11,11 +11,13 @@ class SettingsAws(BaseSettings):
         region: AWS region for service operations.
         secret_access_key: AWS secret access key for authentication.
         access_key_id: AWS access key ID for authentication.
+        max_pool_connections: Maximum connections per AWS service client (default: 20).
     """
     endpoint_url: str = Field(default=None, validation_alias="AWS_ENDPOINT_URL")
     region: str = Field(default=None, validation_alias="AWS_REGION")
     secret_access_key: str = Field(default=None, validation_alias="AWS_SECRET_ACCESS_KEY")
     access_key_id: str = Field(default=None, validation_alias="AWS_ACCESS_KEY_ID")
+    max_pool_connections: int = Field(default=20, validation_alias="AWS_MAX_POOL_CONNECTIONS")
 
 
 aws_settings = SettingsAws()
@@ -0,0 +1,23 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SettingsCache(BaseSettings):
+    """
+    Local cache engines settings.
+
+    Attributes:
+        memory_max_keys: Maximum keys held by the in-memory engine of each worker,
+            least recently used keys are evicted (default: 100000).
+        disk_path: SQLite database file of the disk engine (default: 'data/cache.sqlite3').
+        disk_busy_timeout: Seconds a disk engine query waits for a lock held
+            by another worker (default: 5).
+        disk_purge_interval: Minimum seconds between deletions of expired disk engine rows (default: 60).
+    """
+    memory_max_keys: int = Field(default=100000, ge=1, validation_alias="CACHE_MEMORY_MAX_KEYS")
+    disk_path: str = Field(default="data/cache.sqlite3", validation_alias="CACHE_DISK_PATH")
+    disk_busy_timeout: float = Field(default=5.0, gt=0, validation_alias="CACHE_DISK_BUSY_TIMEOUT")
+    disk_purge_interval: int = Field(default=60, ge=0, validation_alias="CACHE_DISK_PURGE_INTERVAL")
+
+
+cache_settings = SettingsCache()
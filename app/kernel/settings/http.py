@@ -0,0 +1,19 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SettingsHttp(BaseSettings):
+    """
+    Outgoing HTTP client configuration settings.
+
+    Attributes:
+        max_connections: Maximum connections in the shared client pool (default: 100).
+        max_keepalive_connections: Maximum idle keep-alive connections (default: 20).
+        keepalive_expiry: Seconds an idle keep-alive connection is kept open (default: 30).
+    """
+    max_connections: int = Field(default=100, validation_alias="HTTP_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(default=20, validation_alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    keepalive_expiry: float = Field(default=30.0, validation_alias="HTTP_KEEPALIVE_EXPIRY")
+
+
+http_settings = SettingsHttp()
@@ -10,8 +10,37 @@ class SettingsOpenWeather(BaseSettings):
 
     Attributes:
         secret_key: API key for OpenWeatherMap service authentication.
+        batch_enabled: Whether to batch concurrent weather requests into group (city ID) queries.
+        batch_window_ms: Time window in milliseconds to collect weather requests for one batch (default: 5).
+        batch_max_size: Maximum city IDs per group query (default: 20, provider limit).
+        hedge_enabled: Whether to send a duplicate request when the first one is slow.
+        hedge_percentile: Latency percentile used as hedge delay (default: 95).
+        hedge_min_delay_ms: Lower bound of hedge delay in milliseconds (default: 50).
+        hedge_budget_percent: Maximum share of requests that may be hedged, in percent (default: 5).
+        hedge_latency_window: Number of recent requests used for latency and budget tracking (default: 200).
+        hedge_min_samples: Latency samples required before hedging starts (default: 20).
+        request_deadline: Overall time budget of a request including retries, in seconds (default: 8).
+        attempt_timeout: Timeout of a single request attempt in seconds (default: 3).
+        retry_max_attempts: Maximum attempts of a request, 1 disables retries (default: 3).
+        retry_base_delay_ms: Backoff bound before the first retry in milliseconds, doubled
+            with every further retry (default: 100).
+        retry_max_delay_ms: Upper bound of the backoff in milliseconds (default: 2000).
     """
     secret_key: Optional[str] = Field(default=None, validation_alias="OPEN_WEATHER_MAP_KEY")
+    batch_enabled: bool = Field(default=False, validation_alias="OPEN_WEATHER_MAP_BATCH_ENABLED")
+    batch_window_ms: float = Field(default=5.0, validation_alias="OPEN_WEATHER_MAP_BATCH_WINDOW_MS")
+    batch_max_size: int = Field(default=20, ge=1, le=20, validation_alias="OPEN_WEATHER_MAP_BATCH_MAX_SIZE")
+    hedge_enabled: bool = Field(default=False, validation_alias="OPEN_WEATHER_MAP_HEDGE_ENABLED")
+    hedge_percentile: float = Field(default=95.0, gt=0, le=100, validation_alias="OPEN_WEATHER_MAP_HEDGE_PERCENTILE")
+    hedge_min_delay_ms: float = Field(default=50.0, ge=0, validation_alias="OPEN_WEATHER_MAP_HEDGE_MIN_DELAY_MS")
+    hedge_budget_percent: float = Field(default=5.0, ge=0, le=100, validation_alias="OPEN_WEATHER_MAP_HEDGE_BUDGET_PERCENT")
+    hedge_latency_window: int = Field(default=200, ge=1, validation_alias="OPEN_WEATHER_MAP_HEDGE_LATENCY_WINDOW")
+    hedge_min_samples: int = Field(default=20, ge=1, validation_alias="OPEN_WEATHER_MAP_HEDGE_MIN_SAMPLES")
+    request_deadline: float = Field(default=8.0, gt=0, validation_alias="OPEN_WEATHER_MAP_REQUEST_DEADLINE")
+    attempt_timeout: float = Field(default=3.0, gt=0, validation_alias="OPEN_WEATHER_MAP_ATTEMPT_TIMEOUT")
+    retry_max_attempts: int = Field(default=3, ge=1, validation_alias="OPEN_WEATHER_MAP_RETRY_MAX_ATTEMPTS")
+    retry_base_delay_ms: float = Field(default=100.0, ge=0, validation_alias="OPEN_WEATHER_MAP_RETRY_BASE_DELAY_MS")
+    retry_max_delay_ms: float = Field(default=2000.0, ge=0, validation_alias="OPEN_WEATHER_MAP_RETRY_MAX_DELAY_MS")
 
 
 open_weather_settings = SettingsOpenWeather()
@@ -0,0 +1,30 @@
+from pydantic import Field
+from pydantic_settings import BaseSettings
+
+
+class SettingsRateLimit(BaseSettings):
+    """
+    Per-client rate limiting settings.
+
+    Clients are identified by API key header, or by IP address when the header is missing.
+    Quotas are enforced with GCRA (smooth rate with burst up to the full quota).
+
+    Attributes:
+        enabled: Whether to rate limit API requests.
+        path_prefix: Only requests with this path prefix are limited (default: '/api/v1/weather').
+        api_key_header: Header carrying client API key (default: 'X-API-Key').
+        period: Quota period in seconds (default: 60).
+        requests_limit: Requests per period allowed to a client (default: 120).
+        misses_limit: Cache-miss requests (external API fetches) per period allowed to a client (default: 20).
+        local_cache_size: Maximum clients remembered as over limit by the local pre-check (default: 10000).
+    """
+    enabled: bool = Field(default=False, validation_alias="RATE_LIMIT_ENABLED")
+    path_prefix: str = Field(default="/api/v1/weather", validation_alias="RATE_LIMIT_PATH_PREFIX")
+    api_key_header: str = Field(default="X-API-Key", validation_alias="RATE_LIMIT_API_KEY_HEADER")
+    period: int = Field(default=60, ge=1, validation_alias="RATE_LIMIT_PERIOD")
+    requests_limit: int = Field(default=120, ge=1, validation_alias="RATE_LIMIT_REQUESTS")
+    misses_limit: int = Field(default=20, ge=1, validation_alias="RATE_LIMIT_MISSES")
+    local_cache_size: int = Field(default=10000, ge=1, validation_alias="RATE_LIMIT_LOCAL_CACHE_SIZE")
+
+
+rate_limit_settings = SettingsRateLimit()
@@ -1,3 +1,5 @@
+from typing import Any, Dict, List, Literal, Optional, Tuple
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -7,17 +9,87 @@ class SettingsRedis(BaseSettings):
     Redis connection configuration settings.
 
     Attributes:
+        mode: Deployment mode: 'standalone' (single node), 'cluster' or 'sentinel' (default: 'standalone').
         host: Redis server hostname or IP address.
         password: Redis server authentication password.
         port: Redis server port (default: 6379).
-        db: Redis database number (default: 0).
-        max_connections: Maximum connections in connection pool (default: 20).
+        db: Redis database number (default: 0, ignored in cluster mode).
+        max_connections: Maximum connections in connection pool (default: 20, per node in cluster mode).
+        pool_timeout: Seconds to wait for a free pooled connection before failing (default: 1).
+        socket_timeout: Seconds to wait for a command reply (default: 2).
+        socket_connect_timeout: Seconds to wait for a connection to be established (default: 2).
+        health_check_interval: Seconds a connection may stay idle before it is checked
+            with PING on its next use (default: 30, 0 disables checks).
+        cluster_nodes: Comma-separated 'host:port' startup nodes of the cluster
+            (defaults to host and port).
+        sentinel_nodes: Comma-separated 'host:port' Sentinel nodes (defaults to host and port 26379).
+        sentinel_master: Name of the master monitored by Sentinel (default: 'mymaster').
+        sentinel_password: Password of the Sentinel nodes (optional).
+        read_from_replicas: Whether to route cache reads to replicas (cluster and sentinel modes).
+        circuit_breaker_enabled: Whether to skip Redis instantly while it is failing (default: True).
+        circuit_failure_threshold: Consecutive failed or slow Redis calls opening the circuit (default: 5).
+        circuit_slow_call_ms: Redis calls slower than this count as failures (default: 500).
+        circuit_recovery_timeout: Seconds the circuit stays open before a probe call is let through (default: 5).
     """
+    mode: Literal["standalone", "cluster", "sentinel"] = Field(default="standalone", validation_alias="REDIS_MODE")
     host: str = Field(default=None, validation_alias="REDIS_HOST")
     password: str = Field(default=None, validation_alias="REDIS_PASSWORD")
     port: int = Field(default=6379, validation_alias="REDIS_PORT")
     db: int = Field(default=0, validation_alias="REDIS_DB")
     max_connections: int = Field(default=20, validation_alias="REDIS_MAX_CONNECTIONS")
+    pool_timeout: float = Field(default=1.0, validation_alias="REDIS_POOL_TIMEOUT")
+    socket_timeout: float = Field(default=2.0, validation_alias="REDIS_SOCKET_TIMEOUT")
+    socket_connect_timeout: float = Field(default=2.0, validation_alias="REDIS_SOCKET_CONNECT_TIMEOUT")
+    health_check_interval: int = Field(default=30, validation_alias="REDIS_HEALTH_CHECK_INTERVAL")
+    cluster_nodes: Optional[str] = Field(default=None, validation_alias="REDIS_CLUSTER_NODES")
+    sentinel_nodes: Optional[str] = Field(default=None, validation_alias="REDIS_SENTINEL_NODES")
+    sentinel_master: str = Field(default="mymaster", validation_alias="REDIS_SENTINEL_MASTER")
+    sentinel_password: Optional[str] = Field(default=None, validation_alias="REDIS_SENTINEL_PASSWORD")
+    read_from_replicas: bool = Field(default=False, validation_alias="REDIS_READ_FROM_REPLICAS")
+    circuit_breaker_enabled: bool = Field(default=True, validation_alias="REDIS_CIRCUIT_BREAKER_ENABLED")
+    circuit_failure_threshold: int = Field(default=5, ge=1, validation_alias="REDIS_CIRCUIT_FAILURE_THRESHOLD")
+    circuit_slow_call_ms: int = Field(default=500, ge=1, validation_alias="REDIS_CIRCUIT_SLOW_CALL_MS")
+    circuit_recovery_timeout: float = Field(default=5.0, gt=0, validation_alias="REDIS_CIRCUIT_RECOVERY_TIMEOUT")
+
+    def get_connection_params(self) -> Dict[str, Any]:
+        """Get connection parameters shared by all Redis clients."""
+        return {
+            "password": self.password,
+            "decode_responses": True,
+            "socket_timeout": self.socket_timeout,
+            "socket_connect_timeout": self.socket_connect_timeout,
+            "socket_keepalive": True,
+            "health_check_interval": self.health_check_interval,
+        }
+
+    def get_pubsub_connection_params(self) -> Dict[str, Any]:
+        """
+        Get connection parameters of pub/sub clients.
+
+        Subscribed connections wait for messages indefinitely, so they have no
+        command reply timeout (dead connections are detected by TCP keepalive).
+        """
+        return {**self.get_connection_params(), "socket_timeout": None}
+
+    @staticmethod
+    def _parse_nodes(nodes: Optional[str], default: Tuple[str, int]) -> List[Tuple[str, int]]:
+        """Parse comma-separated 'host:port' list."""
+        if not nodes:
+            return [default]
+
+        result = []
+        for node in nodes.split(","):
+            host, _, port = node.strip().rpartition(":")
+            result.append((host, int(port)))
+        return result
+
+    def get_cluster_nodes(self) -> List[Tuple[str, int]]:
+        """Get cluster startup nodes as (host, port) pairs."""
+        return self._parse_nodes(self.cluster_nodes, default=(self.host, self.port))
+
+    def get_sentinel_nodes(self) -> List[Tuple[str, int]]:
+        """Get Sentinel nodes as (host, port) pairs."""
+        return self._parse_nodes(self.sentinel_nodes, default=(self.host, 26379))
 
 
 redis_settings = SettingsRedis()
@@ -0,0 +1,113 @@
+from typing import List, Literal
+
+from pydantic import Field, model_validator
+from pydantic_settings import BaseSettings
+
+from .open_weather import open_weather_settings
+
+
+class SettingsWeather(BaseSettings):
+    """
+    Weather domain caching and warm-up settings.
+
+    Attributes:
+        cache_engine: Cache engine storing cities and weather pointers: 'redis' (shared by
+            all instances), 'memory' (per worker) or 'disk' (per host) (default: 'redis').
+        cache_update_interval: Provider update cadence in seconds. Cached weather expires when
+            a newer observation is expected, i.e. this long after its timestamp (default: 600).
+        cache_min_ttl: Minimum time to live in seconds for cached weather (default: 60).
+        cache_max_ttl: Maximum time to live in seconds for cached weather (default: 900).
+        cache_inline_payload: Whether to store weather payload (and its variants in `stored_encodings`)
+            in the city cache hash, so cache hits do not read the weather file from S3.
+        stored_encodings: Comma-separated content codings ('zstd', 'br', 'gzip') of compressed
+            variants stored with each weather file, each costing one more write (default: 'gzip').
+        warmup_enabled: Whether to preload cache for most requested cities on startup.
+        warmup_top_cities: Number of most requested cities to preload (default: 50).
+        warmup_concurrency: Maximum cities preloaded concurrently (default: 10).
+        warmup_coverage_threshold: Share of top cities (0-1) that must be warmed
+            before the service reports readiness (default: 0.8).
+        warmup_history_scan_limit: Maximum history events scanned to rank cities when no requests
+            were counted yet (default: 10000).
+        request_count_flush_interval: Seconds between writes of the per-city request counts
+            collected by a worker to the cache (default: 10).
+        stream_refresh_min_interval: Minimum seconds between weather refreshes of a streamed city (default: 30).
+        stream_heartbeat_interval: Seconds between keep-alive messages on idle streams (default: 15).
+        stream_send_timeout: Seconds a WebSocket send may take before the consumer is dropped (default: 5).
+        single_flight_lease_ms: Lease of the distributed lock held by the instance refreshing
+            a city (default: 10000). Must exceed the OpenWeatherMap request deadline (retries
+            included), so followers do not take over from a leader still retrying; a crashed
+            leader stalls followers for at most this long.
+        single_flight_max_hold_ms: Maximum time the leader keeps the lock by extending its lease,
+            and followers wait for the leader's result before fetching on their own (default: 30000).
+        single_flight_poll_interval_ms: Interval at which followers check for the leader's result (default: 50).
+        nearby_default_radius_km: Search radius of nearby weather lookups when not requested (default: 5).
+        nearby_max_radius_km: Maximum search radius of nearby weather lookups (default: 50).
+        nearby_search_count: Nearest cached cities checked for a fresh observation (default: 10).
+        upstream_max_concurrency: Maximum concurrent cache-miss fetches from external API (default: 50).
+        upstream_max_queue_size: Maximum cache-miss fetches waiting for admission before
+            excess requests are shed with 503 (default: 100).
+        upstream_queue_timeout: Seconds a cache-miss fetch may wait for admission (default: 2).
+        upstream_retry_after: Retry-After seconds sent with shed requests (default: 5).
+        request_deadline: Time budget of a weather request in seconds. When it runs out before
+            the weather is fetched, expired cached weather is served, or 504 if none (default: 5).
+        stale_read_timeout: Extra seconds allowed to read expired cached weather once the
+            request deadline is exceeded (default: 0.5).
+    """
+    cache_engine: Literal["redis", "memory", "disk"] = Field(default="redis", validation_alias="WEATHER_CACHE_ENGINE")
+    cache_update_interval: int = Field(default=600, ge=0, validation_alias="WEATHER_CACHE_UPDATE_INTERVAL")
+    cache_min_ttl: int = Field(default=60, ge=1, validation_alias="WEATHER_CACHE_MIN_TTL")
+    cache_max_ttl: int = Field(default=900, ge=1, validation_alias="WEATHER_CACHE_MAX_TTL")
+    cache_inline_payload: bool = Field(default=False, validation_alias="WEATHER_CACHE_INLINE_PAYLOAD")
+    stored_encodings: str = Field(default="gzip", validation_alias="WEATHER_STORED_ENCODINGS")
+    warmup_enabled: bool = Field(default=True, validation_alias="WEATHER_WARMUP_ENABLED")
+    warmup_top_cities: int = Field(default=50, validation_alias="WEATHER_WARMUP_TOP_CITIES")
+    warmup_concurrency: int = Field(default=10, validation_alias="WEATHER_WARMUP_CONCURRENCY")
+    warmup_coverage_threshold: float = Field(
+        default=0.8, ge=0, le=1, validation_alias="WEATHER_WARMUP_COVERAGE_THRESHOLD")
+    warmup_history_scan_limit: int = Field(default=10000, validation_alias="WEATHER_WARMUP_HISTORY_SCAN_LIMIT")
+    request_count_flush_interval: float = Field(
+        default=10.0, gt=0, validation_alias="WEATHER_REQUEST_COUNT_FLUSH_INTERVAL")
+    stream_refresh_min_interval: float = Field(default=30.0, validation_alias="WEATHER_STREAM_REFRESH_MIN_INTERVAL")
+    stream_heartbeat_interval: float = Field(default=15.0, validation_alias="WEATHER_STREAM_HEARTBEAT_INTERVAL")
+    stream_send_timeout: float = Field(default=5.0, validation_alias="WEATHER_STREAM_SEND_TIMEOUT")
+    single_flight_lease_ms: int = Field(default=10000, gt=0, validation_alias="WEATHER_SINGLE_FLIGHT_LEASE_MS")
+    single_flight_max_hold_ms: int = Field(default=30000, gt=0, validation_alias="WEATHER_SINGLE_FLIGHT_MAX_HOLD_MS")
+    single_flight_poll_interval_ms: int = Field(default=50, validation_alias="WEATHER_SINGLE_FLIGHT_POLL_INTERVAL_MS")
+    nearby_default_radius_km: float = Field(default=5.0, gt=0, validation_alias="WEATHER_NEARBY_DEFAULT_RADIUS_KM")
+    nearby_max_radius_km: float = Field(default=50.0, gt=0, validation_alias="WEATHER_NEARBY_MAX_RADIUS_KM")
+    nearby_search_count: int = Field(default=10, ge=1, validation_alias="WEATHER_NEARBY_SEARCH_COUNT")
+    upstream_max_concurrency: int = Field(default=50, ge=1, validation_alias="WEATHER_UPSTREAM_MAX_CONCURRENCY")
+    upstream_max_queue_size: int = Field(default=100, ge=0, validation_alias="WEATHER_UPSTREAM_MAX_QUEUE_SIZE")
+    upstream_queue_timeout: float = Field(default=2.0, gt=0, validation_alias="WEATHER_UPSTREAM_QUEUE_TIMEOUT")
+    upstream_retry_after: int = Field(default=5, ge=0, validation_alias="WEATHER_UPSTREAM_RETRY_AFTER")
+    request_deadline: float = Field(default=5.0, gt=0, validation_alias="WEATHER_REQUEST_DEADLINE")
+    stale_read_timeout: float = Field(default=0.5, gt=0, validation_alias="WEATHER_STALE_READ_TIMEOUT")
+
+    @model_validator(mode="after")
+    def validate_single_flight_lease(self) -> "SettingsWeather":
+        """Check that the single-flight lease outlives an upstream request and fits the maximum hold time."""
+        if self.single_flight_lease_ms <= open_weather_settings.request_deadline * 1000:
+            raise ValueError(
+                f"WEATHER_SINGLE_FLIGHT_LEASE_MS ({self.single_flight_lease_ms}) must exceed "
+                f"OPEN_WEATHER_MAP_REQUEST_DEADLINE ({open_weather_settings.request_deadline} s) "
+                f"to leave time for storing the result")
+        if self.single_flight_max_hold_ms < self.single_flight_lease_ms:
+            raise ValueError(
+                f"WEATHER_SINGLE_FLIGHT_MAX_HOLD_MS ({self.single_flight_max_hold_ms}) must not be less than "
+                f"WEATHER_SINGLE_FLIGHT_LEASE_MS ({self.single_flight_lease_ms})")
+        return self
+
+    @model_validator(mode="after")
+    def validate_stored_encodings(self) -> "SettingsWeather":
+        """Check that stored variants use supported content codings."""
+        unsupported = set(self.get_stored_encodings()) - {"zstd", "br", "gzip"}
+        if unsupported:
+            raise ValueError(f"WEATHER_STORED_ENCODINGS has unsupported content codings: {', '.join(unsupported)}")
+        return self
+
+    def get_stored_encodings(self) -> List[str]:
+        """Get content codings of stored compressed weather variants."""
+        return [encoding.strip().lower() for encoding in self.stored_encodings.split(",") if encoding.strip()]
+
+
+weather_settings = SettingsWeather()
@@ -2,16 +2,20 @@ import sys
 from pathlib import Path
 
 import uvicorn
+from uvicorn.supervisors import Multiprocess
 
 # Add the project root directory to the Python path (necessary for correct module importing)
 sys.path.append(str(Path(__file__).parent.parent))
 
 from app.kernel.app_factory import AppFactory
+from app.kernel.server import WorkerConfig
 from app.kernel.settings import app_settings
 
 app = AppFactory.configure()
 
-if __name__ == "__main__":
+
+def run_development_server():
+    """Run a single-process server with optional auto-reload."""
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
@@ -19,3 +23,37 @@ if __name__ == "__main__":
         reload=app_settings.app_reload,
         reload_dirs=["/app"]
     )
+
+
+def run_production_server():
+    """
+    Run a multi-worker server with uvloop and httptools.
+
+    Each worker imports the app and initializes its own connection pools on startup.
+    Workers are recycled after `app_max_requests` plus a random jitter of up to
+    `app_max_requests_jitter` requests, so they do not all restart at once, and restarted
+    gracefully by the uvicorn supervisor (send SIGHUP to the main process to restart all workers).
+    """
+    config = WorkerConfig(
+        "main:app",
+        host="0.0.0.0",
+        port=app_settings.app_port,
+        workers=app_settings.app_workers,
+        loop="uvloop",
+        http="httptools",
+        limit_max_requests=app_settings.app_max_requests or None,
+        limit_max_requests_jitter=app_settings.app_max_requests_jitter,
+        timeout_graceful_shutdown=app_settings.app_graceful_shutdown_timeout,
+    )
+    server = uvicorn.Server(config=config)
+    if config.workers > 1:
+        Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+    else:
+        server.run()
+
+
+if __name__ == "__main__":
+    if app_settings.app_server_mode == "production":
+        run_production_server()
+    else:
+        run_development_server()
@@ -0,0 +1,2 @@
+from .admission import *
+from .circuit_breaker import *
@@ -0,0 +1,96 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from app.exceptions import ServiceUnavailableException
+from app.kernel.logs import logger
+from app.kernel.metrics import metrics
+
+__all__ = [
+    "AdmissionGate",
+]
+
+
+class AdmissionGate:
+    """
+    Bounded-concurrency gate with a bounded wait queue.
+
+    Admits up to `max_concurrency` operations at once. Further operations
+    wait in a queue of at most `max_queue_size` entries for up to
+    `queue_timeout` seconds. Operations that do not fit into the queue or
+    time out waiting are shed with ServiceUnavailableException, so excess
+    load fails fast instead of piling up on a slow dependency.
+
+    Reports '<name>.in_flight' and '<name>.queue_depth' gauges and
+    '<name>.admitted' and '<name>.shed' counters.
+    """
+
+    def __init__(
+            self, name: str, max_concurrency: int, max_queue_size: int,
+            queue_timeout: float, retry_after: int
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue_size = max_queue_size
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._in_flight = 0
+        self._queue_depth = 0
+
+        metrics.register_gauge(f"{name}.in_flight", lambda: self._in_flight)
+        metrics.register_gauge(f"{name}.queue_depth", lambda: self._queue_depth)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of currently admitted operations."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of operations waiting for admission."""
+        return self._queue_depth
+
+    def _shed(self, reason: str):
+        """Count shed operation and raise ServiceUnavailableException."""
+        metrics.increment(f"{self.name}.shed")
+        logger.warning(f"Admission gate '{self.name}' shed request: {reason}")
+        raise ServiceUnavailableException(
+            "Service is overloaded, please retry later",
+            retry_after=self.retry_after)
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """
+        Wait for admission and hold a concurrency slot while the context is active.
+
+        Raises:
+            ServiceUnavailableException: If the queue is full or the wait times out.
+        """
+        if self._semaphore.locked():
+            if self._queue_depth >= self.max_queue_size:
+                self._shed("queue is full")
+
+            self._queue_depth += 1
+            acquired = False
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    await self._semaphore.acquire()
+                    acquired = True
+            except TimeoutError:
+                # a slot granted as the timeout expired must not leak
+                if acquired:
+                    self._semaphore.release()
+                self._shed("queue timeout")
+            finally:
+                self._queue_depth -= 1
+        else:
+            await self._semaphore.acquire()
+
+        metrics.increment(f"{self.name}.admitted")
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
@@ -0,0 +1,154 @@
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Tuple, Type
+
+from app.exceptions import CircuitOpenException
+from app.kernel.logs import logger
+from app.kernel.metrics import metrics
+
+__all__ = [
+    "CircuitBreaker",
+]
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker failing fast while a dependency is unhealthy.
+
+    Closed: calls pass through. After `failure_threshold` consecutive
+    failures - errors of `failure_exceptions` types or calls slower than
+    `slow_call_duration` seconds - the circuit opens.
+
+    Open: calls are rejected instantly with CircuitOpenException for
+    `recovery_timeout` seconds, then the circuit becomes half-open.
+
+    Half-open: a single probe call is let through while others are still
+    rejected. Its success closes the circuit, its failure opens it again.
+
+    Cancelled calls count neither as failures nor as successes; a cancelled
+    probe frees the probe slot, so the next call probes instead.
+
+    Reports '<name>.state' gauge (0 closed, 1 half-open, 2 open), counters
+    of transitions ('<name>.opened', '<name>.half_opened', '<name>.closed'),
+    '<name>.failures', '<name>.slow_calls' and '<name>.rejected'.
+    """
+
+    closed = "closed"
+    half_open = "half_open"
+    open = "open"
+
+    _state_values = {closed: 0, half_open: 1, open: 2}
+    _transition_counters = {closed: "closed", half_open: "half_opened", open: "opened"}
+
+    def __init__(
+            self, name: str, failure_threshold: int, slow_call_duration: float, recovery_timeout: float,
+            failure_exceptions: Tuple[Type[BaseException], ...] = (Exception,), enabled: bool = True
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.slow_call_duration = slow_call_duration
+        self.recovery_timeout = recovery_timeout
+        self.failure_exceptions = failure_exceptions
+        self.enabled = enabled
+        self._state = self.closed
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+        metrics.register_gauge(f"{name}.state", lambda: self._state_values[self._state])
+
+    @property
+    def state(self) -> str:
+        """Current circuit state: 'closed', 'half_open' or 'open'."""
+        return self._state
+
+    def _transition(self, state: str, reason: str = ""):
+        """Change circuit state, logging and counting the transition."""
+        if state == self._state:
+            return
+
+        message = f"Circuit breaker '{self.name}' {self._state} -> {state}" + (f": {reason}" if reason else "")
+        if state == self.open:
+            logger.warning(message)
+        else:
+            logger.info(message)
+
+        metrics.increment(f"{self.name}.{self._transition_counters[state]}")
+        self._state = state
+        if state == self.open:
+            self._opened_at = time.monotonic()
+        self._consecutive_failures = 0
+
+    def _acquire(self) -> bool:
+        """
+        Check whether a call may pass.
+
+        Returns:
+            bool: True if the call is the half-open probe.
+
+        Raises:
+            CircuitOpenException: If the circuit rejects the call.
+        """
+        if not self.enabled or self._state == self.closed:
+            return False
+
+        if self._state == self.open and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._transition(self.half_open, "probing recovery")
+
+        if self._state == self.half_open and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+
+        metrics.increment(f"{self.name}.rejected")
+        raise CircuitOpenException(f"Circuit breaker '{self.name}' is open")
+
+    def _record_success(self, is_probe: bool):
+        """Reset failures, close the circuit after a successful probe."""
+        if is_probe:
+            self._transition(self.closed, "probe succeeded")
+        elif self._state == self.closed:
+            self._consecutive_failures = 0
+
+    def _record_failure(self, is_probe: bool, reason: str):
+        """Count failure, open the circuit after a failed probe or too many consecutive failures."""
+        metrics.increment(f"{self.name}.failures")
+        if is_probe:
+            self._transition(self.open, f"probe failed ({reason})")
+        elif self._state == self.closed:
+            self._consecutive_failures += 1
+            if self._consecutive_failures >= self.failure_threshold:
+                self._transition(self.open, f"{self._consecutive_failures} consecutive failures ({reason})")
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """
+        Run the calls of the context through the circuit breaker.
+
+        Raises:
+            CircuitOpenException: If the circuit is open.
+        """
+        if not self.enabled:
+            yield
+            return
+
+        is_probe = self._acquire()
+        started = time.monotonic()
+        try:
+            yield
+        except Exception as ex:
+            if isinstance(ex, self.failure_exceptions):
+                self._record_failure(is_probe, type(ex).__name__)
+            else:
+                # the dependency responded, only the call itself failed
+                self._record_success(is_probe)
+            raise
+        else:
+            duration = time.monotonic() - started
+            if duration > self.slow_call_duration:
+                metrics.increment(f"{self.name}.slow_calls")
+                self._record_failure(is_probe, f"slow call {duration * 1000:.0f} ms")
+            else:
+                self._record_success(is_probe)
+        finally:
+            if is_probe:
+                self._probe_in_flight = False
@@ -0,0 +1,2 @@
+from .conditional import *
+from .compression import *
@@ -0,0 +1,87 @@
+import gzip
+from typing import Dict, Optional, Sequence
+
+import brotli
+import zstandard
+
+__all__ = [
+    "SUPPORTED_ENCODINGS",
+    "ENCODING_FILE_SUFFIXES",
+    "select_encoding",
+    "compress_content",
+]
+
+# Supported content codings in server preference order
+SUPPORTED_ENCODINGS = ("zstd", "br", "gzip")
+
+ENCODING_FILE_SUFFIXES: Dict[str, str] = {
+    "zstd": ".zst",
+    "br": ".br",
+    "gzip": ".gz",
+}
+
+
+def select_encoding(
+        accept_encoding: Optional[str], encodings: Sequence[str] = SUPPORTED_ENCODINGS
+) -> Optional[str]:
+    """
+    Negotiate response content coding from the Accept-Encoding header.
+
+    Picks the supported coding with the highest client quality value,
+    using server preference order to break ties.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header.
+        encodings: Content codings to choose from (default: all supported).
+
+    Returns:
+        Optional[str]: Selected content coding, None if the response should not be compressed.
+    """
+    if not accept_encoding:
+        return None
+
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    wildcard = qualities.get("*", 0.0)
+    best_encoding, best_quality = None, 0.0
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding not in encodings:
+            continue
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best_encoding, best_quality = encoding, quality
+    return best_encoding
+
+
+def compress_content(content: bytes, encoding: str) -> bytes:
+    """
+    Compress content with the given content coding.
+
+    Args:
+        content: Raw content bytes.
+        encoding: Content coding ('zstd', 'br' or 'gzip').
+
+    Returns:
+        bytes: Compressed content.
+
+    Raises:
+        ValueError: If content coding is not supported.
+    """
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(content)
+    if encoding == "br":
+        return brotli.compress(content, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(content, compresslevel=6, mtime=0)
+    raise ValueError(f"Unsupported content encoding: {encoding}")
@@ -0,0 +1,77 @@
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Optional
+
+__all__ = [
+    "build_etag",
+    "build_cache_headers",
+    "is_not_modified",
+]
+
+
+def build_etag(timestamp: int) -> str:
+    """
+    Build weak entity tag for a representation identified by its observation timestamp.
+
+    Args:
+        timestamp: Unix timestamp of the observation.
+
+    Returns:
+        str: Weak ETag value (e.g. 'W/"1718000000"').
+    """
+    return f'W/"{timestamp}"'
+
+
+def build_cache_headers(timestamp: int, max_age: Optional[int]) -> Dict[str, str]:
+    """
+    Build validator and shared-cache headers for a cached representation.
+
+    Args:
+        timestamp: Unix timestamp of the observation.
+        max_age: Remaining freshness lifetime in seconds (None if unknown).
+
+    Returns:
+        Dict[str, str]: ETag, Last-Modified and Cache-Control headers.
+    """
+    return {
+        "ETag": build_etag(timestamp),
+        "Last-Modified": formatdate(timestamp, usegmt=True),
+        "Cache-Control": f"public, max-age={max(max_age or 0, 0)}",
+    }
+
+
+def is_not_modified(
+        timestamp: int,
+        if_none_match: Optional[str] = None,
+        if_modified_since: Optional[str] = None
+) -> bool:
+    """
+    Evaluate conditional request headers against a representation timestamp.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110, section 13.2.2).
+    Entity tags are compared with the weak comparison function.
+
+    Args:
+        timestamp: Unix timestamp of the current observation.
+        if_none_match: Value of the If-None-Match request header (optional).
+        if_modified_since: Value of the If-Modified-Since request header (optional).
+
+    Returns:
+        bool: True if the client copy is still valid and 304 should be returned.
+    """
+    if if_none_match:
+        if if_none_match.strip() == "*":
+            return True
+
+        current_tag = build_etag(timestamp).removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == current_tag
+            for tag in if_none_match.split(","))
+
+    if if_modified_since:
+        try:
+            modified_since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return timestamp <= int(modified_since.timestamp())
+
+    return False
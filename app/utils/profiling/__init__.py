@@ -0,0 +1,3 @@
+from .sampler import *
+from .profilers import *
+from .memory import *
@@ -0,0 +1,236 @@
+import gc
+import os
+import sys
+import time
+import tracemalloc
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple
+
+__all__ = [
+    "MemoryProfiler",
+    "MemoryGroupBy",
+    "count_instances",
+]
+
+MemoryGroupBy = Literal["module", "lineno"]
+
+
+@lru_cache(maxsize=4096)
+def _get_module_name(filename: str) -> str:
+    """
+    Convert source file path to a dotted module name.
+
+    Args:
+        filename: Source file path from a tracemalloc frame.
+
+    Returns:
+        str: Module name relative to the longest matching sys.path entry, filename if none matches.
+    """
+    for path in sorted((os.path.abspath(p) for p in sys.path if p), key=len, reverse=True):
+        if filename.startswith(path + os.sep):
+            module = os.path.splitext(filename[len(path) + 1:])[0].replace(os.sep, ".")
+            return module.removesuffix(".__init__")
+    return filename
+
+
+class MemoryProfiler:
+    """
+    Per-process tracemalloc session with numbered snapshots.
+
+    Tracing is started on demand, because every traced allocation costs
+    memory and time. Snapshots are kept in memory (the oldest are dropped
+    above `max_snapshots`) so growth between any two of them can be compared.
+    """
+
+    _snapshots: "OrderedDict[int, Tuple[float, tracemalloc.Snapshot]]" = OrderedDict()
+    _next_snapshot_id: int = 1
+
+    # allocations made by the profiler itself and the import machinery
+    _trace_filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        tracemalloc.Filter(False, "<unknown>"),
+    ]
+
+    @classmethod
+    def is_tracing(cls) -> bool:
+        """Check whether allocations are being traced."""
+        return tracemalloc.is_tracing()
+
+    @classmethod
+    def start(cls, frames: int = 1):
+        """
+        Start tracing allocations.
+
+        Safe to call multiple times - will skip if already tracing.
+
+        Args:
+            frames: Number of stack frames stored per allocation.
+        """
+        if tracemalloc.is_tracing():
+            return
+        tracemalloc.start(frames)
+
+    @classmethod
+    def stop(cls):
+        """Stop tracing allocations and drop all snapshots."""
+        tracemalloc.stop()
+        cls._snapshots.clear()
+
+    @classmethod
+    def get_traced_memory(cls) -> Tuple[int, int]:
+        """
+        Get size of traced memory blocks.
+
+        Returns:
+            Tuple[int, int]: Current and peak size in bytes.
+        """
+        return tracemalloc.get_traced_memory()
+
+    @classmethod
+    def take_snapshot(cls, max_snapshots: int) -> int:
+        """
+        Take snapshot of traced allocations.
+
+        Args:
+            max_snapshots: Maximum number of snapshots kept.
+
+        Returns:
+            int: Snapshot ID.
+
+        Raises:
+            RuntimeError: If tracing is not started.
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is not started")
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(cls._trace_filters)
+        snapshot_id = cls._next_snapshot_id
+        cls._next_snapshot_id += 1
+        cls._snapshots[snapshot_id] = (time.time(), snapshot)
+        while len(cls._snapshots) > max_snapshots:
+            cls._snapshots.popitem(last=False)
+        return snapshot_id
+
+    @classmethod
+    def get_snapshot_ids(cls) -> Dict[int, float]:
+        """
+        Get kept snapshots.
+
+        Returns:
+            Dict[int, float]: Snapshot creation timestamps by ID, oldest first.
+        """
+        return {snapshot_id: taken_at for snapshot_id, (taken_at, _) in cls._snapshots.items()}
+
+    @classmethod
+    def _get_snapshot(cls, snapshot_id: Optional[int]) -> tracemalloc.Snapshot:
+        """
+        Get kept snapshot by ID.
+
+        Args:
+            snapshot_id: Snapshot ID (None for the latest).
+
+        Raises:
+            KeyError: If snapshot is not found.
+        """
+        if snapshot_id is None:
+            if not cls._snapshots:
+                raise KeyError("No snapshots taken")
+            snapshot_id = next(reversed(cls._snapshots))
+        if snapshot_id not in cls._snapshots:
+            raise KeyError(f"Snapshot {snapshot_id} not found")
+        return cls._snapshots[snapshot_id][1]
+
+    @staticmethod
+    def _group(stats: Iterable[tracemalloc.Statistic | tracemalloc.StatisticDiff],
+               group_by: MemoryGroupBy) -> List[Dict[str, Any]]:
+        """Aggregate statistics by module or by allocation line."""
+        groups: Dict[str, Dict[str, Any]] = defaultdict(
+            lambda: {"size": 0, "count": 0, "size_diff": 0, "count_diff": 0})
+        for stat in stats:
+            frame = stat.traceback[0]
+            if group_by == "module":
+                location = _get_module_name(frame.filename)
+            else:
+                location = f"{frame.filename}:{frame.lineno}"
+
+            group = groups[location]
+            group["size"] += stat.size
+            group["count"] += stat.count
+            group["size_diff"] += getattr(stat, "size_diff", 0)
+            group["count_diff"] += getattr(stat, "count_diff", 0)
+        return [{"location": location, **group} for location, group in groups.items()]
+
+    @classmethod
+    def get_top(cls, snapshot_id: Optional[int], group_by: MemoryGroupBy, limit: int) -> List[Dict[str, Any]]:
+        """
+        Get allocation sites holding the most memory in a snapshot.
+
+        Args:
+            snapshot_id: Snapshot ID (None for the latest).
+            group_by: Group allocations by 'module' or source line ('lineno').
+            limit: Maximum number of sites to return.
+
+        Returns:
+            List[Dict[str, Any]]: Sites with 'location', 'size' and 'count', largest first.
+
+        Raises:
+            KeyError: If snapshot is not found.
+        """
+        snapshot = cls._get_snapshot(snapshot_id)
+        stats = cls._group(snapshot.statistics("filename" if group_by == "module" else "lineno"), group_by)
+        return sorted(stats, key=lambda stat: stat["size"], reverse=True)[:limit]
+
+    @classmethod
+    def compare(
+            cls, base_snapshot_id: int, snapshot_id: Optional[int], group_by: MemoryGroupBy, limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get allocation sites that grew or shrank the most between two snapshots.
+
+        Args:
+            base_snapshot_id: ID of the earlier snapshot.
+            snapshot_id: ID of the later snapshot (None for the latest).
+            group_by: Group allocations by 'module' or source line ('lineno').
+            limit: Maximum number of sites to return.
+
+        Returns:
+            List[Dict[str, Any]]: Sites with 'location', 'size', 'count', 'size_diff' and 'count_diff',
+                largest absolute size change first.
+
+        Raises:
+            KeyError: If a snapshot is not found.
+        """
+        base_snapshot = cls._get_snapshot(base_snapshot_id)
+        snapshot = cls._get_snapshot(snapshot_id)
+        stats = cls._group(
+            snapshot.compare_to(base_snapshot, "filename" if group_by == "module" else "lineno"), group_by)
+        return sorted(stats, key=lambda stat: abs(stat["size_diff"]), reverse=True)[:limit]
+
+
+def count_instances(classes: Iterable[type]) -> Dict[str, int]:
+    """
+    Count live instances of classes tracked by the garbage collector.
+
+    Walks all tracked objects, so it takes time proportional to the heap size.
+
+    Args:
+        classes: Classes to count (instances of subclasses are included).
+
+    Returns:
+        Dict[str, int]: Instance counts by class name.
+    """
+    classes = set(classes)
+    counts = {cls.__name__: 0 for cls in classes}
+    # type checks go through MRO, as isinstance() may run custom __instancecheck__ hooks on arbitrary objects
+    matches_by_type: Dict[type, List[str]] = {}
+    for obj in gc.get_objects():
+        obj_type = type(obj)
+        matches = matches_by_type.get(obj_type)
+        if matches is None:
+            matches = matches_by_type[obj_type] = [base.__name__ for base in obj_type.__mro__ if base in classes]
+        for name in matches:
+            counts[name] += 1
+    return counts
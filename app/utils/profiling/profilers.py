@@ -0,0 +1,57 @@
+import asyncio
+import cProfile
+import marshal
+import pstats
+
+from .sampler import SamplingMode, StackSampler
+
+__all__ = [
+    "profile_loop_stacks",
+    "profile_loop_calls",
+]
+
+
+async def profile_loop_stacks(duration: float, interval: float, mode: SamplingMode = "wall") -> StackSampler:
+    """
+    Sample stacks of the running event loop thread for a period of time.
+
+    Args:
+        duration: Profiling duration in seconds.
+        interval: Sampling interval in seconds (of real time in 'wall' mode, of CPU time in 'cpu' mode).
+        mode: Sample by real time ('wall') or by process CPU time ('cpu').
+
+    Returns:
+        StackSampler: Sampler holding recorded samples.
+
+    Raises:
+        RuntimeError: If the event loop does not run in the main thread.
+    """
+    sampler = StackSampler(interval=interval, mode=mode)
+    sampler.start()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        sampler.stop()
+    return sampler
+
+
+async def profile_loop_calls(duration: float) -> bytes:
+    """
+    Trace all function calls on the running event loop thread for a period of time.
+
+    Uses cProfile, so results are exact call counts and times, at a higher
+    overhead than stack sampling.
+
+    Args:
+        duration: Profiling duration in seconds.
+
+    Returns:
+        bytes: Profile in pstats format (load with pstats.Stats or snakeviz).
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.disable()
+    return marshal.dumps(pstats.Stats(profiler).stats)
@@ -0,0 +1,134 @@
+import os
+import signal
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Literal, Optional, Tuple
+
+__all__ = [
+    "StackSampler",
+    "SamplingMode",
+]
+
+SamplingMode = Literal["wall", "cpu"]
+
+
+class StackSampler:
+    """
+    Sampling profiler of the main thread, where the event loop runs.
+
+    An interval timer interrupts the main thread every `interval` seconds and
+    the signal handler records the interrupted Python stack, so the profiled
+    code runs unmodified and the overhead does not grow with the number of
+    calls. The stack is taken on the loop thread itself, so CPU-bound
+    callbacks are sampled even when they never release the GIL. While a
+    coroutine runs, its frames are on the stack, so samples show which
+    coroutines use the loop.
+
+    In 'wall' mode the timer counts real time (ITIMER_REAL) and samples taken
+    while the loop waits for I/O are reported as idle. In 'cpu' mode the timer
+    counts process CPU time (ITIMER_PROF), so waiting is not sampled at all.
+
+    Samples are reported in collapsed stack format ('root;...;leaf count' per
+    line) read by flamegraph.pl, speedscope and similar tools.
+    """
+
+    idle_label = "<idle>"
+
+    # frames the loop thread is in while waiting for events (selector loop, or uvloop running its C loop)
+    _idle_frames = {
+        ("selectors.py", "select"),
+        ("base_events.py", "run_forever"),
+        ("base_events.py", "run_until_complete"),
+        ("runners.py", "run"),
+    }
+
+    _timers = {
+        "wall": (signal.ITIMER_REAL, signal.SIGALRM),
+        "cpu": (signal.ITIMER_PROF, signal.SIGPROF),
+    }
+
+    def __init__(self, interval: float, mode: SamplingMode = "wall"):
+        self.interval = interval
+        self.mode = mode
+        self.samples: Counter[Tuple[str, ...]] = Counter()
+        self.idle_samples = 0
+        self._previous_handler = None
+        self._running = False
+
+    @property
+    def total_samples(self) -> int:
+        """Number of recorded samples, including idle ones."""
+        return sum(self.samples.values())
+
+    @staticmethod
+    def _get_frame_label(frame: FrameType) -> str:
+        """Format frame as 'function (file:line)'."""
+        code = frame.f_code
+        return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})".replace(";", ":")
+
+    def _is_idle(self, frame: FrameType) -> bool:
+        """Check whether the innermost frame means the loop is waiting for events."""
+        return (os.path.basename(frame.f_code.co_filename), frame.f_code.co_name) in self._idle_frames
+
+    def _sample(self, frame: Optional[FrameType]):
+        """Record the interrupted stack."""
+        if frame is None:
+            return
+
+        if self._is_idle(frame):
+            self.idle_samples += 1
+            self.samples[(self.idle_label,)] += 1
+            return
+
+        stack = []
+        while frame is not None:
+            stack.append(self._get_frame_label(frame))
+            frame = frame.f_back
+        self.samples[tuple(reversed(stack))] += 1
+
+    def _handle_signal(self, signum: int, frame: Optional[FrameType]):
+        """Timer signal handler, runs on the main thread between bytecodes."""
+        self._sample(frame)
+
+    def start(self):
+        """
+        Start sampling.
+
+        Raises:
+            RuntimeError: If not called from the main thread (signal handlers run only there).
+        """
+        if threading.current_thread() is not threading.main_thread():
+            raise RuntimeError("Stack sampling requires the event loop to run in the main thread")
+
+        timer, signum = self._timers[self.mode]
+        self._previous_handler = signal.signal(signum, self._handle_signal)
+        signal.setitimer(timer, self.interval, self.interval)
+        self._running = True
+
+    def stop(self):
+        """Stop sampling and restore the previous signal handler."""
+        if not self._running:
+            return
+
+        timer, signum = self._timers[self.mode]
+        signal.setitimer(timer, 0)
+        signal.signal(signum, self._previous_handler)
+        self._running = False
+
+    def to_collapsed(self, include_idle: bool = True) -> str:
+        """
+        Format samples as collapsed stacks.
+
+        Args:
+            include_idle: Whether to include idle samples.
+
+        Returns:
+            str: One 'frame;frame;frame count' line per distinct stack, most frequent first.
+        """
+        lines = []
+        for stack, count in self.samples.most_common():
+            if not include_idle and stack == (self.idle_label,):
+                continue
+            lines.append(f"{';'.join(stack)} {count}")
+        return "\n".join(lines) + "\n"
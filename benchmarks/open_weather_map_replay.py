@@ -0,0 +1,107 @@
+"""
+Offline benchmark of the weather miss path (OpenWeatherMap geo and weather requests).
+
+Record mode calls the real API once for every city and saves the responses as fixtures:
+
+    PYTHONPATH=. python benchmarks/open_weather_map_replay.py record --cities kyiv london paris
+
+Replay mode runs `WeatherDataService` against the fixtures without network access,
+with a configurable upstream latency distribution ('none', 'fixed:MS', 'uniform:MS:SPREAD_MS',
+'lognormal:MEDIAN_MS:SIGMA' or 'recorded'), and prints latency percentiles. Runs with
+the same seed are deterministic:
+
+    PYTHONPATH=. python benchmarks/open_weather_map_replay.py replay --cities kyiv london paris \
+        --latency lognormal:80:0.5 --requests 2000 --concurrency 32 --seed 1
+
+Both modes import the application, so load the application environment first
+(e.g. `set -a && . ./.env && set +a`). Replay does not need a real OPEN_WEATHER_MAP_KEY.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from typing import List
+
+os.environ.setdefault("OPEN_WEATHER_MAP_KEY", "replay")
+
+from app.domains.weather.clients import (  # noqa: E402
+    OpenWeatherMapClient, RecordingTransport, ReplayLatency, ReplayTransport
+)
+from app.domains.weather.data_service import WeatherDataService  # noqa: E402
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the given percentile (0-100) of a sorted list of values."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def fetch_city(service: WeatherDataService, city: str):
+    """Run the miss path of one city: geocoding followed by the weather request."""
+    coord = await service.fetch_city_geo(city)
+    return (await service.fetch_coord_weather_from_open_weather(coord)).weather
+
+
+async def record(fixtures_dir: str, cities: List[str]):
+    """Fetch every city from the real API and save the responses."""
+    client = OpenWeatherMapClient(transport=RecordingTransport(fixtures_dir))
+    service = WeatherDataService(client=client)
+    try:
+        for city in cities:
+            weather = await fetch_city(service, city)
+            print(f"Recorded {city}: {weather.temperature.temp} C")
+    finally:
+        await client.close()
+
+
+async def replay(fixtures_dir: str, cities: List[str], latency: ReplayLatency, requests: int, concurrency: int):
+    """Replay the miss path `requests` times with `concurrency` workers and print latency percentiles."""
+    client = OpenWeatherMapClient(transport=ReplayTransport(fixtures_dir, latency=latency))
+    service = WeatherDataService(client=client)
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async def worker():
+        for index in counter:
+            started = time.perf_counter()
+            await fetch_city(service, cities[index % len(cities)])
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        await client.close()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(
+        f"{len(latencies)} requests in {elapsed:.2f} s ({len(latencies) / elapsed:.1f} req/s)"
+        f"  mean {statistics.fmean(latencies) * 1000:.2f} ms"
+        + "".join(f"  p{pct} {percentile(latencies, pct) * 1000:.2f} ms" for pct in (50, 90, 99)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("mode", choices=["record", "replay"], help="Record fixtures or replay them")
+    parser.add_argument("--cities", nargs="+", required=True, help="City names to fetch")
+    parser.add_argument(
+        "--fixtures", default="benchmarks/fixtures/open_weather_map", help="Directory of response fixtures")
+    parser.add_argument("--latency", default="none", help="Replayed upstream latency distribution")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the latency distribution")
+    parser.add_argument("--requests", type=int, default=1000, help="Number of replayed cities")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of concurrent workers")
+    args = parser.parse_args()
+
+    if args.mode == "record":
+        asyncio.run(record(args.fixtures, args.cities))
+    else:
+        latency = ReplayLatency.from_spec(args.latency, seed=args.seed)
+        asyncio.run(replay(args.fixtures, args.cities, latency, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""
+Per-operation overhead of the aiocache layer versus direct redis-py calls.
+
+Runs the same GET/SET workload against Redis through an aiocache `Cache(Cache.REDIS)`
+and through a plain `redis.asyncio` client, and prints latency percentiles of each.
+aiocache is no longer an application dependency; install it to run this benchmark:
+
+    pip install aiocache==0.12.3
+
+Usage:
+    python benchmarks/redis_cache_overhead.py --host localhost --port 6379 --operations 20000 --concurrency 16
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Awaitable, Callable, List
+
+import redis.asyncio as redis
+
+try:
+    from aiocache import Cache
+except ImportError:
+    Cache = None
+
+Operation = Callable[[int], Awaitable[object]]
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the given percentile (0-100) of a sorted list of values."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def run(operation: Operation, operations: int, concurrency: int) -> List[float]:
+    """Run operation `operations` times with `concurrency` workers and return sorted latencies."""
+    latencies: List[float] = []
+    counter = iter(range(operations))
+
+    async def worker():
+        for index in counter:
+            started = time.perf_counter()
+            await operation(index)
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    latencies.sort()
+    return latencies
+
+
+def report(name: str, latencies: List[float], elapsed: float):
+    """Print throughput and latency percentiles of one benchmark run."""
+    print(
+        f"{name:<16} {len(latencies) / elapsed:>10.1f} ops/s"
+        f"  mean {statistics.fmean(latencies) * 1e6:>8.1f} us"
+        + "".join(f"  p{pct} {percentile(latencies, pct) * 1e6:>8.1f} us" for pct in (50, 99)))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="localhost", help="Redis host")
+    parser.add_argument("--port", type=int, default=6379, help="Redis port")
+    parser.add_argument("--password", default=None, help="Redis password")
+    parser.add_argument("--operations", type=int, default=20000, help="Operations per benchmark")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of concurrent workers")
+    parser.add_argument("--value-size", type=int, default=1024, help="Size of stored values in bytes")
+    args = parser.parse_args()
+
+    if Cache is None:
+        parser.exit(1, "aiocache is not installed, run: pip install aiocache==0.12.3\n")
+
+    value = "x" * args.value_size
+    keys = [f"benchmark:{index % 1000}" for index in range(args.operations)]
+
+    pool = redis.BlockingConnectionPool(
+        host=args.host, port=args.port, password=args.password,
+        decode_responses=True, max_connections=args.concurrency)
+    redis_client = redis.Redis(connection_pool=pool)
+    aiocache = Cache(Cache.REDIS, endpoint=args.host, port=args.port, password=args.password)
+
+    benchmarks = {
+        "redis-py set": lambda index: redis_client.set(keys[index], value, ex=60),
+        "aiocache set": lambda index: aiocache.set(keys[index], value, ttl=60),
+        "redis-py get": lambda index: redis_client.get(keys[index]),
+        "aiocache get": lambda index: aiocache.get(keys[index]),
+    }
+
+    try:
+        for name, operation in benchmarks.items():
+            # warm up connections before measuring
+            await run(operation, min(args.operations, 1000), args.concurrency)
+
+            started = time.perf_counter()
+            latencies = await run(operation, args.operations, args.concurrency)
+            report(name, latencies, time.perf_counter() - started)
+    finally:
+        await aiocache.close()
+        await redis_client.aclose()
+        await pool.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,73 @@
+"""
+HTTP throughput benchmark for the weather API.
+
+Sends requests with a fixed number of concurrent clients for a fixed duration
+and prints requests per second and latency percentiles.
+
+Usage:
+    python benchmarks/throughput.py --url "http://localhost:8000/api/v1/weather/?city=kyiv" \
+        --concurrency 64 --duration 30
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+
+async def worker(client: httpx.AsyncClient, url: str, deadline: float, latencies: List[float], errors: List[int]):
+    """Send requests sequentially until the deadline and record latencies."""
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = await client.get(url)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+        except httpx.HTTPError:
+            errors.append(0)
+        latencies.append(time.perf_counter() - started)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Return the given percentile (0-100) of a sorted list of values."""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True, help="Endpoint URL to benchmark")
+    parser.add_argument("--concurrency", type=int, default=64, help="Number of concurrent clients")
+    parser.add_argument("--duration", type=float, default=30.0, help="Benchmark duration in seconds")
+    parser.add_argument("--warmup", type=float, default=5.0, help="Warm-up duration in seconds (not measured)")
+    args = parser.parse_args()
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+        if args.warmup:
+            deadline = time.perf_counter() + args.warmup
+            await asyncio.gather(*(worker(client, args.url, deadline, [], []) for _ in range(args.concurrency)))
+
+        latencies: List[float] = []
+        errors: List[int] = []
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            worker(client, args.url, deadline, latencies, errors) for _ in range(args.concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"requests:     {len(latencies)}")
+    print(f"errors:       {len(errors)}")
+    print(f"throughput:   {len(latencies) / elapsed:.1f} req/s")
+    print(f"latency mean: {statistics.fmean(latencies) * 1000 if latencies else 0:.2f} ms")
+    for pct in (50, 90, 99):
+        print(f"latency p{pct}:  {percentile(latencies, pct) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
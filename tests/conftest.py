@@ -0,0 +1,10 @@
+import os
+from pathlib import Path
+
+# Configure the application like a local deployment (see env.example) before app modules are imported.
+# Variables already set in the environment take precedence.
+for line in (Path(__file__).parent.parent / "env.example").read_text().splitlines():
+    name, separator, value = line.partition("=")
+    if separator and not line.startswith("#"):
+        os.environ.setdefault(name.strip(), value.strip())
+os.environ.setdefault("AWS_REGION", os.environ["AWS_DEFAULT_REGION"])
@@ -0,0 +1,35 @@
+import asyncio
+from collections import Counter
+
+import pytest
+
+from app.domains.weather import CityRequestCounter
+from app.domains.weather.repositories import WeatherCacheRepository
+from app.infrastructure.cache import CacheManager
+from app.kernel.settings import weather_settings
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Weather cache kept in the process-local engine, cleared after the test."""
+    monkeypatch.setattr(weather_settings, "cache_engine", "memory")
+    monkeypatch.setattr(CityRequestCounter, "_counts", Counter())
+    yield
+    asyncio.run(CacheManager(engine="memory").delete(WeatherCacheRepository.city_requests_key))
+
+
+def test_flushed_counts_rank_cities(memory_cache):
+    async def main():
+        for city_name in ["Kyiv", "Lviv", "Kyiv", "coord:50.45,30.52", "coord:50.45,30.52"]:
+            CityRequestCounter.count(city_name)
+        assert await CityRequestCounter.flush()
+
+        CityRequestCounter.count("Lviv")
+        CityRequestCounter.count("Lviv")
+        assert await CityRequestCounter.flush()
+
+        return await WeatherCacheRepository().get_most_requested_cities(limit=10)
+
+    # observations fetched by coordinates are not ranked
+    assert asyncio.run(main()) == ["Lviv", "Kyiv"]
+    assert not CityRequestCounter._counts
@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.engines import DiskCacheEngine, disk_engine
+
+
+class FakeClock:
+    """Wall clock advanced manually."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(disk_engine, "time", clock)
+    return clock
+
+
+def create_engine(tmp_path, purge_interval: int = 60) -> DiskCacheEngine:
+    return DiskCacheEngine(path=str(tmp_path / "cache.db"), busy_timeout=5, purge_interval=purge_interval)
+
+
+def run(engine: DiskCacheEngine, coroutine):
+    """Run engine call and release the engine, so every call uses a fresh event loop."""
+    async def main():
+        try:
+            return await coroutine
+        finally:
+            await engine.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_get_set_and_delete(tmp_path):
+    engine = create_engine(tmp_path)
+
+    run(engine, engine.set("key", "value"))
+
+    assert run(engine, engine.get("key")) == "value"
+    assert run(engine, engine.exists("key"))
+    assert run(engine, engine.delete("key"))
+    assert run(engine, engine.get("key")) is None
+
+
+def test_data_is_shared_through_the_file(tmp_path):
+    writer = create_engine(tmp_path)
+    run(writer, writer.set("key", "value"))
+
+    reader = create_engine(tmp_path)
+    assert run(reader, reader.get("key")) == "value"
+
+
+def test_key_expires_after_ttl(tmp_path, clock):
+    engine = create_engine(tmp_path)
+    run(engine, engine.set("key", "value", ttl=10))
+
+    clock.now += 4
+    assert run(engine, engine.ttl("key")) == 6
+
+    clock.now += 6
+    assert run(engine, engine.get("key")) is None
+    assert run(engine, engine.ttl("key")) is None
+
+
+def test_expired_rows_are_purged_on_write(tmp_path, clock):
+    engine = create_engine(tmp_path, purge_interval=0)
+    run(engine, engine.set("old", "value", ttl=10))
+
+    clock.now += 20
+    run(engine, engine.set("new", "value"))
+
+    rows = engine._connect().execute("SELECT key FROM cache_entries").fetchall()
+    engine._connection.close()
+    assert rows == [("new",)]
+
+
+def test_mapping_update_keeps_fields_and_ttl(tmp_path, clock):
+    engine = create_engine(tmp_path)
+    run(engine, engine.set_mapping("hash", {"a": "1", "b": "2"}, ttl=10))
+
+    run(engine, engine.set_mapping("hash", {"b": "3"}))
+
+    assert run(engine, engine.get_mapping("hash")) == {"a": "1", "b": "3"}
+    assert run(engine, engine.ttl("hash")) == 10
+
+
+def test_concurrent_mapping_updates_are_not_lost(tmp_path):
+    engines = [create_engine(tmp_path) for _ in range(2)]
+
+    async def main():
+        try:
+            await asyncio.gather(*(
+                engine.set_mapping("hash", {f"field{index}-{number}": "1"})
+                for index in range(200) for number, engine in enumerate(engines)))
+            return await engines[0].get_mapping("hash")
+        finally:
+            for engine in engines:
+                await engine.cleanup()
+
+    assert len(asyncio.run(main())) == 400
+
+
+def test_reading_key_of_another_type_raises(tmp_path):
+    engine = create_engine(tmp_path)
+    run(engine, engine.set("key", "value"))
+
+    with pytest.raises(TypeError):
+        run(engine, engine.get_mapping("key"))
+
+
+def test_geo_search_and_remove(tmp_path):
+    engine = create_engine(tmp_path)
+    run(engine, engine.geo_add("geo", "far", 50.60, 30.52))
+    run(engine, engine.geo_add("geo", "near", 50.46, 30.52))
+    run(engine, engine.geo_add("geo", "outside", 51.45, 30.52))
+
+    assert run(engine, engine.geo_search("geo", 50.45, 30.52, radius_km=20, count=10)) == ["near", "far"]
+    assert run(engine, engine.geo_remove("geo", ["near", "missing"])) == 1
+    assert run(engine, engine.geo_search("geo", 50.45, 30.52, radius_km=20, count=10)) == ["far"]
+
+
+def test_score_top_returns_highest_scores_first(tmp_path):
+    engine = create_engine(tmp_path)
+    run(engine, engine.score_increment("scores", {"kyiv": 2, "lviv": 1, "odesa": 1}))
+    run(engine, engine.score_increment("scores", {"lviv": 2}))
+
+    assert run(engine, engine.score_top("scores", count=10)) == ["lviv", "kyiv", "odesa"]
+    assert run(engine, engine.score_top("scores", count=1)) == ["lviv"]
+    assert run(engine, engine.score_top("missing", count=10)) == []
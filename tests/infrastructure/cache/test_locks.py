@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache import RedisCacheManager, RedisLeaseLock
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Redis client of RedisCacheManager replaced by an in-process fake server (with Lua support)."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(RedisCacheManager, "_redis_client", client)
+    monkeypatch.setattr(RedisCacheManager, "_read_client", client)
+    monkeypatch.setattr(RedisCacheManager, "_scripts", {})
+    monkeypatch.setattr(RedisCacheManager, "_initialized", True)
+    return client
+
+
+def test_lock_is_exclusive_until_released(redis_client):
+    async def main():
+        first = RedisLeaseLock(key="lock", lease_ms=10000)
+        second = RedisLeaseLock(key="lock", lease_ms=10000)
+
+        assert await first.acquire()
+        assert not await second.acquire()
+        assert not await second.release()
+        assert await first.is_locked()
+
+        assert await first.release()
+        assert await second.acquire()
+
+    asyncio.run(main())
+
+
+def test_only_holder_extends_lease(redis_client):
+    async def main():
+        holder = RedisLeaseLock(key="lock", lease_ms=10000)
+        other = RedisLeaseLock(key="lock", lease_ms=60000)
+
+        await holder.acquire()
+        assert not await other.extend()
+        assert await holder.extend()
+        assert 0 < await redis_client.pttl("lock") <= 10000
+
+    asyncio.run(main())
+
+
+def test_scripts_are_registered_once(redis_client, monkeypatch):
+    registrations = []
+    register_script = redis_client.register_script
+
+    def count_registrations(script):
+        registrations.append(script)
+        return register_script(script)
+
+    monkeypatch.setattr(redis_client, "register_script", count_registrations)
+
+    async def main():
+        for _ in range(3):
+            lock = RedisLeaseLock(key="lock", lease_ms=10000)
+            await lock.acquire()
+            await lock.extend()
+            await lock.release()
+
+    asyncio.run(main())
+
+    assert sorted(registrations) == sorted([RedisLeaseLock.extend_script, RedisLeaseLock.release_script])
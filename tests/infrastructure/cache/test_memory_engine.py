@@ -0,0 +1,135 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache.engines import MemoryCacheEngine, memory_engine
+
+
+class FakeClock:
+    """Monotonic clock advanced manually."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(memory_engine, "time", clock)
+    return clock
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_get_set_and_delete():
+    engine = MemoryCacheEngine(max_keys=10)
+
+    run(engine.set("key", "value"))
+
+    assert run(engine.get("key")) == "value"
+    assert run(engine.exists("key"))
+    assert run(engine.delete("key"))
+    assert run(engine.get("key")) is None
+    assert not run(engine.delete("key"))
+
+
+def test_key_expires_after_ttl(clock):
+    engine = MemoryCacheEngine(max_keys=10)
+    run(engine.set("key", "value", ttl=10))
+
+    clock.now += 4
+    assert run(engine.ttl("key")) == 6
+    assert run(engine.get("key")) == "value"
+
+    clock.now += 6
+    assert run(engine.get("key")) is None
+    assert run(engine.ttl("key")) is None
+
+
+def test_mapping_update_keeps_fields_and_ttl(clock):
+    engine = MemoryCacheEngine(max_keys=10)
+    run(engine.set_mapping("hash", {"a": "1", "b": "2"}, ttl=10))
+
+    run(engine.set_mapping("hash", {"b": "3"}))
+
+    assert run(engine.get_mapping("hash")) == {"a": "1", "b": "3"}
+    assert run(engine.ttl("hash")) == 10
+    assert run(engine.get_mappings(["hash", "missing"])) == [{"a": "1", "b": "3"}, {}]
+
+
+def test_reading_key_of_another_type_raises():
+    engine = MemoryCacheEngine(max_keys=10)
+    run(engine.set("key", "value"))
+
+    with pytest.raises(TypeError):
+        run(engine.get_mapping("key"))
+
+
+def test_least_recently_used_key_is_evicted():
+    engine = MemoryCacheEngine(max_keys=2)
+    run(engine.set("a", "1"))
+    run(engine.set("b", "2"))
+    run(engine.get("a"))
+
+    run(engine.set("c", "3"))
+
+    assert run(engine.get("a")) == "1"
+    assert run(engine.get("b")) is None
+    assert run(engine.get("c")) == "3"
+
+
+def test_geo_index_is_not_evicted():
+    engine = MemoryCacheEngine(max_keys=2)
+    run(engine.geo_add("geo", "kyiv", 50.45, 30.52))
+
+    for index in range(5):
+        run(engine.set(f"key{index}", "value"))
+
+    assert run(engine.geo_search("geo", 50.45, 30.52, radius_km=1, count=10)) == ["kyiv"]
+    assert run(engine.get("key3")) == "value"
+    assert run(engine.get("key2")) is None
+
+
+def test_geo_search_returns_members_within_radius_nearest_first():
+    engine = MemoryCacheEngine(max_keys=10)
+    run(engine.geo_add("geo", "far", 50.60, 30.52))
+    run(engine.geo_add("geo", "near", 50.46, 30.52))
+    run(engine.geo_add("geo", "center", 50.45, 30.52))
+    run(engine.geo_add("geo", "outside", 51.45, 30.52))
+
+    assert run(engine.geo_search("geo", 50.45, 30.52, radius_km=20, count=10)) == ["center", "near", "far"]
+    assert run(engine.geo_search("geo", 50.45, 30.52, radius_km=20, count=2)) == ["center", "near"]
+
+
+def test_geo_remove():
+    engine = MemoryCacheEngine(max_keys=10)
+    run(engine.geo_add("geo", "a", 50.45, 30.52))
+    run(engine.geo_add("geo", "b", 50.46, 30.52))
+
+    assert run(engine.geo_remove("geo", ["a", "missing"])) == 1
+    assert run(engine.geo_search("geo", 50.45, 30.52, radius_km=10, count=10)) == ["b"]
+
+
+def test_score_top_returns_highest_scores_first():
+    engine = MemoryCacheEngine(max_keys=10)
+    run(engine.score_increment("scores", {"kyiv": 2, "lviv": 1, "odesa": 1}))
+    run(engine.score_increment("scores", {"lviv": 2}))
+
+    assert run(engine.score_top("scores", count=10)) == ["lviv", "kyiv", "odesa"]
+    assert run(engine.score_top("scores", count=1)) == ["lviv"]
+    assert run(engine.score_top("missing", count=10)) == []
+
+
+def test_score_index_is_not_evicted():
+    engine = MemoryCacheEngine(max_keys=2)
+    run(engine.score_increment("scores", {"kyiv": 1}))
+
+    for index in range(5):
+        run(engine.set(f"key{index}", "value"))
+
+    assert run(engine.score_top("scores", count=10)) == ["kyiv"]
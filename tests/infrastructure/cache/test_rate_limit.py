@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.cache import RedisCacheManager, RedisRateLimiter, rate_limit
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+class FakeClock:
+    """Monotonic clock advanced manually."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Redis client of RedisCacheManager replaced by an in-process fake server (with Lua support)."""
+    client = fakeredis.FakeAsyncRedis(decode_responses=True)
+    monkeypatch.setattr(RedisCacheManager, "_redis_client", client)
+    monkeypatch.setattr(RedisCacheManager, "_read_client", client)
+    monkeypatch.setattr(RedisCacheManager, "_scripts", {})
+    monkeypatch.setattr(RedisCacheManager, "_initialized", True)
+    return client
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limit, "time", clock)
+    return clock
+
+
+def hit_times(limiter: RedisRateLimiter, client_id: str, times: int):
+    async def main():
+        return [await limiter.hit(client_id) for _ in range(times)]
+
+    return asyncio.run(main())
+
+
+def test_burst_up_to_limit_is_allowed(redis_client):
+    limiter = RedisRateLimiter(key_prefix="test", limit=3, period=60)
+
+    results = hit_times(limiter, "client", 3)
+
+    assert [result.allowed for result in results] == [True, True, True]
+    assert [result.remaining for result in results] == [2, 1, 0]
+    # each request takes one emission interval (60 s / 3) of the quota
+    assert [result.reset_after for result in results] == [20, 40, 60]
+    assert results[0].get_headers() == {"RateLimit-Limit": "3", "RateLimit-Remaining": "2", "RateLimit-Reset": "20"}
+
+
+def test_request_over_limit_is_denied_until_next_emission(redis_client):
+    limiter = RedisRateLimiter(key_prefix="test", limit=3, period=60)
+
+    result = hit_times(limiter, "client", 4)[-1]
+
+    assert not result.allowed
+    assert result.remaining == 0
+    assert result.retry_after == 20
+    assert result.reset_after == 60
+    assert result.get_headers() == {
+        "RateLimit-Limit": "3",
+        "RateLimit-Remaining": "0",
+        "RateLimit-Reset": "60",
+        "Retry-After": "20",
+    }
+
+
+def test_clients_have_separate_quotas(redis_client):
+    limiter = RedisRateLimiter(key_prefix="test", limit=1, period=60)
+
+    assert hit_times(limiter, "first", 1)[0].allowed
+    assert hit_times(limiter, "second", 1)[0].allowed
+    assert not hit_times(limiter, "first", 1)[0].allowed
+
+
+def test_denied_client_is_rejected_locally_until_retry_after(redis_client, clock, monkeypatch):
+    limiter = RedisRateLimiter(key_prefix="test", limit=1, period=60)
+    hit_times(limiter, "client", 2)
+
+    def fail_script(script):
+        raise AssertionError("Redis must not be called for a blocked client")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(RedisCacheManager, "get_script", fail_script)
+        clock.now += 59
+        result = hit_times(limiter, "client", 1)[0]
+
+    assert not result.allowed
+    assert result.retry_after == 1
+
+    clock.now += 1
+    assert limiter._check_local("client") is None
+
+
+def test_script_is_registered_once(redis_client, monkeypatch):
+    registrations = []
+    register_script = redis_client.register_script
+
+    def count_registrations(script):
+        registrations.append(script)
+        return register_script(script)
+
+    monkeypatch.setattr(redis_client, "register_script", count_registrations)
+    limiter = RedisRateLimiter(key_prefix="test", limit=10, period=60)
+
+    hit_times(limiter, "client", 5)
+
+    assert len(registrations) == 1
+
+
+def test_requests_are_allowed_when_redis_is_unavailable(monkeypatch):
+    monkeypatch.setattr(RedisCacheManager, "_initialized", False)
+    limiter = RedisRateLimiter(key_prefix="test", limit=1, period=60)
+
+    assert hit_times(limiter, "client", 2) == [None, None]
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+
+from app.exceptions import ServiceUnavailableException
+from app.kernel.metrics import metrics
+from app.utils.concurrency import AdmissionGate
+
+
+def create_gate(max_queue_size: int = 1, queue_timeout: float = 5) -> AdmissionGate:
+    return AdmissionGate(
+        name="test_gate", max_concurrency=1, max_queue_size=max_queue_size,
+        queue_timeout=queue_timeout, retry_after=7)
+
+
+async def hold(gate: AdmissionGate, started: asyncio.Event, finish: asyncio.Event):
+    """Hold an admission slot until finished."""
+    async with gate.admit():
+        started.set()
+        await finish.wait()
+
+
+def test_waiting_operations_are_counted_and_admitted_in_turn():
+    async def main():
+        gate = create_gate()
+        first_started, first_finish = asyncio.Event(), asyncio.Event()
+        second_started, second_finish = asyncio.Event(), asyncio.Event()
+
+        first = asyncio.create_task(hold(gate, first_started, first_finish))
+        await first_started.wait()
+        second = asyncio.create_task(hold(gate, second_started, second_finish))
+        await asyncio.sleep(0)
+        assert (gate.in_flight, gate.queue_depth) == (1, 1)
+
+        first_finish.set()
+        await second_started.wait()
+        assert (gate.in_flight, gate.queue_depth) == (1, 0)
+
+        second_finish.set()
+        await asyncio.gather(first, second)
+        assert (gate.in_flight, gate.queue_depth) == (0, 0)
+
+    asyncio.run(main())
+
+
+def test_operation_is_shed_when_queue_is_full():
+    async def main():
+        gate = create_gate(max_queue_size=0)
+        started, finish = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(gate, started, finish))
+        await started.wait()
+        shed_before = metrics.snapshot().get("test_gate.shed", 0)
+
+        with pytest.raises(ServiceUnavailableException) as ex:
+            async with gate.admit():
+                pass
+
+        assert ex.value.retry_after == 7
+        assert metrics.snapshot()["test_gate.shed"] == shed_before + 1
+        assert (gate.in_flight, gate.queue_depth) == (1, 0)
+        finish.set()
+        await holder
+
+    asyncio.run(main())
+
+
+def test_queue_timeout_sheds_without_leaking_slot():
+    async def main():
+        gate = create_gate(queue_timeout=0.01)
+        started, finish = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(gate, started, finish))
+        await started.wait()
+
+        with pytest.raises(ServiceUnavailableException):
+            async with gate.admit():
+                pass
+
+        assert gate.queue_depth == 0
+        finish.set()
+        await holder
+
+        # the only slot is free again, so the next operation is admitted without waiting
+        async with asyncio.timeout(1):
+            async with gate.admit():
+                assert (gate.in_flight, gate.queue_depth) == (1, 0)
+        assert gate.in_flight == 0
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_leaves_queue():
+    async def main():
+        gate = create_gate()
+        started, finish = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(gate, started, finish))
+        await started.wait()
+        waiter = asyncio.create_task(hold(gate, asyncio.Event(), asyncio.Event()))
+        await asyncio.sleep(0)
+        assert gate.queue_depth == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert gate.queue_depth == 0
+        finish.set()
+        await holder
+        async with asyncio.timeout(1):
+            async with gate.admit():
+                pass
+
+    asyncio.run(main())
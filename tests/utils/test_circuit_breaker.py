@@ -0,0 +1,169 @@
+import asyncio
+
+import pytest
+
+from app.exceptions import CircuitOpenException
+from app.utils.concurrency import CircuitBreaker, circuit_breaker
+
+
+class FakeClock:
+    """Monotonic clock advanced manually."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(circuit_breaker, "time", clock)
+    return clock
+
+
+def create_breaker() -> CircuitBreaker:
+    return CircuitBreaker(
+        name="test_breaker", failure_threshold=2, slow_call_duration=1, recovery_timeout=10,
+        failure_exceptions=(ConnectionError,))
+
+
+async def call(breaker: CircuitBreaker, clock: FakeClock, duration: float = 0, error: Exception = None):
+    """Run a call taking `duration` seconds of the fake clock, optionally raising an error."""
+    async with breaker.guard():
+        clock.now += duration
+        if error:
+            raise error
+
+
+async def fail(breaker: CircuitBreaker, clock: FakeClock):
+    with pytest.raises(ConnectionError):
+        await call(breaker, clock, error=ConnectionError())
+
+
+async def open_circuit(breaker: CircuitBreaker, clock: FakeClock):
+    for _ in range(breaker.failure_threshold):
+        await fail(breaker, clock)
+    assert breaker.state == CircuitBreaker.open
+
+
+def test_consecutive_failures_open_circuit(clock):
+    async def main():
+        breaker = create_breaker()
+
+        await fail(breaker, clock)
+        await call(breaker, clock)
+        await fail(breaker, clock)
+        assert breaker.state == CircuitBreaker.closed
+
+        await fail(breaker, clock)
+        assert breaker.state == CircuitBreaker.open
+        with pytest.raises(CircuitOpenException):
+            await call(breaker, clock)
+
+    asyncio.run(main())
+
+
+def test_slow_calls_count_as_failures(clock):
+    async def main():
+        breaker = create_breaker()
+
+        await call(breaker, clock, duration=2)
+        await call(breaker, clock, duration=2)
+
+        assert breaker.state == CircuitBreaker.open
+
+    asyncio.run(main())
+
+
+def test_other_errors_do_not_count_as_failures(clock):
+    async def main():
+        breaker = create_breaker()
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await call(breaker, clock, error=ValueError())
+
+        assert breaker.state == CircuitBreaker.closed
+
+    asyncio.run(main())
+
+
+def test_successful_probe_closes_circuit(clock):
+    async def main():
+        breaker = create_breaker()
+        await open_circuit(breaker, clock)
+
+        clock.now += 10
+        await call(breaker, clock)
+
+        assert breaker.state == CircuitBreaker.closed
+
+    asyncio.run(main())
+
+
+def test_failed_probe_opens_circuit_again(clock):
+    async def main():
+        breaker = create_breaker()
+        await open_circuit(breaker, clock)
+
+        clock.now += 10
+        await fail(breaker, clock)
+
+        assert breaker.state == CircuitBreaker.open
+        with pytest.raises(CircuitOpenException):
+            await call(breaker, clock)
+
+    asyncio.run(main())
+
+
+def test_half_open_circuit_lets_single_probe_through(clock):
+    async def main():
+        breaker = create_breaker()
+        await open_circuit(breaker, clock)
+        clock.now += 10
+        probe_started, probe_finish = asyncio.Event(), asyncio.Event()
+
+        async def probe():
+            async with breaker.guard():
+                probe_started.set()
+                await probe_finish.wait()
+
+        probe_task = asyncio.create_task(probe())
+        await probe_started.wait()
+        assert breaker.state == CircuitBreaker.half_open
+        with pytest.raises(CircuitOpenException):
+            await call(breaker, clock)
+
+        probe_finish.set()
+        await probe_task
+        assert breaker.state == CircuitBreaker.closed
+
+    asyncio.run(main())
+
+
+def test_cancelled_probe_frees_probe_slot(clock):
+    async def main():
+        breaker = create_breaker()
+        await open_circuit(breaker, clock)
+        clock.now += 10
+        probe_started = asyncio.Event()
+
+        async def probe():
+            async with breaker.guard():
+                probe_started.set()
+                await asyncio.Event().wait()
+
+        probe_task = asyncio.create_task(probe())
+        await probe_started.wait()
+        probe_task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe_task
+
+        # cancellation is neither failure nor success, the next call is the probe
+        assert breaker.state == CircuitBreaker.half_open
+        await call(breaker, clock)
+        assert breaker.state == CircuitBreaker.closed
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+import asyncio
+import time
+
+import pytest
+
+from app.utils.profiling import profile_loop_stacks
+
+
+def burn_cpu(duration: float):
+    """Keep the CPU busy for a short time."""
+    deadline = time.process_time() + duration
+    while time.process_time() < deadline:
+        pass
+
+
+async def run_short_cpu_callbacks(duration: float):
+    """Burn CPU in many short callbacks, yielding to the loop between them."""
+    deadline = time.monotonic() + duration
+    while time.monotonic() < deadline:
+        burn_cpu(0.001)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.parametrize("mode", ["wall", "cpu"])
+def test_cpu_bound_coroutine_is_sampled_as_busy(mode):
+    async def main():
+        load = asyncio.create_task(run_short_cpu_callbacks(1.0))
+        sampler = await profile_loop_stacks(duration=0.8, interval=0.005, mode=mode)
+        await load
+        return sampler
+
+    sampler = asyncio.run(main())
+
+    busy_samples = sum(count for stack, count in sampler.samples.items() if stack != (sampler.idle_label,))
+    cpu_bound_samples = sum(
+        count for stack, count in sampler.samples.items() if any("run_short_cpu_callbacks" in frame for frame in stack))
+    assert sampler.total_samples > 0
+    assert busy_samples > sampler.idle_samples
+    assert cpu_bound_samples > busy_samples / 2
+    assert "run_short_cpu_callbacks" in sampler.to_collapsed(include_idle=False)
+
+
+def test_idle_loop_is_sampled_as_idle():
+    sampler = asyncio.run(profile_loop_stacks(duration=0.3, interval=0.005, mode="wall"))
+
+    assert sampler.idle_samples > sampler.total_samples / 2